@@ -18,9 +18,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from math import pi, degrees, radians
+from math import pi, fmod
 
-from pymeeus.base import TOL
+from pymeeus.base import TOL, DEG2RAD, RAD2DEG
 
 
 """
@@ -81,8 +81,25 @@ class Angle(object):
         -13.5
         """
 
-        self._deg = 0.0  # Angle value is stored here in decimal format
         self._tol = TOL
+        # Fast paths for the most common cases: a single number in decimal
+        # format, or another Angle. Exact type checks are cheaper than the
+        # isinstance() tree in set(), which handles everything else
+        if len(args) == 1 and not kwargs:
+            deg = args[0]
+            arg_type = type(deg)
+            if arg_type is float or arg_type is int:
+                if -360.0 < deg < 360.0:
+                    # Angle value is stored here in decimal format
+                    self._deg = float(deg)
+                else:
+                    self._deg = Angle.reduce_deg(deg)
+                return
+            elif arg_type is Angle:  # Copy constructor
+                self._deg = deg._deg
+                self._tol = deg._tol
+                return
+        self._deg = 0.0
         self.set(*args, **kwargs)  # Let's use 'set()' method to set angle
 
     @staticmethod
@@ -103,11 +120,9 @@ class Angle(object):
         """
 
         if abs(deg) >= 360.0:
-            # Extract the sign
-            sign = 1.0 if deg >= 0 else -1.0
-            frac = abs(deg) % 1  # Separate the fractional part
-            deg = int(abs(deg)) % 360  # Reduce to [0:360) range
-            deg = sign * (deg + frac)  # Rebuild the value
+            # fmod() is exact and keeps the sign of the input, so the result
+            # is already in the +/-[0:360) range
+            deg = fmod(deg, 360.0)
         return float(deg)
 
     @staticmethod
@@ -170,14 +185,23 @@ class Angle(object):
         (23, 26, 48.999983999997596, 1.0)
         """
 
-        deg = Angle.reduce_deg(deg)  # Reduce the degrees to the [0:360) range
+        # Reduce the degrees to the [0:360) range
+        return Angle._split_dms(Angle.reduce_deg(deg))
+
+    @staticmethod
+    def _split_dms(deg):
+        """Auxiliary method that splits an angle, already reduced to the
+        +/-[0:360) range, into (Degrees, Minutes, Seconds, sign)."""
+
         # Extract the sign
         sign = 1.0 if deg >= 0 else -1.0
         # We have the sign, now let's work with positive numbers
         deg = abs(deg)
-        mi = (deg % 1) * 60.0  # Get the minutes, with decimals
+        # For positive values, subtracting the integer part gives exactly the
+        # same fractional part as '% 1', but it is cheaper
         de = int(deg)  # Get the integer part of the degrees
-        se = (mi % 1) * 60.0  # Get the seconds
+        mi = (deg - de) * 60.0  # Get the minutes, with decimals
+        se = (mi - int(mi)) * 60.0  # Get the seconds
         mi = int(mi)
         return (de, mi, se, sign)
 
@@ -199,6 +223,12 @@ class Angle(object):
         -23.44694444
         """
 
+        # Fast path: whole degrees and minutes, and values already in range.
+        # In this case reduce_dms() would not change anything but the sign
+        if (0 <= minutes < 60 and 0 <= seconds < 60 and -360 < degrees < 360
+                and degrees % 1 == 0 and minutes % 1 == 0):
+            sign = -1.0 if degrees < 0 else 1.0
+            return sign * (abs(degrees) + minutes / 60.0 + seconds / 3600.0)
         (de, mi, se, sign) = Angle.reduce_dms(degrees, minutes, seconds)
         deg = sign * (de + mi / 60.0 + se / 3600.0)
         return float(deg)
@@ -314,7 +344,7 @@ class Angle(object):
                 if "radians" in kwargs:
                     if kwargs["radians"]:
                         # Input value is in radians. Convert to degrees
-                        deg = degrees(deg)
+                        deg = deg * RAD2DEG
                 # This works for ints, floats and Angles
                 self._deg = Angle.reduce_deg(deg)
                 return
@@ -326,7 +356,7 @@ class Angle(object):
                     if "radians" in kwargs:
                         if kwargs["radians"]:
                             # Input value is in radians. Convert to degrees
-                            deg[0] = degrees(deg[0])
+                            deg[0] = deg[0] * RAD2DEG
                     self._deg = Angle.reduce_deg(deg[0])
                     return
                 elif len(deg) == 2:
@@ -446,17 +476,19 @@ class Angle(object):
 
         if not isinstance(n_dec, int):
             raise TypeError("Invalid input value")
-        d, m, s, sign = Angle.deg2dms(self._deg)
         if n_dec >= 0:
-            s = round(s, n_dec)
-            if abs(s - 60.0) < TOL:
-                s = 0.0
-                m += 1
-            if abs(m - 60.0) < TOL:
-                m = 0
-                d += 1.0
-            if d >= 360.0:
-                d -= 360.0
+            # Round the angle once as an integer number of units of the last
+            # decimal of the seconds, and let the integer divisions carry the
+            # seconds into the minutes and the minutes into the degrees
+            sign = 1.0 if self._deg >= 0 else -1.0
+            scale = 10 ** n_dec
+            total = int(round(abs(self._deg) * 3600.0 * scale))
+            m = total // 60 // scale
+            s = (total - m * 60 * scale) / float(scale)
+            d = m // 60 % 360
+            m %= 60
+        else:
+            d, m, s, sign = Angle._split_dms(self._deg)
         if fancy:
             if d != 0:
                 return "{}d {}' {}''".format(int(sign * d), m, s)
@@ -516,7 +548,9 @@ class Angle(object):
         2h 44' 11.986''
         """
 
-        a = Angle(self()) / 15.0
+        # The internal value is already reduced, so build the Angle in hours
+        # directly instead of going through a copy and a division
+        a = Angle(self._deg / 15.0)
         s = a.dms_str(fancy, n_dec)
         if fancy:
             s = s.replace("d", "h")
@@ -533,7 +567,7 @@ class Angle(object):
         0.83360416
         """
 
-        return radians(self._deg)
+        return self._deg * DEG2RAD
 
     def dms_tuple(self):
         """Returns the Angle as a tuple containing (degrees, minutes, seconds,
@@ -543,7 +577,8 @@ class Angle(object):
         :rtype: tuple
         """
 
-        return Angle.deg2dms(self())
+        # The internal value is always reduced, so skip that step
+        return Angle._split_dms(self._deg)
 
     def ra_tuple(self):
         """Returns the Angle in Right Ascension format as a tuple containing
@@ -553,7 +588,7 @@ class Angle(object):
         :rtype: tuple
         """
 
-        return Angle.deg2dms(self() / 15.0)
+        return Angle._split_dms(self._deg / 15.0)
 
     def to_positive(self):
         """Converts the internal angle value from negative to positive.
@@ -566,8 +601,10 @@ class Angle(object):
         272.68
         """
 
+        # Adding 360 gives exactly the same result as '360 - abs(value)', and
+        # the comparison is cheaper in Python than a branch-free floor()
         if self._deg < 0:
-            self._deg = 360.0 - abs(self._deg)
+            self._deg += 360.0
         return self
 
     def __eq__(self, b):
@@ -606,7 +643,13 @@ class Angle(object):
         True
         """
 
-        return not self.__eq__(b)  # '!=' == 'not(==)'
+        # '!=' == 'not(==)', written out to avoid an extra method call
+        if isinstance(b, (int, float)):
+            return not abs(self._deg - float(b)) < self._tol
+        elif isinstance(b, Angle):
+            return not abs(self._deg - b._deg) < self._tol
+        else:
+            raise TypeError("Wrong operand type")
 
     def __lt__(self, b):
         """This method defines the 'is less than' operator between Angles.
@@ -641,7 +684,13 @@ class Angle(object):
         True
         """
 
-        return not self.__lt__(b)  # '>=' == 'not(<)'
+        # '>=' == 'not(<)', written out to avoid an extra method call
+        if isinstance(b, (int, float)):
+            return not self._deg < float(b)
+        elif isinstance(b, Angle):
+            return not self._deg < b._deg
+        else:
+            raise TypeError("Wrong operand type")
 
     def __gt__(self, b):
         """This method defines the 'is greater than' operator between Angles.
@@ -676,7 +725,13 @@ class Angle(object):
         True
         """
 
-        return not self.__gt__(b)  # '<=' == 'not(>)'
+        # '<=' == 'not(>)', written out to avoid an extra method call
+        if isinstance(b, (int, float)):
+            return not self._deg > float(b)
+        elif isinstance(b, Angle):
+            return not self._deg > b._deg
+        else:
+            raise TypeError("Wrong operand type")
 
     def __neg__(self):
         """This method is used to obtain the negative version of this Angle.
@@ -717,14 +772,13 @@ class Angle(object):
         45.0
         """
 
+        if isinstance(b, Angle):
+            b = b._deg
+        elif not isinstance(b, (int, float)):
+            raise TypeError("Wrong operand type")
         # Negative values will be treated as if they were positive
         sign = 1.0 if self._deg >= 0.0 else -1.0
-        if isinstance(b, (int, float)):
-            return Angle(sign * (abs(self._deg) % b))
-        elif isinstance(b, Angle):
-            return Angle(sign * (abs(self._deg) % b._deg))
-        else:
-            raise TypeError("Wrong operand type")
+        return Angle(sign * (abs(self._deg) % b))
 
     def __add__(self, b):
         """This method defines the addition between Angles.
@@ -759,7 +813,12 @@ class Angle(object):
         15.2
         """
 
-        return self.__add__(-b)
+        if isinstance(b, (int, float)):
+            return Angle(self._deg - float(b))
+        elif isinstance(b, Angle):
+            return Angle(self._deg - b._deg)
+        else:
+            raise TypeError("Wrong operand type")
 
     def __mul__(self, b):
         """This method defines the multiplication between Angles.
@@ -829,12 +888,13 @@ class Angle(object):
         294.0625
         """
 
-        if isinstance(b, (int, float)):
-            return Angle(self._deg ** b)
-        elif isinstance(b, Angle):
-            return Angle(self._deg ** b._deg)
-        else:
+        # The float power operator is used directly: detecting small integer
+        # exponents to unroll them costs more than it saves
+        if isinstance(b, Angle):
+            b = b._deg
+        elif not isinstance(b, (int, float)):
             raise TypeError("Wrong operand type")
+        return Angle(self._deg ** b)
 
     def __imod__(self, b):
         """This method defines the accumulative module b of this Angle.
@@ -993,7 +1053,12 @@ class Angle(object):
         -1.0
         """
 
-        return -self.__sub__(b)  # b - a = -(a - b)
+        if isinstance(b, (int, float)):
+            return Angle(float(b) - self._deg)
+        elif isinstance(b, Angle):
+            return Angle(b._deg - self._deg)
+        else:
+            raise TypeError("Wrong operand type")
 
     def __rmul__(self, b):
         """This method defines multiplication between Angles by the right.
@@ -22,7 +22,7 @@ from math import (
     sqrt, sin, cos, tan, atan, atan2, asin, acos, radians, pi, copysign,
     degrees
 )
-from pymeeus.base import TOL, iint
+from pymeeus.base import TOL, DEG2RAD, RAD2DEG, iint
 from pymeeus.Angle import Angle
 from pymeeus.Epoch import Epoch, JDE2000
 from pymeeus.Interpolation import Interpolation
@@ -232,6 +232,21 @@ are in 0.0001''. In Meeus' book this is Table 22.A and can be found in pages
 145-146."""
 
 
+def _julian_centuries(jde):
+    """Auxiliary function returning the time elapsed from J2000.0 to the
+    provided JDE, in Julian centuries. It is the single place where this time
+    argument, used by many series in this module, is computed.
+
+    :param jde: Julian Ephemeris Day
+    :type jde: float
+
+    :returns: Julian centuries since J2000.0
+    :rtype: float
+    """
+
+    return (jde - 2451545.0) / 36525.0
+
+
 def mean_obliquity(*args, **kwargs):
     """This function computes the mean obliquity (epsilon0) at the provided
     date.
@@ -271,8 +286,9 @@ def mean_obliquity(*args, **kwargs):
     t = Epoch.check_input_date(*args, **kwargs)
     # Let's redefine u in units of 100 Julian centuries from Epoch J2000.0
     u = (t.jde() - 2451545.0) / 3652500.0
-    epsilon0 = Angle(23, 26, 21.448)
-    delta = u * (
+    # Evaluate the whole series in arcseconds, including the constant term
+    # 23d 26' 21.448", and build a single Angle from the result
+    epsilon0 = 84381.448 + u * (
         -4680.93
         + u
         * (
@@ -294,9 +310,7 @@ def mean_obliquity(*args, **kwargs):
             )
         )
     )
-    delta = Angle(0, 0, delta)
-    epsilon0 += delta
-    return epsilon0
+    return Angle(0, 0, epsilon0)
 
 
 def true_obliquity(*args, **kwargs):
@@ -340,6 +354,95 @@ def true_obliquity(*args, **kwargs):
     return epsilon0 + delta_epsilon
 
 
+_NUTATION_TERMS = [
+    tuple(k) + tuple(sc) + tuple(cc)
+    for k, sc, cc in zip(NUTATION_ARG_TABLE, NUTATION_SINE_COEF_TABLE,
+                         NUTATION_COSINE_COEF_TABLE)
+]
+"""Internal table merging, for each nutation term, the multipliers of the
+arguments and the coefficients of the sine and cosine series, so they can be
+unpacked in a single step"""
+
+_NUTATION_SINE_TERMS = [
+    tuple(k) + tuple(sc)
+    for k, sc in zip(NUTATION_ARG_TABLE, NUTATION_SINE_COEF_TABLE)
+][len(NUTATION_COSINE_COEF_TABLE):]
+"""Internal table with the nutation terms whose cosine coefficients are zero,
+and therefore only contribute to the nutation in longitude"""
+
+_NUTATION_CACHE = {}
+"""Internal cache with the nutation values of the most recently used JDEs"""
+
+_NUTATION_CACHE_SIZE = 256
+"""Maximum number of entries kept in the internal nutation cache"""
+
+
+def _nutation(jde):
+    """Auxiliary function that computes both the nutation in longitude (Delta
+    psi) and in obliquity (Delta epsilon) at the provided JDE.
+
+    Both series share the same arguments, so they are evaluated together.
+    Results are kept in an internal cache, because the same epoch is usually
+    requested several times (e.g., by :func:`true_obliquity` and
+    :func:`nutation_longitude` in the computation of apparent positions).
+
+    :param jde: Julian Ephemeris Day
+    :type jde: float
+
+    :returns: Delta psi and Delta epsilon, in arcseconds, inside a tuple
+    :rtype: tuple
+    """
+
+    if jde in _NUTATION_CACHE:
+        return _NUTATION_CACHE[jde]
+    # Let's redefine t in units of Julian centuries from Epoch J2000.0
+    t = _julian_centuries(jde)
+    # Let's compute the mean elongation of the Moon from the Sun. All these
+    # arguments are reduced to the [0:360) range, and kept as plain floats
+    d = 297.85036 + t * (445267.111480 + t * (-0.0019142 + t / 189474.0))
+    d %= 360.0
+    # Compute the mean anomaly of the Sun (from Earth)
+    m = 357.52772 + t * (35999.050340 + t * (-0.0001603 - t / 300000.0))
+    m %= 360.0
+    # Compute the mean anomaly of the Moon
+    mprime = 134.96298 + t * (477198.867398 + t * (0.0086972 + t / 56250.0))
+    mprime %= 360.0
+    # Now, let's compute the Moon's argument of latitude
+    f = 93.27191 + t * (483202.017538 + t * (-0.0036825 + t / 327270.0))
+    f %= 360.0
+    # And finally, the longitude of the ascending node of the Moon's mean
+    # orbit on the ecliptic, measured from the mean equinox of date
+    omega = 125.04452 + t * (-1934.136261 + t * (0.0020708 + t / 450000.0))
+    omega %= 360.0
+    # Convert the fundamental arguments to radians once, instead of
+    # converting each one of their combinations below
+    d *= DEG2RAD
+    m *= DEG2RAD
+    mprime *= DEG2RAD
+    f *= DEG2RAD
+    omega *= DEG2RAD
+    # Now is time of using the nutation tables. Each argument is a linear
+    # combination of the former values, computed directly with floats to
+    # avoid creating intermediate Angle objects. The sums are accumulated in
+    # the units of the tables (0.0001"), and scaled only once at the end
+    deltapsi = 0.0
+    deltaepsilon = 0.0
+    for kd, km, kmp, kf, ko, s0, s1, c0, c1 in _NUTATION_TERMS:
+        argument = kd * d + km * m + kmp * mprime + kf * f + ko * omega
+        deltapsi += (s0 + s1 * t) * sin(argument)
+        deltaepsilon += (c0 + c1 * t) * cos(argument)
+    for kd, km, kmp, kf, ko, s0, s1 in _NUTATION_SINE_TERMS:
+        argument = kd * d + km * m + kmp * mprime + kf * f + ko * omega
+        deltapsi += (s0 + s1 * t) * sin(argument)
+    deltapsi /= 10000.0
+    deltaepsilon /= 10000.0
+    # Keep the cache from growing without limit
+    if len(_NUTATION_CACHE) >= _NUTATION_CACHE_SIZE:
+        _NUTATION_CACHE.clear()
+    _NUTATION_CACHE[jde] = (deltapsi, deltaepsilon)
+    return (deltapsi, deltaepsilon)
+
+
 def nutation_longitude(*args, **kwargs):
     """This function computes the nutation in longitude (Delta psi) at the
     provided date.
@@ -379,39 +482,10 @@ def nutation_longitude(*args, **kwargs):
 
     # Get the Epoch object corresponding to input parameters
     t = Epoch.check_input_date(*args, **kwargs)
-    # Let's redefine t in units of Julian centuries from Epoch J2000.0
-    t = (t.jde() - 2451545.0) / 36525.0
-    # Let's compute the mean elongation of the Moon from the Sun
-    d = 297.85036 + t * (445267.111480 + t * (-0.0019142 + t / 189474.0))
-    d = Angle(d)  # Convert into an Angle: It is easier to handle
-    # Compute the mean anomaly of the Sun (from Earth)
-    m = 357.52772 + t * (35999.050340 + t * (-0.0001603 - t / 300000.0))
-    m = Angle(m)
-    # Compute the mean anomaly of the Moon
-    mprime = 134.96298 + t * (477198.867398 + t * (0.0086972 + t / 56250.0))
-    mprime = Angle(mprime)
-    # Now, let's compute the Moon's argument of latitude
-    f = 93.27191 + t * (483202.017538 + t * (-0.0036825 + t / 327270.0))
-    f = Angle(f)
-    # And finally, the longitude of the ascending node of the Moon's mean
-    # orbit on the ecliptic, measured from the mean equinox of date
-    omega = 125.04452 + t * (-1934.136261 + t * (0.0020708 + t / 450000.0))
-    omega = Angle(omega)
-    # Let's store this results in a list, in preparation for using tables
-    arguments = [d, m, mprime, f, omega]
-    # Now is time of using the nutation tables
-    deltapsi = 0.0
-    for i, value in enumerate(NUTATION_SINE_COEF_TABLE):
-        argument = Angle()
-        coeff = 0.0
-        for j in range(5):
-            if NUTATION_ARG_TABLE[i][j]:  # Avoid multiplications by zero
-                argument += NUTATION_ARG_TABLE[i][j] * arguments[j]
-        coeff = value[0]
-        if value[1]:
-            coeff += value[1] * t
-        deltapsi += (coeff * sin(argument.rad())) / 10000.0
-    return Angle(0, 0, deltapsi)
+    deltapsi = _nutation(t.jde())[0]
+    # Nutation is always well below 60 arcseconds, so dividing by 3600 gives
+    # the same value as the slower sexagesimal constructor
+    return Angle(deltapsi / 3600.0)
 
 
 def nutation_obliquity(*args, **kwargs):
@@ -454,39 +528,9 @@ def nutation_obliquity(*args, **kwargs):
 
     # Get the Epoch object corresponding to input parameters
     t = Epoch.check_input_date(*args, **kwargs)
-    # Let's redefine t in units of Julian centuries from Epoch J2000.0
-    t = (t.jde() - 2451545.0) / 36525.0
-    # Let's compute the mean elongation of the Moon from the Sun
-    d = 297.85036 + t * (445267.111480 + t * (-0.0019142 + t / 189474.0))
-    d = Angle(d)  # Convert into an Angle: It is easier to handle
-    # Compute the mean anomaly of the Sun (from Earth)
-    m = 357.52772 + t * (35999.050340 + t * (-0.0001603 - t / 300000.0))
-    m = Angle(m)
-    # Compute the mean anomaly of the Moon
-    mprime = 134.96298 + t * (477198.867398 + t * (0.0086972 + t / 56250.0))
-    mprime = Angle(mprime)
-    # Now, let's compute the Moon's argument of latitude
-    f = 93.27191 + t * (483202.017538 + t * (-0.0036825 + t / 327270.0))
-    f = Angle(f)
-    # And finally, the longitude of the ascending node of the Moon's mean
-    # orbit on the ecliptic, measured from the mean equinox of date
-    omega = 125.04452 + t * (-1934.136261 + t * (0.0020708 + t / 450000.0))
-    omega = Angle(omega)
-    # Let's store this results in a list, in preparation for using tables
-    arguments = [d, m, mprime, f, omega]
-    # Now is time of using the nutation tables
-    deltaepsilon = 0.0
-    for i, value in enumerate(NUTATION_COSINE_COEF_TABLE):
-        argument = Angle()
-        coeff = 0.0
-        for j in range(5):
-            if NUTATION_ARG_TABLE[i][j]:  # Avoid multiplications by zero
-                argument += NUTATION_ARG_TABLE[i][j] * arguments[j]
-        coeff = value[0]
-        if value[1]:
-            coeff += value[1] * t
-        deltaepsilon += (coeff * cos(argument.rad())) / 10000.0
-    return Angle(0, 0, deltaepsilon)
+    deltaepsilon = _nutation(t.jde())[1]
+    # As in nutation_longitude(), build the Angle directly from the degrees
+    return Angle(deltaepsilon / 3600.0)
 
 
 def precession_equatorial(
@@ -549,45 +593,52 @@ def precession_equatorial(
     if not (isinstance(p_motion_ra, Angle)
             and isinstance(p_motion_dec, Angle)):
         raise TypeError("Invalid input types")
-    tt = (start_epoch - JDE2000) / 36525.0
+    tt = _julian_centuries(start_epoch.jde())
     t = (final_epoch - start_epoch) / 36525.0
-    # Correct starting coordinates by proper motion
-    start_ra += p_motion_ra * t * 100.0
-    start_dec += p_motion_dec * t * 100.0
+    # Correct starting coordinates by proper motion, and convert them to
+    # radians only once
+    dec_deg = start_dec() + p_motion_dec() * t * 100.0
+    ra = radians(start_ra() + p_motion_ra() * t * 100.0)
+    dec = radians(dec_deg)
     # Compute the conversion parameters
-    zeta = t * (
-        (2306.2181 + tt * (1.39656 - 0.000139 * tt))
-        + t * ((0.30188 - 0.000344 * tt) + 0.017998 * t)
-    )
-    z = t * (
-        (2306.2181 + tt * (1.39656 - 0.000139 * tt))
-        + t * ((1.09468 + 0.000066 * tt) + 0.018203 * t)
-    )
-    theta = t * (
-        2004.3109
-        + tt * (-0.85330 - 0.000217 * tt)
-        + t * (-(0.42665 + 0.000217 * tt) - 0.041833 * t)
-    )
-    # Redefine the former values as Angles
-    zeta = Angle(0, 0, zeta)
-    z = Angle(0, 0, z)
-    theta = Angle(0, 0, theta)
-    a = cos(start_dec.rad()) * sin(start_ra.rad() + zeta.rad())
-    b = cos(theta.rad()) * cos(start_dec.rad()) * cos(
-        start_ra.rad() + zeta.rad()
-    ) - sin(theta.rad()) * sin(start_dec.rad())
-    c = sin(theta.rad()) * cos(start_dec.rad()) * cos(
-        start_ra.rad() + zeta.rad()
-    ) + cos(theta.rad()) * sin(start_dec.rad())
-    final_ra = atan2(a, b) + z.rad()
-    if start_dec > 85.0:  # Coordinates are close to the pole
+    if tt == 0.0:
+        # Starting from J2000.0, which is the usual case, the terms depending
+        # on tt vanish and the parameters are plain cubics in t
+        zeta = t * (2306.2181 + t * (0.30188 + 0.017998 * t))
+        z = t * (2306.2181 + t * (1.09468 + 0.018203 * t))
+        theta = t * (2004.3109 + t * (-0.42665 - 0.041833 * t))
+    else:
+        # The linear coefficient is common to both zeta and z
+        k1 = 2306.2181 + tt * (1.39656 - 0.000139 * tt)
+        zeta = t * (k1 + t * ((0.30188 - 0.000344 * tt) + 0.017998 * t))
+        z = t * (k1 + t * ((1.09468 + 0.000066 * tt) + 0.018203 * t))
+        theta = t * (
+            2004.3109
+            + tt * (-0.85330 - 0.000217 * tt)
+            + t * (-(0.42665 + 0.000217 * tt) - 0.041833 * t)
+        )
+    # Convert the former values from arcseconds to radians
+    zeta = radians(zeta / 3600.0)
+    z = radians(z / 3600.0)
+    theta = radians(theta / 3600.0)
+    # Compute each trigonometric function only once
+    ra_zeta = ra + zeta
+    sin_ra_zeta = sin(ra_zeta)
+    cos_ra_zeta = cos(ra_zeta)
+    sin_dec = sin(dec)
+    cos_dec = cos(dec)
+    sin_theta = sin(theta)
+    cos_theta = cos(theta)
+    a = cos_dec * sin_ra_zeta
+    b = cos_theta * cos_dec * cos_ra_zeta - sin_theta * sin_dec
+    c = sin_theta * cos_dec * cos_ra_zeta + cos_theta * sin_dec
+    final_ra = atan2(a, b) + z
+    if dec_deg > 85.0:  # Coordinates are close to the pole
         final_dec = sqrt(a * a + b * b)
     else:
         final_dec = asin(c)
     # Convert results to Angles. Please note results are in radians
-    final_ra = Angle(final_ra, radians=True)
-    final_dec = Angle(final_dec, radians=True)
-    return (final_ra, final_dec)
+    return (Angle(final_ra * RAD2DEG), Angle(final_dec * RAD2DEG))
 
 
 def precession_ecliptical(
@@ -647,11 +698,12 @@ def precession_ecliptical(
     if not (isinstance(p_motion_lon, Angle)
             and isinstance(p_motion_lat, Angle)):
         raise TypeError("Invalid input types")
-    tt = (start_epoch - JDE2000) / 36525.0
+    tt = _julian_centuries(start_epoch.jde())
     t = (final_epoch - start_epoch) / 36525.0
-    # Correct starting coordinates by proper motion
-    start_lon += p_motion_lon * t * 100.0
-    start_lat += p_motion_lat * t * 100.0
+    # Correct starting coordinates by proper motion, and convert them to
+    # radians only once
+    lon = radians(start_lon() + p_motion_lon() * t * 100.0)
+    lat = radians(start_lat() + p_motion_lat() * t * 100.0)
     # Compute the conversion parameters
     eta = t * (
         (47.0029 + tt * (-0.06603 + 0.000598 * tt))
@@ -663,22 +715,26 @@ def precession_ecliptical(
     p = t * (
         5029.0966
         + tt * (2.22226 - 0.000042 * tt)
-        + t * (1.11113 - 0.000042 * tt - 0.000006 * t)
+        + t * ((1.11113 - 0.000042 * tt) - 0.000006 * t)
     )
-    eta = Angle(0, 0, eta)
-    pie = Angle(0, 0, pie)
-    p = Angle(0, 0, p)
-    # But beware!: There is still a missing constant for pie. We didn't add
-    # it before because of the mismatch between degrees and seconds
-    pie += 174.876384
-    a = (cos(eta.rad()) * cos(start_lat.rad())
-         * sin(pie.rad() - start_lon.rad()) - sin(eta.rad())
-         * sin(start_lat.rad()))
-    b = cos(start_lat.rad()) * cos(pie.rad() - start_lon.rad())
-    c = cos(eta.rad()) * sin(start_lat.rad()) + sin(eta.rad()) * cos(
-        start_lat.rad()
-    ) * sin(pie.rad() - start_lon.rad())
-    final_lon = p.rad() + pie.rad() - atan2(a, b)
+    # Convert the parameters from arcseconds to radians. But beware!: There
+    # is still a missing constant for pie. We didn't add it before because
+    # of the mismatch between degrees and seconds
+    eta = radians(eta / 3600.0)
+    pie = radians(pie / 3600.0 + 174.876384)
+    p = radians(p / 3600.0)
+    # Compute each trigonometric function only once
+    pie_lon = pie - lon
+    sin_pie_lon = sin(pie_lon)
+    cos_pie_lon = cos(pie_lon)
+    sin_lat = sin(lat)
+    cos_lat = cos(lat)
+    sin_eta = sin(eta)
+    cos_eta = cos(eta)
+    a = cos_eta * cos_lat * sin_pie_lon - sin_eta * sin_lat
+    b = cos_lat * cos_pie_lon
+    c = cos_eta * sin_lat + sin_eta * cos_lat * sin_pie_lon
+    final_lon = p + pie - atan2(a, b)
     final_lat = asin(c)
     # Convert results to Angles. Please note results are in radians
     final_lon = Angle(final_lon, radians=True)
@@ -794,35 +850,39 @@ def precession_newcomb(
     if not (isinstance(p_motion_ra, Angle)
             and isinstance(p_motion_dec, Angle)):
         raise TypeError("Invalid input types")
-    tt = (start_epoch - 2415020.3135) / 36524.2199
+    tt = (start_epoch.jde() - 2415020.3135) / 36524.2199
     t = (final_epoch - start_epoch) / 36524.2199
-    # Correct starting coordinates by proper motion
-    start_ra += p_motion_ra * t * 100.0
-    start_dec += p_motion_dec * t * 100.0
+    # Correct starting coordinates by proper motion, and convert them to
+    # radians only once
+    dec_deg = start_dec() + p_motion_dec() * t * 100.0
+    ra = radians(start_ra() + p_motion_ra() * t * 100.0)
+    dec = radians(dec_deg)
     # Compute the conversion parameters
     zeta = t * (2304.25 + 1.396 * tt + t * (0.302 + 0.018 * t))
     z = zeta + t * t * (0.791 + 0.001 * t)
     theta = t * (2004.682 - 0.853 * tt - t * (0.426 + 0.042 * t))
-    # Redefine the former values as Angles
-    zeta = Angle(0, 0, zeta)
-    z = Angle(0, 0, z)
-    theta = Angle(0, 0, theta)
-    a = cos(start_dec.rad()) * sin(start_ra.rad() + zeta.rad())
-    b = cos(theta.rad()) * cos(start_dec.rad()) * cos(
-        start_ra.rad() + zeta.rad()
-    ) - sin(theta.rad()) * sin(start_dec.rad())
-    c = sin(theta.rad()) * cos(start_dec.rad()) * cos(
-        start_ra.rad() + zeta.rad()
-    ) + cos(theta.rad()) * sin(start_dec.rad())
-    final_ra = atan2(a, b) + z.rad()
-    if start_dec > 85.0:  # Coordinates are close to the pole
+    # Convert the former values from arcseconds to radians
+    zeta = radians(zeta / 3600.0)
+    z = radians(z / 3600.0)
+    theta = radians(theta / 3600.0)
+    # Compute each trigonometric function only once
+    ra_zeta = ra + zeta
+    sin_ra_zeta = sin(ra_zeta)
+    cos_ra_zeta = cos(ra_zeta)
+    sin_dec = sin(dec)
+    cos_dec = cos(dec)
+    sin_theta = sin(theta)
+    cos_theta = cos(theta)
+    a = cos_dec * sin_ra_zeta
+    b = cos_theta * cos_dec * cos_ra_zeta - sin_theta * sin_dec
+    c = sin_theta * cos_dec * cos_ra_zeta + cos_theta * sin_dec
+    final_ra = atan2(a, b) + z
+    if dec_deg > 85.0:  # Coordinates are close to the pole
         final_dec = sqrt(a * a + b * b)
     else:
         final_dec = asin(c)
     # Convert results to Angles. Please note results are in radians
-    final_ra = Angle(final_ra, radians=True)
-    final_dec = Angle(final_dec, radians=True)
-    return (final_ra, final_dec)
+    return (Angle(final_ra * RAD2DEG), Angle(final_dec * RAD2DEG))
 
 
 def motion_in_space(
@@ -848,13 +908,15 @@ def motion_in_space(
     :param p_motion_dec: Proper motion in declination, in degrees per year.
     :type p_motion_dec: :py:class:`Angle`
     :param time: Number of years since starting epoch, positive in the
-        future, negative in the past
-    :type time: float
+        future, negative in the past. A list or tuple of values may be given
+        to compute several epochs at once
+    :type time: float, list, tuple
 
     :returns: Equatorial coordinates (right ascension, declination, in that
         order) corresponding to the final epoch, given as two objects
-        :class:`Angle` inside a tuple
-    :rtype: tuple
+        :class:`Angle` inside a tuple. If **time** is a list or tuple, a list
+        of such tuples is returned, one per element of **time**
+    :rtype: tuple, list
     :raises: TypeError if input values are of wrong type.
 
     >>> ra = Angle(6, 45, 8.871, ra=True)
@@ -875,6 +937,10 @@ def motion_in_space(
     6:47:39.91
     >>> print(delta.dms_str(False, 1))
     -15:23:30.6
+    >>> positions = motion_in_space(ra, dec, dist, vel, pm_ra, pm_dec,
+    ...                             [-1000.0, -4000.0])
+    >>> print(positions[1][0].ra_str(False, 2))
+    6:47:39.91
     """
     # >>> ra = Angle(101.286962)
 
@@ -888,37 +954,47 @@ def motion_in_space(
     if not (isinstance(p_motion_ra, Angle)
             and isinstance(p_motion_dec, Angle)):
         raise TypeError("Invalid input types")
+    if isinstance(time, (list, tuple)):
+        times = time
+    else:
+        times = [time]
     if not (
         isinstance(distance, (int, float))
         and isinstance(velocity, (int, float))
-        and isinstance(time, (int, float))
+        and all(isinstance(ti, (int, float)) for ti in times)
     ):
         raise TypeError("Invalid input types")
+    # The position and velocity of the star do not depend on time, so they
+    # are computed only once, even if several epochs are requested
+    ra = start_ra.rad()
+    dec = start_dec.rad()
+    pm_ra = p_motion_ra.rad()
+    pm_dec = p_motion_dec.rad()
+    cos_ra = cos(ra)
+    sin_ra = sin(ra)
+    cos_dec = cos(dec)
+    sin_dec = sin(dec)
     dr = velocity / 977792.0
-    x = distance * cos(start_dec.rad()) * cos(start_ra.rad())
-    y = distance * cos(start_dec.rad()) * sin(start_ra.rad())
-    z = distance * sin(start_dec.rad())
-    dx = (
-        (x / distance) * dr
-        - z * p_motion_dec.rad() * cos(start_ra.rad())
-        - y * p_motion_ra.rad()
-    )
-    dy = (
-        (y / distance) * dr
-        - z * p_motion_dec.rad() * sin(start_ra.rad())
-        + x * p_motion_ra.rad()
-    )
-    dz = ((z / distance) * dr + distance
-          * p_motion_dec.rad() * cos(start_dec.rad()))
-    xp = x + time * dx
-    yp = y + time * dy
-    zp = z + time * dz
-    final_ra = atan2(yp, xp)
-    final_dec = atan(zp / sqrt(xp * xp + yp * yp))
-    # Convert results to Angles. Please note results are in radians
-    final_ra = Angle(final_ra, radians=True)
-    final_dec = Angle(final_dec, radians=True)
-    return (final_ra, final_dec)
+    x = distance * cos_dec * cos_ra
+    y = distance * cos_dec * sin_ra
+    z = distance * sin_dec
+    dx = (x / distance) * dr - z * pm_dec * cos_ra - y * pm_ra
+    dy = (y / distance) * dr - z * pm_dec * sin_ra + x * pm_ra
+    dz = (z / distance) * dr + distance * pm_dec * cos_dec
+    positions = []
+    for ti in times:
+        xp = x + ti * dx
+        yp = y + ti * dy
+        zp = z + ti * dz
+        final_ra = atan2(yp, xp)
+        final_dec = atan(zp / sqrt(xp * xp + yp * yp))
+        # Convert results to Angles. Please note results are in radians, and
+        # converting them here lets Angle take its fast single-value path
+        positions.append((Angle(final_ra * RAD2DEG),
+                          Angle(final_dec * RAD2DEG)))
+    if isinstance(time, (list, tuple)):
+        return positions
+    return positions[0]
 
 
 def equatorial2ecliptical(right_ascension, declination, obliquity):
@@ -957,8 +1033,12 @@ def equatorial2ecliptical(right_ascension, declination, obliquity):
     ra = right_ascension.rad()
     dec = declination.rad()
     eps = obliquity.rad()
-    lon = atan2((sin(ra) * cos(eps) + tan(dec) * sin(eps)), cos(ra))
-    lat = asin(sin(dec) * cos(eps) - cos(dec) * sin(eps) * sin(ra))
+    sin_ra = sin(ra)
+    cos_ra = cos(ra)
+    sin_eps = sin(eps)
+    cos_eps = cos(eps)
+    lon = atan2((sin_ra * cos_eps + tan(dec) * sin_eps), cos_ra)
+    lat = asin(sin(dec) * cos_eps - cos(dec) * sin_eps * sin_ra)
     lon = Angle(lon, radians=True)
     lon = lon.to_positive()
     lat = Angle(lat, radians=True)
@@ -1001,8 +1081,12 @@ def ecliptical2equatorial(longitude, latitude, obliquity):
     lon = longitude.rad()
     lat = latitude.rad()
     eps = obliquity.rad()
-    ra = atan2((sin(lon) * cos(eps) - tan(lat) * sin(eps)), cos(lon))
-    dec = asin(sin(lat) * cos(eps) + cos(lat) * sin(eps) * sin(lon))
+    sin_lon = sin(lon)
+    cos_lon = cos(lon)
+    sin_eps = sin(eps)
+    cos_eps = cos(eps)
+    ra = atan2((sin_lon * cos_eps - tan(lat) * sin_eps), cos_lon)
+    dec = asin(sin(lat) * cos_eps + cos(lat) * sin_eps * sin_lon)
     ra = Angle(ra, radians=True)
     ra = ra.to_positive()
     dec = Angle(dec, radians=True)
@@ -1064,8 +1148,11 @@ def equatorial2horizontal(hour_angle, declination, geo_latitude):
     h = hour_angle.rad()
     dec = declination.rad()
     lat = geo_latitude.rad()
-    azi = atan2(sin(h), (cos(h) * sin(lat) - tan(dec) * cos(lat)))
-    ele = asin(sin(lat) * sin(dec) + cos(lat) * cos(dec) * cos(h))
+    cos_h = cos(h)
+    sin_lat = sin(lat)
+    cos_lat = cos(lat)
+    azi = atan2(sin(h), (cos_h * sin_lat - tan(dec) * cos_lat))
+    ele = asin(sin_lat * sin(dec) + cos_lat * cos(dec) * cos_h)
     azi = Angle(azi, radians=True)
     ele = Angle(ele, radians=True)
     return (azi, ele)
@@ -1120,13 +1207,30 @@ def horizontal2equatorial(azimuth, elevation, geo_latitude):
     azi = azimuth.rad()
     ele = elevation.rad()
     lat = geo_latitude.rad()
-    h = atan2(sin(azi), (cos(azi) * sin(lat) + tan(ele) * cos(lat)))
-    dec = asin(sin(lat) * sin(ele) - cos(lat) * cos(ele) * cos(azi))
+    cos_azi = cos(azi)
+    sin_lat = sin(lat)
+    cos_lat = cos(lat)
+    h = atan2(sin(azi), (cos_azi * sin_lat + tan(ele) * cos_lat))
+    dec = asin(sin_lat * sin(ele) - cos_lat * cos(ele) * cos_azi)
     h = Angle(h, radians=True)
     dec = Angle(dec, radians=True)
     return (h, dec)
 
 
+_GALACTIC_POLE_RA = 192.25 * DEG2RAD
+"""Right ascension of the northern galactic pole (B1950.0), in radians"""
+
+_SIN_GALACTIC_POLE_DEC = sin(27.4 * DEG2RAD)
+"""Sine of the declination of the northern galactic pole (B1950.0)"""
+
+_COS_GALACTIC_POLE_DEC = cos(27.4 * DEG2RAD)
+"""Cosine of the declination of the northern galactic pole (B1950.0)"""
+
+_GALACTIC_NODE_LON = 123.0 * DEG2RAD
+"""Galactic longitude of the ascending node of the galactic plane on the
+equator (B1950.0), in radians"""
+
+
 def equatorial2galactic(right_ascension, declination):
     """This function converts from equatorial coordinates (right ascension and
     declination) to galactic coordinates (longitude and latitude).
@@ -1160,16 +1264,15 @@ def equatorial2galactic(right_ascension, declination):
         raise TypeError("Invalid input types")
     ra = right_ascension.rad()
     dec = declination.rad()
-    c1 = Angle(192.25)
-    c1 = c1.rad()
-    c1ra = c1 - ra
-    c2 = Angle(27.4)
-    c2 = c2.rad()
-    x = atan2(sin(c1ra), (cos(c1ra) * sin(c2) - tan(dec) * cos(c2)))
+    c1ra = _GALACTIC_POLE_RA - ra
+    cos_c1ra = cos(c1ra)
+    sin_c2 = _SIN_GALACTIC_POLE_DEC
+    cos_c2 = _COS_GALACTIC_POLE_DEC
+    x = atan2(sin(c1ra), (cos_c1ra * sin_c2 - tan(dec) * cos_c2))
     lon = Angle(-x, radians=True)
     lon = 303.0 + lon
     lon = lon.to_positive()
-    lat = asin(sin(dec) * sin(c2) + cos(dec) * cos(c2) * cos(c1ra))
+    lat = asin(sin(dec) * sin_c2 + cos(dec) * cos_c2 * cos_c1ra)
     lat = Angle(lat, radians=True)
     return (lon, lat)
 
@@ -1206,16 +1309,15 @@ def galactic2equatorial(longitude, latitude):
         raise TypeError("Invalid input types")
     lon = longitude.rad()
     lat = latitude.rad()
-    c1 = Angle(123.0)
-    c1 = c1.rad()
-    c2 = Angle(27.4)
-    c2 = c2.rad()
-    lc1 = lon - c1
-    y = atan2(sin(lc1), (cos(lc1) * sin(c2) - tan(lat) * cos(c2)))
+    lc1 = lon - _GALACTIC_NODE_LON
+    cos_lc1 = cos(lc1)
+    sin_c2 = _SIN_GALACTIC_POLE_DEC
+    cos_c2 = _COS_GALACTIC_POLE_DEC
+    y = atan2(sin(lc1), (cos_lc1 * sin_c2 - tan(lat) * cos_c2))
     y = Angle(y, radians=True)
     ra = y + 12.25
     ra.to_positive()
-    dec = asin(sin(lat) * sin(c2) + cos(lat) * cos(c2) * cos(lc1))
+    dec = asin(sin(lat) * sin_c2 + cos(lat) * cos_c2 * cos_lc1)
     dec = Angle(dec, radians=True)
     return (ra, dec)
 
@@ -1316,8 +1418,11 @@ def ecliptic_horizon(local_sidereal_time, geo_latitude, obliquity):
     theta = local_sidereal_time.rad()
     lat = geo_latitude.rad()
     eps = obliquity.rad()
+    sin_theta = sin(theta)
+    sin_eps = sin(eps)
+    cos_eps = cos(eps)
     # First, let's compute the longitudes of the ecliptic points on the horizon
-    lon1 = atan2(-cos(theta), (sin(eps) * tan(lat) + cos(eps) * sin(theta)))
+    lon1 = atan2(-cos(theta), (sin_eps * tan(lat) + cos_eps * sin_theta))
     lon1 = Angle(lon1, radians=True)
     lon1.to_positive()
     # Get the second point, which is 180 degrees apart
@@ -1327,7 +1432,7 @@ def ecliptic_horizon(local_sidereal_time, geo_latitude, obliquity):
         lon2 = lon1
         lon1 = lon2 - 180.0
     # Now, compute the angle between the ecliptic and the horizon
-    i = acos(cos(eps) * sin(lat) - sin(eps) * cos(lat) * sin(theta))
+    i = acos(cos_eps * sin(lat) - sin_eps * cos(lat) * sin_theta)
     i = Angle(i, radians=True)
     return (lon1, lon2, i)
 
@@ -1406,9 +1511,10 @@ def diurnal_path_horizon(declination, geo_latitude):
         raise TypeError("Invalid input types")
     dec = declination.rad()
     lat = geo_latitude.rad()
-    b = tan(dec) * tan(lat)
+    tan_lat = tan(lat)
+    b = tan(dec) * tan_lat
     c = sqrt(1.0 - b * b)
-    j = atan2(c * cos(dec), tan(lat))
+    j = atan2(c * cos(dec), tan_lat)
     j = Angle(j, radians=True)
     return j
 
@@ -1510,19 +1616,27 @@ def times_rise_transit_set(
                 m -= 1
         return m
 
-    def interpol(n, y1, y2, y3):
-        """This is formula 3.3 from Meeus book, but adapted to avoid bugs
-        caused by not converting the Angle() objetcs to floats before
+    def differences(y1, y2, y3):
+        """This prepares formula 3.3 from Meeus book, but adapted to avoid
+        bugs caused by not converting the Angle() objetcs to floats before
         the interpolation. Fix provided by janbredenbeek:
-        https://github.com/janbredenbeek """
+        https://github.com/janbredenbeek
+
+        It returns the sum of the first differences and the second
+        difference. They don't depend on the interpolating factor, so they
+        are computed only once for each quantity."""
         # Convert to float to avoid reducing to 0..360
         a = y2() - y1()
         b = y3() - y2()
         # Reduce values to -180..+180
         a = a - 360.0 * round(a / 360.0)
         b = b - 360.0 * round(b / 360.0)
-        c = b - a
-        return y2 + n * (a + b + n * c) / 2.0
+        return a + b, b - a
+
+    def interpol(n, y2, ab, c):
+        """This is formula 3.3 from Meeus book, using the differences given
+        by differences()"""
+        return y2 + n * (ab + n * c) / 2.0
 
     # First check that input values are of correct types
     if not (
@@ -1558,17 +1672,19 @@ def times_rise_transit_set(
     m0 = check_value(m0)
     m1 = check_value(m1)
     m2 = check_value(m2)
+    alpha_ab, alpha_c = differences(alpha1, alpha2, alpha3)
+    delta_ab, delta_c = differences(delta1, delta2, delta3)
     # Carry out this procedure twice
     for _ in range(2):
         # Interpolate alpha and delta values for each (m0, m1, m2)
         n = m0 + delta_t / 86400.0
-        transit_alpha = interpol(n, alpha1, alpha2, alpha3)
+        transit_alpha = interpol(n, alpha2, alpha_ab, alpha_c)
         n = m1 + delta_t / 86400.0
-        rise_alpha = interpol(n, alpha1, alpha2, alpha3)
-        rise_delta = interpol(n, delta1, delta2, delta3)
+        rise_alpha = interpol(n, alpha2, alpha_ab, alpha_c)
+        rise_delta = interpol(n, delta2, delta_ab, delta_c)
         n = m2 + delta_t / 86400.0
-        set_alpha = interpol(n, alpha1, alpha2, alpha3)
-        set_delta = interpol(n, delta1, delta2, delta3)
+        set_alpha = interpol(n, alpha2, alpha_ab, alpha_c)
+        set_delta = interpol(n, delta2, delta_ab, delta_c)
         # Compute the hour angles
         theta = theta0 + 360.985647 * m0
         transit_ha = theta - longitude - transit_alpha
@@ -2061,16 +2177,17 @@ def planetary_conjunction(alpha1_list, delta1_list, alpha2_list, delta2_list):
     # Compute the list with the time ('n') entries
     n_list = [i - half_entries for i in range(n_entries)]
     # Compute lists with differences between right ascensions and declinations
-    # for objects #1 and #2
-    dalpha = [alpha1_list[i] - alpha2_list[i] for i in range(n_entries)]
-    ddelta = [delta1_list[i] - delta2_list[i] for i in range(n_entries)]
+    # for objects #1 and #2. They are interpolated as plain floats, because
+    # the arithmetic inside Interpolation is much cheaper than with Angles
+    dalpha = [(alpha1_list[i] - alpha2_list[i])() for i in range(n_entries)]
+    ddelta = [(delta1_list[i] - delta2_list[i])() for i in range(n_entries)]
     # Build the interpolation objects
     i_alpha = Interpolation(n_list, dalpha)
     i_delta = Interpolation(n_list, ddelta)
     # Find when the dalphas are 0 (i.e., the 'root')
     n_0 = i_alpha.root()
     # Now, let's find the declination difference with the newly found 'n_0'
-    dd = i_delta(n_0)
+    dd = Angle(i_delta(n_0))
     # We are done, let's return
     return n_0, dd
 
@@ -2429,10 +2546,169 @@ def circle_diameter(alpha1, delta1, alpha2, delta2, alpha3, delta3):
     return Angle(d)
 
 
+def _vsop_series(table, t):
+    """Auxiliary function that evaluates one of the coordinates given by a
+    table of VSOP87 terms.
+
+    Each series of the table is the sum of terms A*cos(B + C*t), and the
+    results of the series are then combined as a polynomial in 't'.
+
+    :param table: Table of VSOP87 terms for one coordinate
+    :type table: list, tuple
+    :param t: Time, in Julian millennia from Epoch J2000.0
+    :type t: float
+
+    :returns: The value of the coordinate (radians or astronomical units)
+    :rtype: float
+
+    .. note:: The cost is dominated by the interpreter overhead of each term,
+       so several alternatives were measured and found not to pay off:
+       fusing the series in a single flat loop, sharing the trigonometric
+       values of terms with the same frequency, keeping a table with the
+       powers of 't' instead of Horner's scheme, reducing the arguments to
+       [0, 2*pi) with 'fmod()' (they stay far below the range where 'cos()'
+       needs its slow argument reduction), generating straight-line code for
+       each table with 'exec()' (compiling takes longer than a hundred
+       evaluations), and evaluating many epochs at once with the terms in the
+       outer loop.
+    """
+
+    result = 0.0
+    # Go from the highest power of 't' down to the first series, which is NOT
+    # multiplied by 't' (Horner's scheme)
+    for series in reversed(table):
+        s = 0.0
+        for a, b, c in series:
+            s += a * cos(b + c * t)
+        result = result * t + s
+    return result / 1e8
+
+
+_VSOP_TRUNCATION = 0.0
+"""Amplitude, in radians or astronomical units, below which the terms of the
+VSOP87 series are skipped. Zero means that all the terms are used"""
+
+_VSOP_PACKED = {}
+"""Internal table with the VSOP87 tables already packed by :func:`_vsop_pack`,
+keyed by the identity of the original table. Each entry also keeps the
+original table, so that identity can't be reused while the entry exists"""
+
+_VSOP_PACKED_SIZE = 64
+"""Maximum number of packed tables kept. It is well above the number of
+VSOP87 tables included in the library, so those are only packed once"""
+
+
+def _vsop_pack(table):
+    """Auxiliary function that returns a packed copy of a table of VSOP87
+    terms, where the series and their terms are tuples instead of lists.
+
+    Tuples are faster to iterate and unpack than lists, and the copy is built
+    only once per table. Packing happens on first use instead of at import
+    time, so importing a module with VSOP87 tables stays cheap, and the first
+    position computed only pays a fraction of a millisecond more.
+
+    Terms whose amplitude is below the value set with
+    :func:`set_vsop_truncation` are left out of the copy.
+
+    .. note:: Changes made to a table after it was first packed are not seen,
+        because the packed copy is reused.
+
+    :param table: Table of VSOP87 terms for one coordinate
+    :type table: list
+
+    :returns: The same table, as nested tuples
+    :rtype: tuple
+    """
+
+    entry = _VSOP_PACKED.get(id(table))
+    if entry is None:
+        # Amplitudes in the tables are given in units of 1e-8
+        amplitude = _VSOP_TRUNCATION * 1e8
+        packed = tuple(tuple(tuple(term) for term in series
+                             if abs(term[0]) >= amplitude)
+                       for series in table)
+        # Keep the table from growing without limit
+        if len(_VSOP_PACKED) >= _VSOP_PACKED_SIZE:
+            _VSOP_PACKED.clear()
+        entry = (table, packed)
+        _VSOP_PACKED[id(table)] = entry
+    return entry[1]
+
+
+_VSOP_CACHE = {}
+"""Internal cache with the VSOP87 positions most recently computed. Keys are
+the JDE and the identities of the tables, and each entry also keeps the tables
+themselves, so those identities can't be reused while the entry exists"""
+
+_VSOP_CACHE_SIZE = 256
+"""Maximum number of entries kept in the internal VSOP87 positions cache"""
+
+
+def set_vsop_truncation(threshold=0.0):
+    """This function sets the amplitude below which the terms of the VSOP87
+    series are skipped when computing positions. Skipping the smallest terms
+    makes the computations faster, at the cost of some accuracy.
+
+    The error introduced is roughly the threshold times the square root of the
+    number of terms skipped, so a threshold of 1e-8 (about 0.002 arcseconds
+    in longitude and latitude) keeps around one third of the terms of the
+    Earth, while the error stays below 0.1 arcseconds. By default, all the
+    terms are used.
+
+    :param threshold: Amplitude, in radians for the longitude and latitude,
+        and in astronomical units for the radius vector. Use 0.0 to go back
+        to the full series
+    :type threshold: int, float
+
+    :returns: None
+    :rtype: None
+    :raises: TypeError if input value is of wrong type.
+    :raises: ValueError if input value is negative.
+
+    >>> set_vsop_truncation(1e-8)
+    >>> get_vsop_truncation()
+    1e-08
+    >>> set_vsop_truncation()
+    >>> get_vsop_truncation()
+    0.0
+    """
+
+    global _VSOP_TRUNCATION
+    if not isinstance(threshold, (int, float)):
+        raise TypeError("Invalid input type")
+    if threshold < 0.0:
+        raise ValueError("Invalid input value")
+    _VSOP_TRUNCATION = float(threshold)
+    # Tables packed and positions computed with another threshold are no
+    # longer valid
+    _VSOP_PACKED.clear()
+    _VSOP_CACHE.clear()
+
+
+def get_vsop_truncation():
+    """This function returns the amplitude below which the terms of the VSOP87
+    series are skipped, as set by :func:`set_vsop_truncation`.
+
+    :returns: Amplitude threshold, in radians or astronomical units. Zero means
+        that all the terms are used
+    :rtype: float
+    """
+
+    return _VSOP_TRUNCATION
+
+
 def vsop_pos(epoch, vsop_l, vsop_b, vsop_r):
     """This function computes the position of a celestial body at a given epoch
     when its VSOP87 periodic term tables are provided.
 
+    Results are kept in an internal cache, because the position of the Earth
+    at a given epoch is usually needed several times (e.g., for the Sun and
+    for the geocentric positions of the other planets).
+
+    .. note:: The tables are converted to an internal format the first time
+        they are used, and that copy is reused afterwards. Therefore, the
+        tables must not be modified after their first use.
+
     :param epoch: Epoch to compute the position, given as an :class:`Epoch`
         object
     :type epoch: :py:class:`Epoch`
@@ -2458,51 +2734,45 @@ def vsop_pos(epoch, vsop_l, vsop_b, vsop_r):
         and isinstance(vsop_r, list)
     ):
         raise TypeError("Invalid input types")
-    # Let's redefine u in units of 100 Julian centuries from Epoch J2000.0
-    t = (epoch.jde() - 2451545.0) / 365250.0
-    sum_list = []
-    for i in range(len(vsop_l)):
-        s = 0.0
-        for k in range(len(vsop_l[i])):
-            s += vsop_l[i][k][0] * cos(vsop_l[i][k][1] + vsop_l[i][k][2] * t)
-        sum_list.append(s)
-    lon = 0.0
-    # Sum the longitude terms, while multiplying by 't' at the same time
-    for i in range(len(sum_list) - 1, 0, -1):
-        lon = (lon + sum_list[i]) * t
-    # Add the L0 term, which is NOT multiplied by 't'
-    lon += sum_list[0]
-    lon /= 1e8
-    lon = Angle(lon, radians=True)
-    lon = lon.to_positive()
-    sum_list = []
-    for i in range(len(vsop_b)):
-        s = 0.0
-        for k in range(len(vsop_b[i])):
-            s += vsop_b[i][k][0] * cos(vsop_b[i][k][1] + vsop_b[i][k][2] * t)
-        sum_list.append(s)
-    lat = 0.0
-    # Sum the latitude terms, while multiplying by 't' at the same time
-    for i in range(len(sum_list) - 1, 0, -1):
-        lat = (lat + sum_list[i]) * t
-    # Add the B0 term, which is NOT multiplied by 't'
-    lat += sum_list[0]
-    lat /= 1e8
-    lat = Angle(lat, radians=True)
-    sum_list = []
-    for i in range(len(vsop_r)):
-        s = 0.0
-        for k in range(len(vsop_r[i])):
-            s += vsop_r[i][k][0] * cos(vsop_r[i][k][1] + vsop_r[i][k][2] * t)
-        sum_list.append(s)
-    r = 0.0
-    # Sum the radius vector terms, while multiplying by 't' at the same time
-    for i in range(len(sum_list) - 1, 0, -1):
-        r = (r + sum_list[i]) * t
-    # Add the R0 term, which is NOT multiplied by 't'
-    r += sum_list[0]
-    r /= 1e8
-    return (lon, lat, r)
+    lon, lat, r = _vsop_pos_deg(epoch.jde(), vsop_l, vsop_b, vsop_r)
+    return (Angle(lon), Angle(lat), r)
+
+
+def _vsop_pos_deg(jde, vsop_l, vsop_b, vsop_r):
+    """Auxiliary function that computes the position of a celestial body from
+    its VSOP87 periodic term tables, returning plain floats so that callers
+    doing further computations don't need to build intermediate
+    :py:class:`Angle` objects. Results are kept in the internal cache.
+
+    :param jde: Julian Ephemeris Day of the position
+    :type jde: float
+    :param vsop_l: Table of VSOP87 terms for the heliocentric longitude
+    :type vsop_l: list
+    :param vsop_b: Table of VSOP87 terms for the heliocentric latitude
+    :type vsop_b: list
+    :param vsop_r: Table of VSOP87 terms for the radius vector
+    :type vsop_r: list
+
+    :returns: A tuple with the heliocentric longitude, in the [0, 360) range,
+        and latitude, both in degrees, and the radius vector, in astronomical
+        units
+    :rtype: tuple
+    """
+
+    key = (jde, id(vsop_l), id(vsop_b), id(vsop_r))
+    if key in _VSOP_CACHE:
+        return _VSOP_CACHE[key][3:]
+    # Let's redefine t in units of Julian millennia from Epoch J2000.0
+    t = (jde - 2451545.0) / 365250.0
+    lon = Angle(_vsop_series(_vsop_pack(vsop_l), t) * RAD2DEG).to_positive()
+    lat = Angle(_vsop_series(_vsop_pack(vsop_b), t) * RAD2DEG)
+    r = _vsop_series(_vsop_pack(vsop_r), t)
+    # Keep the cache from growing without limit
+    if len(_VSOP_CACHE) >= _VSOP_CACHE_SIZE:
+        _VSOP_CACHE.clear()
+    entry = (vsop_l, vsop_b, vsop_r, lon(), lat(), r)
+    _VSOP_CACHE[key] = entry
+    return entry[3:]
 
 
 def geometric_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, tofk5=True):
@@ -2510,6 +2780,9 @@ def geometric_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, tofk5=True):
     given epoch when its VSOP87 periodic term tables are provided. The small
     correction to convert to the FK5 system may or not be included.
 
+    .. note:: The tables must not be modified after their first use. See
+        :func:`vsop_pos`.
+
     :param epoch: Epoch to compute the position, given as an :class:`Epoch`
         object
     :type epoch: :py:class:`Epoch`
@@ -2533,21 +2806,23 @@ def geometric_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, tofk5=True):
     # First check that input values are of correct types
     if not isinstance(epoch, Epoch):
         raise TypeError("Invalid input types")
-    # Second, call the auxiliary function in charge of computations
-    lon, lat, r = vsop_pos(epoch, vsop_l, vsop_b, vsop_r)
+    # Second, call the auxiliary function in charge of computations. The
+    # correction below is done with floats, to avoid building several
+    # intermediate Angle objects
+    jde = epoch.jde()
+    lon, lat, r = _vsop_pos_deg(jde, vsop_l, vsop_b, vsop_r)
     if tofk5:
         # Apply the small correction for conversion to the FK5 system
-        t = (epoch.jde() - 2451545.0) / 36525.0
-        lambda_p = lon - t * (1.397 + 0.00031 * t)
-        delta_lon = Angle(0, 0, -0.09033)
-        a = 0.03916 * (cos(lambda_p.rad()) + sin(lambda_p.rad()))
-        a = a * tan(lat.rad())
-        delta_lon += Angle(0, 0, a)
-        delta_beta = 0.03916 * (cos(lambda_p.rad()) - sin(lambda_p.rad()))
-        delta_beta = Angle(0, 0, delta_beta)
-        lon += delta_lon
-        lat += delta_beta
-    return lon, lat, r
+        t = _julian_centuries(jde)
+        lambda_pr = (lon - t * (1.397 + 0.00031 * t)) * DEG2RAD
+        cos_lp = cos(lambda_pr)
+        sin_lp = sin(lambda_pr)
+        a = 0.03916 * (cos_lp + sin_lp)
+        a = a * tan(lat * DEG2RAD)
+        # Corrections are given in arcseconds
+        lon += -0.09033 / 3600.0 + a / 3600.0
+        lat += 0.03916 * (cos_lp - sin_lp) / 3600.0
+    return Angle(lon), Angle(lat), r
 
 
 def apparent_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, nutation=True):
@@ -2555,6 +2830,9 @@ def apparent_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, nutation=True):
     given epoch when its VSOP87 periodic term tables are provided. The small
     correction to convert to the FK5 system is always included.
 
+    .. note:: The tables must not be modified after their first use. See
+        :func:`vsop_pos`.
+
     :param epoch: Epoch to compute the position, given as an :class:`Epoch`
         object
     :type epoch: :py:class:`Epoch`
@@ -2581,9 +2859,9 @@ def apparent_vsop_pos(epoch, vsop_l, vsop_b, vsop_r, nutation=True):
     lon, lat, r = geometric_vsop_pos(epoch, vsop_l, vsop_b, vsop_r)
     if nutation:
         lon += nutation_longitude(epoch)
+    # The aberration correction is given in arcseconds
     delta = -20.4898 / r
-    delta = Angle(0, 0, delta)
-    lon += delta
+    lon += delta / 3600.0
     return lon, lat, r
 
 
@@ -2640,7 +2918,7 @@ def apparent_position(epoch, alpha, delta, sun_lon):
     dalpha1 = Angle(dalpha1)
     ddelta1 = Angle(ddelta1)
     # Now, let's compute the aberration effect
-    t = (epoch - JDE2000) / 36525
+    t = _julian_centuries(epoch.jde())
     e = 0.016708634 + t * (-0.000042037 - t * 0.0000001267)
     pie = 102.93735 + t * (1.71946 + t * 0.00046)
     pie = radians(pie)
@@ -2707,7 +2985,7 @@ def orbital_equinox2equinox(epoch0, epoch, i0, arg0, lon0):
     ):
         raise TypeError("Invalid input types")
     # Compute the auxiliary angles
-    tt = (epoch0 - JDE2000) / 36525.0
+    tt = _julian_centuries(epoch0.jde())
     t = (epoch - epoch0) / 36525.0
     # Compute the conversion parameters
     eta = t * (
@@ -2720,7 +2998,7 @@ def orbital_equinox2equinox(epoch0, epoch, i0, arg0, lon0):
     p = t * (
         5029.0966
         + tt * (2.22226 - 0.000042 * tt)
-        + t * (1.11113 - 0.000042 * tt - 0.000006 * t)
+        + t * ((1.11113 - 0.000042 * tt) - 0.000006 * t)
     )
     eta = Angle(0, 0, eta)
     pie = Angle(0, 0, pie)
@@ -2824,19 +3102,50 @@ def kepler_equation(eccentricity, mean_anomaly):
     if m > pi:
         f = -1
         m = 2.0 * pi - m
+    if ecc < 0.3:
+        # For small eccentricities Newton's method (second method in page
+        # 196) converges in a few iterations starting from the mean anomaly,
+        # so it is much faster than the bisection below
+        e0 = m
+        de = 1.0
+        while abs(de) > TOL:
+            de = (m + ecc * sin(e0) - e0) / (1.0 - ecc * cos(e0))
+            e0 += de
+        return _kepler_true_anomaly(e0 * f, ecc)
     e0 = pi / 2.0
     d = pi / 4.0
     ef = 0.0
     while abs(e0 - ef) > TOL:
         ef = e0
-        m1 = e0 - ecc * sin(e0)
-        s = copysign(1.0, m - m1)
-        e0 += d * s
-        d /= 2.0
-    e = Angle(e0 * f, radians=True)
+        # Comparing gives the same direction as the sign of the difference
+        # with the mean anomaly, but it is cheaper than calling copysign()
+        if m >= e0 - ecc * sin(e0):
+            e0 += d
+        else:
+            e0 -= d
+        d *= 0.5
+    return _kepler_true_anomaly(e0 * f, ecc)
+
+
+def _kepler_true_anomaly(eccentric_anomaly, eccentricity):
+    """Auxiliary function that computes the true anomaly corresponding to a
+    given eccentric anomaly, and returns both as Angle objects.
+
+    :param eccentric_anomaly: Eccentric anomaly, in radians
+    :type eccentric_anomaly: float
+    :param eccentricity: Orbit's eccentricity
+    :type eccentricity: int, float
+
+    :returns: A tuple with two Angle objects: Eccentric and true anomalies
+    :rtype: tuple
+    """
+
+    e = Angle(eccentric_anomaly, radians=True)
     # Now, compute the true anomaly
     er = e.rad()
-    v = 2.0 * atan(sqrt((1.0 + ecc) / (1.0 - ecc)) * tan(er / 2.0))
+    v = 2.0 * atan(
+        sqrt((1.0 + eccentricity) / (1.0 - eccentricity)) * tan(er / 2.0)
+    )
     return e, Angle(v, radians=True)
 
 
@@ -2872,7 +3181,7 @@ def orbital_elements(epoch, parameters1, parameters2):
         return param[0] + t * (param[1] + t * (param[2] + t * param[3]))
 
     # Compute the time parameter
-    t = (epoch - JDE2000) / 36525.0
+    t = _julian_centuries(epoch.jde())
     # Compute the orbital elements
     ll = compute_element(t, parameters2[0])
     a = compute_element(t, parameters1[1])
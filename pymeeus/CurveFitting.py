@@ -110,6 +110,8 @@ class CurveFitting(object):
         # Initialize data table
         self._x = []
         self._y = []
+        self._basis_key = None
+        self._basis_sums = None
         self.set(*args)  # Let's use 'set()' method to handle the setup
 
     def set(self, *args):
@@ -162,14 +164,28 @@ class CurveFitting(object):
         # Clean up the internal data tables and parameters
         self._x = []
         self._y = []
+        self._basis_key = None
+        self._basis_sums = None
+        # The sums used by the polynomial fittings are computed when needed
+        self._N = None
         # If no arguments are given, return. Internal data tables are empty
         if len(args) == 0:
             return
         # If we have only one argument, it can be a single value or tuple/list
         elif len(args) == 1:
             if isinstance(args[0], CurveFitting):
-                self._x = args[0]._x
-                self._y = args[0]._y
+                other = args[0]
+                # Copy the data tables instead of sharing them, and reuse the
+                # parameters that were already computed from them
+                self._x = list(other._x)
+                self._y = list(other._y)
+                self._basis_key = other._basis_key
+                self._basis_sums = other._basis_sums
+                if other._N is not None:
+                    self._N, self._P, self._Q, self._R = (other._N, other._P,
+                                                          other._Q, other._R)
+                    self._S, self._T, self._U, self._V, self._W = (
+                        other._S, other._T, other._U, other._V, other._W)
             elif isinstance(args[0], (int, float, Angle)):
                 # Insuficient data for curve fitting. Raise ValueError
                 raise ValueError("Invalid number of input values")
@@ -179,11 +195,8 @@ class CurveFitting(object):
                     raise ValueError("Invalid number of input values")
                 else:
                     # Read input values into 'y', and create 'x'
-                    i = 0
-                    for value in seq:
-                        self._x.append(i)
-                        self._y.append(value)
-                        i += 1
+                    self._x = list(range(len(seq)))
+                    self._y = list(seq)
             else:
                 raise TypeError("Invalid input value")
         elif len(args) == 2:
@@ -205,9 +218,8 @@ class CurveFitting(object):
                     raise ValueError("Invalid number of input values")
                 else:
                     # Read input values into 'x' and 'y'
-                    for xval, yval in zip(x, y):
-                        self._x.append(xval)
-                        self._y.append(yval)
+                    self._x = list(x)
+                    self._y = list(y)
             else:
                 raise TypeError("Invalid input value")
         elif len(args) == 3:
@@ -226,36 +238,33 @@ class CurveFitting(object):
             if not all_numbers:
                 raise TypeError("Invalid input value")
             # Now, extract the data: Odds are x's, evens are y's
-            for i in range(int(len(args) / 2.0)):
-                self._x.append(args[2 * i])
-                self._y.append(args[2 * i + 1])
-        # Compute parameters
-        if len(self._x) > 0:
-            self._compute_parameters()
+            self._x = list(args[0::2])
+            self._y = list(args[1::2])
 
     def _compute_parameters(self):
-        """Method to compute the intermediate parameters using for fitting."""
-
-        self._P = 0.0
-        self._Q = 0.0
-        self._R = 0.0
-        self._S = 0.0
-        self._T = 0.0
-        self._U = 0.0
-        self._V = 0.0
-        self._W = 0.0
+        """Method to compute the intermediate parameters using for fitting.
+
+        The parameters are computed only once, the first time they are needed
+        after the data was set, because :meth:`general_fitting` does not use
+        them.
+        """
+
+        if self._N is not None:
+            return
+
         self._N = len(self._x)
+        # Compute the terms first, and then add them up with fsum(), which
+        # avoids the loss of precision of the plain running sums
+        x2 = [x * x for x in self._x]
+        xy = [x * y for x, y in zip(self._x, self._y)]
         self._P = fsum(self._x)
+        self._Q = fsum(x2)
+        self._R = fsum([a * x for a, x in zip(x2, self._x)])
+        self._S = fsum([a * a for a in x2])
         self._T = fsum(self._y)
-        for i in range(self._N):
-            x2 = self._x[i] * self._x[i]
-            xy = self._x[i] * self._y[i]
-            self._Q += x2
-            self._R += x2 * self._x[i]
-            self._S += x2 * x2
-            self._U += xy
-            self._V += xy * self._x[i]
-            self._W += self._y[i] * self._y[i]
+        self._U = fsum(xy)
+        self._V = fsum([a * x for a, x in zip(xy, self._x)])
+        self._W = fsum([y * y for y in self._y])
         return
 
     def __str__(self):
@@ -321,6 +330,7 @@ class CurveFitting(object):
         -0.767
         """
 
+        self._compute_parameters()
         n = self._N
         sxy = self._U
         sx = self._P
@@ -351,6 +361,7 @@ class CurveFitting(object):
         a = -2.49	b = 244.18
         """
 
+        self._compute_parameters()
         n = self._N
         sxy = self._U
         sx = self._P
@@ -384,6 +395,7 @@ class CurveFitting(object):
         a = -2.22; b = 3.76; c = 6.64
         """
 
+        self._compute_parameters()
         n = self._N
         p = self._P
         q = self._Q
@@ -411,6 +423,10 @@ class CurveFitting(object):
         the general equation *'y = a*f0(x) + b*f1(x) + c*f2(x)'* that best fits
         the table data, using the least squares approach.
 
+        .. note:: The sums computed for the most recent set of functions are
+           reused until the data or the functions change. Therefore, the
+           functions must always return the same value for the same input.
+
         :param f0, f1, f2: Functions used to build the general equation.
         :type f0, f1, f2: function
         :returns: 'a', 'b', 'c' coefficients of best general equation fit.
@@ -439,29 +455,37 @@ class CurveFitting(object):
         a = 1.016; b = 0.0; c = 0.0
         """
 
-        m = 0
-        p = 0
-        q = 0
-        r = 0
-        s = 0
-        t = 0
-        u = 0
-        v = 0
-        w = 0
-        xl = list(self._x)
-        yl = list(self._y)
-        for i, value in enumerate(xl):
-            x = value
-            y = yl[i]
-            m += f0(x) * f0(x)
-            p += f0(x) * f1(x)
-            q += f0(x) * f2(x)
-            r += f1(x) * f1(x)
-            s += f1(x) * f2(x)
-            t += f2(x) * f2(x)
-            u += y * f0(x)
-            v += y * f1(x)
-            w += y * f2(x)
+        # The sums depend only on the data and the basis functions. Keep the
+        # ones from the most recent set of functions, so repeated fits with
+        # the same basis skip the evaluation entirely
+        key = (f0, f1, f2)
+        if key != self._basis_key:
+            m = 0
+            p = 0
+            q = 0
+            r = 0
+            s = 0
+            t = 0
+            u = 0
+            v = 0
+            w = 0
+            for x, y in zip(self._x, self._y):
+                # Evaluate each basis function only once per point
+                g0 = f0(x)
+                g1 = f1(x)
+                g2 = f2(x)
+                m += g0 * g0
+                p += g0 * g1
+                q += g0 * g2
+                r += g1 * g1
+                s += g1 * g2
+                t += g2 * g2
+                u += y * g0
+                v += y * g1
+                w += y * g2
+            self._basis_key = key
+            self._basis_sums = (m, p, q, r, s, t, u, v, w)
+        m, p, q, r, s, t, u, v, w = self._basis_sums
 
         if abs(r) < TOL and abs(t) < TOL and abs(m) >= TOL:
             return (u / m, 0.0, 0.0)
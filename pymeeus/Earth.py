@@ -18,7 +18,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from math import sqrt, radians, sin, cos, tan, atan, atan2, asin
+from math import sqrt, radians, sin, cos, atan2, asin, hypot
 
 from pymeeus.Angle import Angle
 from pymeeus.Epoch import Epoch
@@ -2878,6 +2878,11 @@ class Earth(object):
             self._ellip = ellipsoid
         else:
             raise TypeError("Invalid input value")
+        # Keep at hand the derived parameters of the ellipsoid used by several
+        # methods, so they are not recomputed on every call
+        self._b_a = ellipsoid.b() / ellipsoid._a
+        e = ellipsoid.e()
+        self._e2 = e * e
         return
 
     def __str__(self):
@@ -2969,9 +2974,8 @@ class Earth(object):
             phi = radians(latitude)  # Convert to radians
         else:
             phi = latitude.rad()  # It is an Angle. Call method rad()
-        b_a = self._ellip.b() / self._ellip._a
-        u = atan(b_a * tan(phi))
-        return b_a * sin(u) + height / self._ellip._a * sin(phi)
+        sin_phi, cos_phi, sin_u, cos_u = self._latitude_terms(phi)
+        return self._b_a * sin_u + height / self._ellip._a * sin_phi
 
     def rho_cosphi(self, latitude, height):
         """Method to compute the rho*cos(phi') term, needed in the calculation
@@ -3002,9 +3006,29 @@ class Earth(object):
             phi = radians(latitude)  # Convert to radians
         else:
             phi = latitude.rad()  # It is an Angle. Call method rad()
-        b_a = self._ellip.b() / self._ellip._a
-        u = atan(b_a * tan(phi))
-        return cos(u) + height / self._ellip._a * cos(phi)
+        sin_phi, cos_phi, sin_u, cos_u = self._latitude_terms(phi)
+        return cos_u + height / self._ellip._a * cos_phi
+
+    def _latitude_terms(self, phi):
+        """Auxiliary method returning the sine and cosine of the latitude phi
+        (in radians), together with the sine and cosine of the corresponding
+        reduced latitude u, where tan(u) = (b/a) * tan(phi).
+
+        The reduced latitude terms are obtained with hypot() from sin(phi) and
+        cos(phi), avoiding the calls to tan() and atan().
+
+        :returns: Tuple with sin(phi), cos(phi), sin(u) and cos(u)
+        :rtype: tuple
+        """
+
+        sin_phi = sin(phi)
+        cos_phi = cos(phi)
+        b_sin = self._b_a * sin_phi
+        # atan() keeps u in the (-90, 90) degrees range, hence cos(u) >= 0
+        if cos_phi < 0.0:
+            b_sin = -b_sin
+        h = hypot(cos_phi, b_sin)
+        return sin_phi, cos_phi, b_sin / h, abs(cos_phi) / h
 
     def rp(self, latitude):
         """Method to compute the radius of the parallel circle at the given
@@ -3030,8 +3054,8 @@ class Earth(object):
         else:
             phi = latitude.rad()  # It is an Angle. Call method rad()
         a = self._ellip._a
-        e = self._ellip.e()
-        return (a * cos(phi)) / sqrt(1.0 - e * e * sin(phi) * sin(phi))
+        sin_phi = sin(phi)
+        return (a * cos(phi)) / sqrt(1.0 - self._e2 * sin_phi * sin_phi)
 
     def linear_velocity(self, latitude):
         """Method to compute the linear velocity of a point at latitude, due
@@ -3080,8 +3104,9 @@ class Earth(object):
         else:
             phi = latitude.rad()  # It is an Angle. Call method rad()
         a = self._ellip._a
-        e = self._ellip.e()
-        return (a * (1.0 - e * e)) / (1.0 - e * e * sin(phi) * sin(phi)) ** 1.5
+        e2 = self._e2
+        sin_phi = sin(phi)
+        return (a * (1.0 - e2)) / (1.0 - e2 * sin_phi * sin_phi) ** 1.5
 
     def distance(self, lon1, lat1, lon2, lat2):
         """This method computes the distance between two points on the Earth's
@@ -3150,18 +3175,109 @@ class Earth(object):
             phi2 = radians(lat2)  # Convert to radians
         else:
             phi2 = lat2.rad()  # It is an Angle. Call method rad()
+        return self._distance(l1, phi1, l2, phi2)
+
+    def distance_batch(self, lon1, lat1, lon2, lat2):
+        """This method computes the distances between several pairs of points
+        on the Earth's surface using the method from H. Andoyer. It is
+        equivalent to calling :meth:`distance` for each pair of points, but
+        avoids most of the per-call overhead.
+
+        .. note:: We will consider that positions 'East' and 'South' are
+            negative.
+
+        :param lon1: Longitudes of the first points, in degrees
+        :type lon1: list, tuple of int, float, :class:`Angle`
+        :param lat1: Geodetical or geographical latitudes of the first points,
+            in degrees
+        :type lat1: list, tuple of int, float, :class:`Angle`
+        :param lon2: Longitudes of the second points, in degrees
+        :type lon2: list, tuple of int, float, :class:`Angle`
+        :param lat2: Geodetical or geographical latitudes of the second
+            points, in degrees
+        :type lat2: list, tuple of int, float, :class:`Angle`
+
+        :returns: Tuple with a list of distances between each pair of points
+            along Earth's surface, and a list of approximate errors, in meters
+        :rtype: tuple
+        :raises: TypeError if input values are of wrong type.
+        :raises: ValueError if input sequences have different lengths.
+
+        >>> e = Earth(ellipsoid=IAU76)
+        >>> lon1 = [Angle(-2, 20, 14.0), -2.09]
+        >>> lat1 = [Angle(48, 50, 11.0), 41.3]
+        >>> lon2 = [Angle(77, 3, 56.0), 73.99]
+        >>> lat2 = [Angle(38, 55, 17.0), 40.75]
+        >>> dist, error = e.distance_batch(lon1, lat1, lon2, lat2)
+        >>> print([round(d, 0) for d in dist])
+        [6181628.0, 6176760.0]
+        >>> error
+        [69.0, 69.0]
+        """
+
+        if not (
+            isinstance(lon1, (list, tuple))
+            and isinstance(lat1, (list, tuple))
+            and isinstance(lon2, (list, tuple))
+            and isinstance(lat2, (list, tuple))
+        ):
+            raise TypeError("Invalid input value")
+        n = len(lon1)
+        if len(lat1) != n or len(lon2) != n or len(lat2) != n:
+            raise ValueError("Input sequences must have the same length")
+        # Convert all the inputs to radians in one pass
+        rads = []
+        for seq in (lon1, lat1, lon2, lat2):
+            r = []
+            for value in seq:
+                if isinstance(value, (int, float)):
+                    r.append(radians(value))
+                elif isinstance(value, Angle):
+                    r.append(value.rad())
+                else:
+                    raise TypeError("Invalid input value")
+            rads.append(r)
+        dists = []
+        errors = []
+        for l1, phi1, l2, phi2 in zip(*rads):
+            dist, error = self._distance(l1, phi1, l2, phi2)
+            dists.append(dist)
+            errors.append(error)
+        return dists, errors
+
+    def _distance(self, l1, phi1, l2, phi2):
+        """Core of the Andoyer method used by :meth:`distance` and
+        :meth:`distance_batch`. All the inputs are given in radians.
+
+        :returns: Tuple with distance between the two points along Earth's
+            surface, and approximate error, in meters
+        :rtype: tuple
+        """
+
         f = (phi1 + phi2) / 2.0
         g = (phi1 - phi2) / 2.0
         lam = (l1 - l2) / 2.0
-        sin2g = sin(g) ** 2
-        cos2g = cos(g) ** 2
-        cos2f = cos(f) ** 2
-        sin2f = sin(f) ** 2
-        sin2lam = sin(lam) ** 2
-        cos2lam = cos(lam) ** 2
+        # Squaring by multiplication is cheaper than using the '**' operator
+        sin_g = sin(g)
+        cos_g = cos(g)
+        sin_f = sin(f)
+        cos_f = cos(f)
+        sin_lam = sin(lam)
+        cos_lam = cos(lam)
+        sin2g = sin_g * sin_g
+        cos2g = cos_g * cos_g
+        cos2f = cos_f * cos_f
+        sin2f = sin_f * sin_f
+        sin2lam = sin_lam * sin_lam
+        cos2lam = cos_lam * cos_lam
         s = sin2g * cos2lam + cos2f * sin2lam
         c = cos2g * cos2lam + sin2f * sin2lam
-        omega = atan(sqrt(s / c))
+        # Use atan2() instead of atan(sqrt(s / c)), because it remains stable
+        # for nearly antipodal points, where 'c' approaches zero
+        omega = atan2(sqrt(s), sqrt(c))
+        if omega == 0.0:
+            # Both points are the same, and the expressions below are 0/0
+            return 0.0, 0.0
         r = sqrt(s * c) / omega
         d = 2.0 * omega * self._ellip._a
         h1 = (3.0 * r - 1.0) / (2.0 * c)
@@ -3525,19 +3641,20 @@ class Earth(object):
         ang = Angle(0, 0, 8.794)
         sin_pi = sin(ang.rad()) / distance
         # Also, the values related to the latitude
-        e = Earth()
+        e = _EARTH_WGS84
         rho_sinphi = e.rho_sinphi(latitude, height)
         rho_cosphi = e.rho_cosphi(latitude, height)
+        # The sine and cosine of each input angle are needed only once
+        hr = hour_angle.rad()
+        decr = declination.rad()
+        sin_h, cos_h = sin(hr), cos(hr)
+        sin_dec, cos_dec = sin(decr), cos(decr)
         # Now, let's compute the correction for the right ascension
-        delta_a = atan2(-rho_cosphi * sin_pi * sin(hour_angle.rad()),
-                        cos(declination.rad()) - rho_cosphi * sin_pi
-                        * cos(hour_angle.rad()))
-        delta_a = Angle(delta_a, radians=True)
+        den = cos_dec - rho_cosphi * sin_pi * cos_h
+        delta_a = atan2(-rho_cosphi * sin_pi * sin_h, den)
         # And finally, the declination already corrected
-        dec = atan2((sin(declination.rad()) - rho_sinphi * sin_pi)
-                    * cos(delta_a.rad()),
-                    cos(declination.rad()) - rho_cosphi * sin_pi
-                    * cos(hour_angle.rad()))
+        dec = atan2((sin_dec - rho_sinphi * sin_pi) * cos(delta_a), den)
+        delta_a = Angle(delta_a, radians=True)
         dec = Angle(dec, radians=True)
         return (right_ascension + delta_a), dec
 
@@ -3604,7 +3721,7 @@ class Earth(object):
         ang = Angle(0, 0, 8.794)
         sin_pi = sin(ang.rad()) / distance
         # Also, the values related to the latitude
-        e = Earth()
+        e = _EARTH_WGS84
         rho_sinphi = e.rho_sinphi(obs_lat, height)
         rho_cosphi = e.rho_cosphi(obs_lat, height)
         # Let's compute some auxiliary quantities
@@ -3613,29 +3730,37 @@ class Earth(object):
         semir = semidiameter.rad()
         sidr = sidereal_time.rad()
         oblr = obliquity.rad()
-        n = cos(lonr) * cos(latr) - rho_cosphi * sin_pi * cos(sidr)
+        cos_lat = cos(latr)
+        sin_sid = sin(sidr)
+        sin_obl, cos_obl = sin(oblr), cos(oblr)
+        n = cos(lonr) * cos_lat - rho_cosphi * sin_pi * cos(sidr)
         # Now, compute the topocentric longitude
-        topo_lon = atan2(sin(lonr) * cos(latr)
-                         - sin_pi * (rho_sinphi * sin(oblr)
-                                     + rho_cosphi * cos(oblr) * sin(sidr)), n)
+        topo_lon = atan2(sin(lonr) * cos_lat
+                         - sin_pi * (rho_sinphi * sin_obl
+                                     + rho_cosphi * cos_obl * sin_sid), n)
         topo_lon = Angle(topo_lon, radians=True).to_positive()
-        tlonr = topo_lon.rad()
+        cos_tlon = cos(topo_lon.rad())
         # Compute the topocentric latitude
-        topo_lat = atan2(cos(tlonr) * (sin(latr)
-                                       - sin_pi * (rho_sinphi * cos(oblr)
-                                                   - rho_cosphi * sin(oblr)
-                                                   * sin(sidr))), n)
+        topo_lat = atan2(cos_tlon * (sin(latr)
+                                     - sin_pi * (rho_sinphi * cos_obl
+                                                 - rho_cosphi * sin_obl
+                                                 * sin_sid)), n)
         topo_lat = Angle(topo_lat, radians=True).to_positive()
         # Watch out: Latitude is only valid in the +/-90 deg range
         if abs(topo_lat) > 90.0:
             topo_lat = topo_lat - 180.0
         tlatr = topo_lat.rad()
         # And finally, let's compute the topocentric semidiameter
-        topo_semi = asin((cos(tlonr) * cos(tlatr) * sin(semir)) / n)
+        topo_semi = asin((cos_tlon * cos(tlatr) * sin(semir)) / n)
         topo_semi = Angle(topo_semi, radians=True)
         return topo_lon, topo_lat, topo_semi
 
 
+_EARTH_WGS84 = Earth()
+"""Internal Earth object, using the default ellipsoid, shared by the methods
+that need one instead of building it on each call"""
+
+
 def main():
 
     # Let's define a small helper function
@@ -18,9 +18,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-import calendar
 import datetime
-from math import radians, cos, sin, asin, sqrt, acos, degrees
+from bisect import bisect_left
+from math import radians, cos, sin, asin, sqrt, acos, degrees, floor
 
 from pymeeus.base import TOL, get_ordinal_suffix, iint
 from pymeeus.Angle import Angle
@@ -79,6 +79,53 @@ June 30th or December 31st, a leap second added in 1997/06/30 is represented
 here as '1997.5', while a leap second added in 2005/12/31 appears here as
 '2006.0'."""
 
+_LEAP_YEARS = sorted(LEAP_TABLE.keys())
+"""Internal list with the keys of LEAP_TABLE, sorted in ascending order"""
+
+MONTH_NAMES = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+"""Full names of the months of the year, in order"""
+
+_MONTH_LOOKUP = dict(
+    [(name, i + 1) for i, name in enumerate(MONTH_NAMES)]
+    + [(name[:3], i + 1) for i, name in enumerate(MONTH_NAMES)]
+)
+"""Internal table mapping the full and three-letter names of the months,
+capitalized, to their number"""
+
+_CUMULATIVE_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334,
+                    365)
+"""Internal table with the days elapsed before the start of each month in a
+common year, plus the total number of days at the end"""
+
+_CUMULATIVE_DAYS_LEAP = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305,
+                         335, 366)
+"""Internal table with the days elapsed before the start of each month in a
+leap year, plus the total number of days at the end"""
+
+DAY_NAMES = [
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+]
+"""Full names of the days of the week, starting on Sunday"""
+
 
 class Epoch(object):
     """
@@ -325,9 +372,14 @@ class Epoch(object):
         elif len(args) == 1:
             if isinstance(args[0], Epoch):
                 self._jde = args[0]._jde
+                # Without conversions to apply, the JDE is already the result
+                if not kwargs:
+                    return
                 year, month, day, hours, minutes, sec = self.get_full_date()
             elif isinstance(args[0], (int, float)):
-                self._jde = args[0]
+                self._jde = float(args[0])
+                if not kwargs:
+                    return
                 year, month, day, hours, minutes, sec = self.get_full_date()
             elif isinstance(args[0], (tuple, list)):
                 year, month, day, hours, minutes, sec = \
@@ -630,63 +682,25 @@ class Epoch(object):
         'March'
         """
 
-        months_mmm = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-
-        months_full = [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ]
-
         if isinstance(month, (int, float)):
             month = int(month)  # Truncate if it has decimals
             if month >= 1 and month <= 12:
                 if not as_string:
                     return month
                 else:
-                    return months_full[month - 1]
+                    return MONTH_NAMES[month - 1]
             else:
                 raise ValueError("Invalid value for the input month")
         elif isinstance(month, str):
-            month = month.strip().capitalize()
-            if len(month) == 3:
-                if month in months_mmm:
-                    if not as_string:
-                        return months_mmm.index(month) + 1
-                    else:
-                        return months_full[months_mmm.index(month)]
-                else:
-                    raise ValueError("Invalid value for the input month")
+            # A single look up in a table covers both the full and the
+            # three-letter names
+            number = _MONTH_LOOKUP.get(month.strip().capitalize())
+            if number is None:
+                raise ValueError("Invalid value for the input month")
+            if not as_string:
+                return number
             else:
-                if month in months_full:
-                    if not as_string:
-                        return months_full.index(month) + 1
-                    else:
-                        return month
-                else:
-                    raise ValueError("Invalid value for the input month")
+                return MONTH_NAMES[number - 1]
 
     @staticmethod
     def is_leap(year):
@@ -715,7 +729,10 @@ class Epoch(object):
             # Mind the difference between Julian and Gregorian calendars
             if year >= 1582:
                 year = iint(year)
-                return calendar.isleap(year)
+                # Divisible by 4, and either not by 100 or else by 400. Given
+                # that 100 = 4 * 25 and 400 = 16 * 25, the divisions by 4 and
+                # 16 become cheap bit masks
+                return not (year & 3) and (year % 25 != 0 or not (year & 15))
             else:
                 return (abs(year) % 4) == 0
         else:
@@ -779,17 +796,11 @@ class Epoch(object):
             raise ValueError("Invalid input data")
         day = int(dd)
         frac = dd % 1
-        if yyyy >= 1:  # datetime's minimum year is 1
-            try:
-                d = datetime.date(yyyy, mm, day)
-            except ValueError:
-                raise ValueError("Invalid input date")
-            doy = d.timetuple().tm_yday
-        else:
-            k = 2 if Epoch.is_leap(yyyy) else 1
-            doy = (iint((275.0 * mm) / 9.0)
-                   - k * iint((mm + 9.0) / 12.0) + day - 30.0)
-        return float(doy + frac)
+        mm = int(mm)
+        days = Epoch._cumulative_days(yyyy)
+        if day > days[mm] - days[mm - 1]:
+            raise ValueError("Invalid input date")
+        return float(days[mm - 1] + day + frac)
 
     def doy(self):
         """This method returns the Day Of Year (DOY) for the current Epoch
@@ -867,25 +878,39 @@ class Epoch(object):
         if isinstance(year, (int, float)) and isinstance(doy, (int, float)):
             frac = float(doy % 1)
             doy = int(doy)
-            if year >= 1:  # datetime's minimum year is 1
-                ref = datetime.date(year, 1, 1)
-                mydate = datetime.date.fromordinal(ref.toordinal() + doy - 1)
-                return year, mydate.month, mydate.day + frac
-            else:
-                # The algorithm provided by Meeus doesn't work for years below
-                # +1. This little hack solves that problem (the 'if' result is
-                # inverted here).
-                k = 1 if Epoch.is_leap(year) else 2
-                if doy < 32:
-                    m = 1
-                else:
-                    m = iint((9.0 * (k + doy)) / 275.0 + 0.98)
-                d = (doy - iint((275.0 * m) / 9.0)
-                     + k * iint((m + 9.0) / 12.0) + 30)
-                return year, int(m), d + frac
+            days = Epoch._cumulative_days(year)
+            if doy < 1 or doy > days[12]:
+                raise ValueError("Invalid input values")
+            # Find the month whose first day is the last one not after 'doy'
+            m = bisect_left(days, doy)
+            return year, m, doy - days[m - 1] + frac
         else:
             raise ValueError("Invalid input values")
 
+    @staticmethod
+    def _cumulative_days(year):
+        """Auxiliary method returning the table with the number of days
+        elapsed before the start of each month (plus the total at the end) of
+        the given year.
+
+        .. note:: From year 1 onwards, the proleptic Gregorian calendar is
+           used (as in Python's :mod:`datetime` module), while for previous
+           years the Julian calendar is used.
+
+        :param year: Year
+        :type year: int, float
+
+        :returns: Cumulative number of days at the start of each month
+        :rtype: tuple
+        """
+
+        if year >= 1:
+            year = iint(year)
+            leap = not (year & 3) and (year % 25 != 0 or not (year & 15))
+        else:
+            leap = Epoch.is_leap(year)
+        return _CUMULATIVE_DAYS_LEAP if leap else _CUMULATIVE_DAYS
+
     @staticmethod
     def leap_seconds(year, month):
         """Returns the leap seconds accumulated for the given year and month.
@@ -918,17 +943,15 @@ class Epoch(object):
         27
         """
 
-        list_years = sorted(LEAP_TABLE.keys())
         # First test the extremes of the table
-        if (year + month / 12.0) <= list_years[0]:
+        if (year + month / 12.0) <= _LEAP_YEARS[0]:
             return 0
-        if (year + month / 12.0) >= list_years[-1]:
-            return LEAP_TABLE[list_years[-1]]
+        if (year + month / 12.0) >= _LEAP_YEARS[-1]:
+            return LEAP_TABLE[_LEAP_YEARS[-1]]
         lyear = (year + 0.25) if month <= 6 else (year + 0.75)
-        idx = 0
-        while lyear > list_years[idx]:
-            idx += 1
-        return LEAP_TABLE[list_years[idx - 1]]
+        # Find the first entry not before 'lyear', and take the previous one
+        idx = bisect_left(_LEAP_YEARS, lyear)
+        return LEAP_TABLE[_LEAP_YEARS[idx - 1]]
 
     @staticmethod
     def get_last_leap_second():
@@ -939,8 +962,7 @@ class Epoch(object):
         :rtype: tuple
         """
 
-        list_years = sorted(LEAP_TABLE.keys())
-        lyear = list_years[-1]
+        lyear = _LEAP_YEARS[-1]
         lseconds = LEAP_TABLE[lyear]
         year = iint(lyear)
         # So far, leap seconds are added either on June 30th or December 31th
@@ -1025,20 +1047,18 @@ class Epoch(object):
         year = int(year)
         if year >= 1583:
             # In this case, we are using the Gregorian calendar
+            # Integer division is used throughout, as it gives the same
+            # results as iint() without going through floats
             a = year % 19
-            b = iint(year / 100.0)
-            c = year % 100
-            d = iint(b / 4.0)
-            e = b % 4
-            f = iint((b + 8.0) / 25.0)
-            g = iint((b - f + 1.0) / 3.0)
+            b, c = divmod(year, 100)
+            d, e = divmod(b, 4)
+            f = (b + 8) // 25
+            g = (b - f + 1) // 3
             h = (19 * a + b - d - g + 15) % 30
-            i = iint(c / 4.0)
-            k = c % 4
+            i, k = divmod(c, 4)
             ll = (32 + 2 * (e + i) - h - k) % 7
-            m = iint((a + 11 * h + 22 * ll) / 451.0)
-            n = iint((h + ll - 7 * m + 114) / 31.0)
-            p = (h + ll - 7 * m + 114) % 31
+            m = (a + 11 * h + 22 * ll) // 451
+            n, p = divmod(h + ll - 7 * m + 114, 31)
             return (n, p + 1)
         else:
             # The Julian calendar is used here
@@ -1047,8 +1067,7 @@ class Epoch(object):
             c = year % 19
             d = (19 * c + 15) % 30
             e = (2 * a + 4 * b - d + 34) % 7
-            f = iint((d + e + 114) / 31.0)
-            g = (d + e + 114) % 31
+            f, g = divmod(d + e + 114, 31)
             return (f, g + 1)
 
     @staticmethod
@@ -1493,10 +1512,12 @@ class Epoch(object):
         """
 
         y = year + (month - 0.5) / 12.0
+        # The intervals are checked in order, so each branch only needs to
+        # test its upper limit
         if year < -500:
             u = (year - 1820.0) / 100.0
             dt = -20.0 + 32.0 * u * u
-        elif year >= -500 and year < 500:
+        elif year < 500:
             u = y / 100.0
             dt = 10583.6 + u * (
                 -1014.41
@@ -1511,7 +1532,7 @@ class Epoch(object):
                     )
                 )
             )
-        elif year >= 500 and year < 1600:
+        elif year < 1600:
             u = (year - 1000) / 100.0
             dt = 1574.2 + u * (
                 -556.01
@@ -1526,15 +1547,15 @@ class Epoch(object):
                     )
                 )
             )
-        elif year >= 1600 and year < 1700:
+        elif year < 1700:
             t = y - 1600.0
             dt = 120.0 + t * (-0.9808 + t * (-0.01532 + t / 7129.0))
-        elif year >= 1700 and year < 1800:
+        elif year < 1800:
             t = y - 1700.0
             dt = 8.83 + t * (
                 0.1603 + t * (-0.0059285 + t * (0.00013336 - t / 1174000.0))
             )
-        elif year >= 1800 and year < 1860:
+        elif year < 1860:
             t = y - 1800.0
             dt = 13.72 + t * (
                 -0.332447
@@ -1554,7 +1575,7 @@ class Epoch(object):
                     )
                 )
             )
-        elif year >= 1860 and year < 1900:
+        elif year < 1900:
             t = y - 1860.0
             dt = 7.62 + t * (
                 0.5737
@@ -1562,21 +1583,21 @@ class Epoch(object):
                 * (-0.251754 + t * (0.01680668
                                     + t * (-0.0004473624 + t / 233174.0)))
             )
-        elif year >= 1900 and year < 1920:
+        elif year < 1920:
             t = y - 1900.0
             dt = -2.79 + t * (
                 1.494119 + t * (-0.0598939 + t * (0.0061966 - 0.000197 * t))
             )
-        elif year >= 1920 and year < 1941:
+        elif year < 1941:
             t = y - 1920.0
             dt = 21.20 + t * (0.84493 + t * (-0.076100 + 0.0020936 * t))
-        elif year >= 1941 and year < 1961:
+        elif year < 1961:
             t = y - 1950.0
             dt = 29.07 + t * (0.407 + t * (-1.0 / 233.0 + t / 2547.0))
-        elif year >= 1961 and year < 1986:
+        elif year < 1986:
             t = y - 1975.0
             dt = 45.45 + t * (1.067 + t * (-1.0 / 260.0 - t / 718.0))
-        elif year >= 1986 and year < 2005:
+        elif year < 2005:
             t = y - 2000.0
             dt = 63.86 + t * (
                 0.3345
@@ -1584,12 +1605,12 @@ class Epoch(object):
                 * (-0.060374 + t * (0.0017275
                                     + t * (0.000651814 + 0.00002373599 * t)))
             )
-        elif year >= 2005 and year < 2050:
+        elif year < 2050:
             t = y - 2000.0
             dt = 62.92 + t * (0.32217 + 0.005589 * t)
-        elif year >= 2050 and year < 2150:
-            dt = (-20.0 + 32.0 * ((y - 1820.0) / 100.0) ** 2
-                  - 0.5628 * (2150.0 - y))
+        elif year < 2150:
+            u = (y - 1820.0) / 100.0
+            dt = -20.0 + 32.0 * u * u - 0.5628 * (2150.0 - y)
         else:
             u = (year - 1820.0) / 100.0
             dt = -20.0 + 32.0 * u * u
@@ -1629,21 +1650,13 @@ class Epoch(object):
         'Sunday'
         """
 
-        jd = iint(self._jde - 0.5) + 2.0
-        doy = iint(jd % 7)
+        # The Julian Day 0.0 started at noon of a Monday. Integer modulo
+        # keeps the result in [0, 6] for negative values as well
+        doy = iint(self._jde + 1.5) % 7
         if not as_string:
             return doy
         else:
-            day_names = [
-                "Sunday",
-                "Monday",
-                "Tuesday",
-                "Wednesday",
-                "Thursday",
-                "Friday",
-                "Saturday",
-            ]
-            return day_names[doy]
+            return DAY_NAMES[doy]
 
     def mean_sidereal_time(self):
         """Method to compute the _mean_ sidereal time at Greenwich for the
@@ -1752,6 +1765,53 @@ class Epoch(object):
 
         return self._jde
 
+    @staticmethod
+    def jde_batch(years, months, days):
+        """This method computes the Julian Ephemeris Day (JDE) of several
+        dates at once. It gives the same values as calling :meth:`jde` on
+        ``Epoch(year, month, day)`` for each date, but without building the
+        intermediate :class:`Epoch` objects. No UTC to TT correction is
+        applied.
+
+        :param years: Years of the dates
+        :type years: list, tuple of int
+        :param months: Months of the dates, as numbers
+        :type months: list, tuple of int
+        :param days: Days of the dates, with decimals if needed
+        :type days: list, tuple of int, float
+
+        :returns: List with the Julian Ephemeris Day of each date
+        :rtype: list
+        :raises: TypeError if input values are of wrong type.
+        :raises: ValueError if input sequences have different lengths.
+
+        >>> Epoch.jde_batch([1957, 333, -1000], [10, 1, 2], [4.81, 27.5, 29.0])
+        [2436116.31, 1842713.0, 1355866.5]
+        """
+
+        if not (
+            isinstance(years, (list, tuple))
+            and isinstance(months, (list, tuple))
+            and isinstance(days, (list, tuple))
+        ):
+            raise TypeError("Invalid input types")
+        if not (len(years) == len(months) == len(days)):
+            raise ValueError("Input sequences must have the same length")
+        result = []
+        for y, m, d in zip(years, months, days):
+            # Same steps as _compute_jde(), inlined to skip the overhead
+            if m <= 2:
+                y -= 1
+                m += 12
+            if y < 1582 or (y == 1582 and (m < 10 or (m == 10 and d < 5.0))):
+                b = 0.0
+            else:
+                a = floor(y / 100.0)
+                b = 2.0 - a + floor(a / 4.0)
+            result.append(floor(365.25 * (y + 4716.0))
+                          + floor(30.6001 * (m + 1.0)) + d + b - 1524.5)
+        return result
+
     def year(self):
         """This method returns the contents of this object as a year with
         decimals.
@@ -121,30 +121,14 @@ class Interpolation(object):
     def _order_points(self):
         """Method to put the data points in ascending order w.r.t. 'x'."""
 
-        # Let's work with copies of the original lists
-        x = list(self._x)
-        y = list(self._y)
-
-        xnew = []
-        ynew = []
-        xmax = max(x) + 1.0
-        for _ in range(len(x)):
-            # Get the index of the minimum value
-            imin = x.index(min(x))
-            # Append the current minimum value to the new 'x' list
-            xnew.append(x[imin])
-            # Store the *position* of the current minimum value to new 'y' list
-            ynew.append(imin)
-            # The current minimum value will no longer be the minimum
-            x[imin] = xmax
-
-        # In the new 'y' list, substitute the positions by the real values
-        for i in range(len(x)):
-            ynew[i] = y[ynew[i]]
+        # Sort the positions of the data points according to their 'x' value
+        x = self._x
+        y = self._y
+        order = sorted(range(len(x)), key=x.__getitem__)
 
         # Store the results in the corresponding fields
-        self._x = xnew
-        self._y = ynew
+        self._x = [x[i] for i in order]
+        self._y = [y[i] for i in order]
 
     def set(self, *args):
         """Method used to define the value pairs of Interpolation object.
@@ -222,11 +206,8 @@ class Interpolation(object):
                     raise ValueError("Invalid number of input values")
                 else:
                     # Read input values into 'y', and create 'x'
-                    i = 0
-                    for value in seq:
-                        self._x.append(i)
-                        self._y.append(value)
-                        i += 1
+                    self._x = list(range(len(seq)))
+                    self._y = list(seq)
             else:
                 raise TypeError("Invalid input value")
         elif len(args) == 2:
@@ -248,9 +229,8 @@ class Interpolation(object):
                     raise ValueError("Invalid number of input values")
                 else:
                     # Read input values into 'x' and 'y'
-                    for xval, yval in zip(x, y):
-                        self._x.append(xval)
-                        self._y.append(yval)
+                    self._x = list(x)
+                    self._y = list(y)
             else:
                 raise TypeError("Invalid input value")
         elif len(args) == 3:
@@ -269,16 +249,15 @@ class Interpolation(object):
             if not all_numbers:
                 raise TypeError("Invalid input value")
             # Now, extract the data: Odds are x's, evens are y's
-            for i in range(int(len(args) / 2.0)):
-                self._x.append(args[2 * i])
-                self._y.append(args[2 * i + 1])
-        # After self._x is found, confirm that x's are different to each other
-        for i in range(len(self._x) - 1):
-            for k in range(i + 1, len(self._x)):
-                if abs(self._x[i] - self._x[k]) < self._tol:
-                    raise ValueError("Invalid input: Values in 'x' are equal")
+            self._x = list(args[0::2])
+            self._y = list(args[1::2])
         # Order the data points if needed
         self._order_points()
+        # Confirm that x's are different to each other. Once they are ordered,
+        # it is enough to compare each value with the next one
+        for i in range(len(self._x) - 1):
+            if abs(self._x[i + 1] - self._x[i]) < self._tol:
+                raise ValueError("Invalid input: Values in 'x' are equal")
         # Create table containing Newton coefficientes, only if values given
         if len(self._x) > 0:
             self._compute_table()
@@ -353,31 +332,21 @@ class Interpolation(object):
         return
 
     def _compute_table(self):
-        """Method to compute coefficients of Newton interpolation method."""
-
-        for i in range(len(self._x)):
-            self._table.append(self._newton_diff(0, i))
-
-    def _newton_diff(self, start, end):
-        """Auxiliary method to compute the elements of the Newton table.
-
-        :param start: Starting index
-        :type start: int
-        :param end: Ending index
-        :type end: int
+        """Method to compute coefficients of Newton interpolation method.
 
-        :returns: Resulting value of the element of the Newton table.
-        :rtype: float
+        The divided differences are computed column by column and in place,
+        so only O(n^2) operations are needed, instead of the exponential
+        number of calls that a recursive evaluation would require.
         """
 
-        if abs(end - start) < self._tol:
-            val = self._y[start]
-        else:
-            x = list(self._x)  # Let's make a copy, just in case
-            val = (self._newton_diff(start, end - 1)
-                   - self._newton_diff(start + 1, end)) / (x[start] - x[end])
-
-        return val
+        x = self._x
+        table = list(self._y)
+        n = len(table)
+        for j in range(1, n):
+            # Go backwards, so lower entries of previous column are kept
+            for i in range(n - 1, j - 1, -1):
+                table[i] = (table[i - 1] - table[i]) / (x[i - j] - x[i])
+        self._table = table
 
     def __call__(self, x):
         """Method to interpolate the function at a given 'x'.
@@ -408,10 +377,16 @@ class Interpolation(object):
             # Check that x is within interpolation table values
             if x < self._x[0] or x > self._x[-1]:
                 raise ValueError("Input value outside of interpolation range.")
+            table = self._table
+            # Three-point tables are by far the most common (e.g., in the
+            # perihelion and aphelion computations), so unroll that case
+            if len(table) == 3:
+                return table[0] + (x - self._x[0]) * (
+                    table[1] + (x - self._x[1]) * table[2])
             # Horner's method is used to efficiently compute the result
-            val = self._table[-1]
-            for i in range(len(self._table) - 1, 0, -1):
-                val = self._table[i - 1] + (x - self._x[i - 1]) * val
+            val = table[-1]
+            for i in range(len(table) - 1, 0, -1):
+                val = table[i - 1] + (x - self._x[i - 1]) * val
 
             return val
         else:
@@ -444,16 +419,14 @@ class Interpolation(object):
             if len(self._x) == 2:
                 return (self._y[1] - self._y[0]) / (self._x[1] - self._x[0])
             else:
-                res = self._table[1]
-                for k in range(len(self._table) - 1, 1, -1):
-                    val = 0.0
-                    for j in range(k):
-                        s = 1.0
-                        for i in range(k):
-                            if i != j:
-                                s *= x - self._x[i]
-                        val += s
-                    res += val * self._table[k]
+                # Horner's method is applied to the Newton polynomial and, at
+                # the same time, to its derivative. This takes O(n) operations
+                val = self._table[-1]
+                res = 0.0
+                for i in range(len(self._table) - 2, -1, -1):
+                    dx = x - self._x[i]
+                    res = res * dx + val
+                    val = val * dx + self._table[i]
                 return res
         else:
             raise TypeError("Invalid input value")
@@ -533,6 +506,10 @@ class Interpolation(object):
             # Check if signs of ordinates are the same
             if (yl * yh) > 0.0:
                 raise ValueError("Invalid interval: Probably no root exists")
+            # If the polynomial is at most quadratic, solve it directly
+            x = self._quadratic_root(xl, xh)
+            if x is not None:
+                return x
             # We are good to go. First option: Newton's root-finding method
             x = (xl + xh) / 2.0  # Start in the middle of interval
             y = self.__call__(x)
@@ -568,6 +545,63 @@ class Interpolation(object):
         else:
             raise TypeError("Invalid input value")
 
+    def _quadratic_root(self, xl, xh):
+        """Auxiliary method to find the root of interpolation polynomials of
+        degree two or lower, using the closed-form solution.
+
+        :param xl: Lower limit of interval where the root will be looked for.
+        :type xl: int, float, :py:class:`Angle`
+        :param xh: Higher limit of interval where the root will be looked for.
+        :type xh: int, float, :py:class:`Angle`
+
+        :returns: Root within the [xl, xh] interval, or None if the polynomial
+            is of higher degree, no root was found in that interval, or the
+            root found doesn't meet the tolerance.
+        :rtype: float, :py:class:`Angle`
+        """
+
+        if len(self._table) > 3:
+            return None
+        # Convert the Newton form to 'a*u*u + b*u + c', with 'u = x - x0'.
+        # Working with the shifted variable avoids the cancellation that the
+        # monomial form suffers for large abscissas, like Julian Days
+        x0 = float(self._x[0])
+        x1 = float(self._x[1])
+        t0 = float(self._table[0])
+        t1 = float(self._table[1])
+        t2 = float(self._table[2]) if len(self._table) == 3 else 0.0
+        a = t2
+        b = t1 + t2 * (x0 - x1)
+        c = t0
+        if a == 0.0:
+            if b == 0.0:
+                return None
+            roots = [-c / b]
+        else:
+            d = b * b - 4.0 * a * c
+            if d < 0.0:
+                return None
+            # Use the numerically stable version of the quadratic formula
+            d = sqrt(d)
+            q = -0.5 * (b + d) if b >= 0.0 else -0.5 * (b - d)
+            if q == 0.0:
+                return None
+            roots = [q / a, c / q]
+        for u in roots:
+            x = x0 + u
+            if xl <= x <= xh:
+                # Keep the same guarantee as the iterative method. Otherwise,
+                # let the caller refine the root
+                if abs(self.__call__(x)) <= self._tol:
+                    # Return the same type as the iterative method, which
+                    # gives an Angle when the table holds Angle values
+                    for value in self._x + self._y:
+                        if isinstance(value, Angle):
+                            return Angle(x)
+                    return x
+                return None
+        return None
+
     def minmax(self, xl=0, xh=0, max_iter=1000):
         """Method to find the minimum or maximum inside the [xl, xh] range.
 
@@ -617,13 +651,14 @@ class Interpolation(object):
         0.33333333
         """
 
-        # Compute the derivatives for the current data
-        x = list(self._x)
-        y = []
-        for xi in x:
-            y.append(self.derivative(xi))
-        # Create a new Interpolation object
-        prime = Interpolation(x, y)
+        # Create a new Interpolation object with the derivatives at the current
+        # data points. These points are already ordered and checked, so the
+        # table is filled in directly instead of going through set()
+        prime = Interpolation()
+        prime._x = list(self._x)
+        prime._y = [self.derivative(xi) for xi in self._x]
+        prime._tol = self._tol
+        prime._compute_table()
         # Find the root within that object, and return it
         return prime.root(xl, xh, max_iter)
 
@@ -89,7 +89,7 @@ class JupiterMoons(object):
             z = r * sin(b.rad()) + R * sin(beta.rad())
 
             DELTA_old = DELTA
-            DELTA = sqrt(x ** 2 + y ** 2 + z ** 2)
+            DELTA = sqrt(x * x + y * y + z * z)
             iterations += 1
 
         # t is time since JDE 2433000.5 - light time (tau)
@@ -102,7 +102,7 @@ class JupiterMoons(object):
         T_0 = (epoch.jde() - 2433282.423) / 36525
 
         # Precession in longitude from the epoch B1950.0 in deg
-        P = 1.3966626 * T_0 + 0.0003088 * (T_0 ** 2)
+        P = T_0 * (1.3966626 + 0.0003088 * T_0)
 
         psi_corrected = psi + P
 
@@ -111,11 +111,9 @@ class JupiterMoons(object):
         # the plane of the ecliptic (i_ecliptic_jupiter) in deg
         JC_jupiter_angles = (epoch.jde() - tau - 2451545) / 36525
 
-        OMEGA_ascending_node_jupiter = 100.464407 + 1.0209774 * \
-            JC_jupiter_angles + 0.00040315 * (
-                JC_jupiter_angles ** 2) + \
-            0.000000404 * (
-                JC_jupiter_angles ** 3)
+        jc = JC_jupiter_angles
+        OMEGA_ascending_node_jupiter = 100.464407 + jc * (
+            1.0209774 + jc * (0.00040315 + jc * 0.000000404))
 
         return psi_corrected, OMEGA_ascending_node_jupiter
 
@@ -154,7 +152,7 @@ class JupiterMoons(object):
         >>> print(europa)
         (7.441869121153001, 0.27524463479625677, -5.747104399729193)
         >>> print(ganymede)
-        (1.201111684800708, 0.5899903274317162, -14.940581367576527)
+        (1.201111684800708, 0.5899903274317163, -14.940581367576527)
         >>> print(callisto)
         (7.072022641384802, 1.0289678450543338, -25.224420329457175)
         """
@@ -184,11 +182,11 @@ class JupiterMoons(object):
             z = r * sin(b.rad()) + R * sin(beta.rad())
 
             DELTA_old = DELTA
-            DELTA = sqrt(x ** 2 + y ** 2 + z ** 2)
+            DELTA = sqrt(x * x + y * y + z * z)
 
         # Calculate Jupiter's geocentric longitude lambda_0 and latitute beta_0
         lambda_0 = atan2(y, x)
-        beta_0 = atan(z / (sqrt(x ** 2 + y ** 2)))
+        beta_0 = atan(z / (sqrt(x * x + y * y)))
 
         # t is time since JDE 2433000.5 - light time (tau)
         t = epoch.jde() - 2443000.5 - tau
@@ -509,7 +507,7 @@ class JupiterMoons(object):
         T_0 = (epoch.jde() - 2433282.423) / 36525
 
         # Precession in longitude from the epoch B1950.0 in deg
-        P = 1.3966626 * T_0 + 0.0003088 * (T_0 ** 2)
+        P = T_0 * (1.3966626 + 0.0003088 * T_0)
 
         # Correct all longitudes and psi by precession
         L1_corrected = L1 + P
@@ -546,15 +544,11 @@ class JupiterMoons(object):
         # the plane of the ecliptic (i_ecliptic_jupiter) in deg
         JC_jupiter_angles = (epoch.jde() - tau - 2451545) / 36525
 
-        OMEGA_asc_node_jup = 100.464407 + 1.0209774 * \
-            JC_jupiter_angles + 0.00040315 * (
-                JC_jupiter_angles ** 2) + \
-            0.000000404 * (
-                JC_jupiter_angles ** 3)
-        i_ecliptic_jupiter = 1.303267 - 0.0054965 * JC_jupiter_angles + \
-            0.00000466 * (
-                JC_jupiter_angles ** 2) - 0.000000002 * (
-                JC_jupiter_angles ** 3)
+        jc = JC_jupiter_angles
+        OMEGA_asc_node_jup = 100.464407 + jc * (
+            1.0209774 + jc * (0.00040315 + jc * 0.000000404))
+        i_ecliptic_jupiter = 1.303267 + jc * (
+            -0.0054965 + jc * (0.00000466 - jc * 0.000000002))
 
         # Calculate D with the fictional satellite
         D = JupiterMoons.apparent_rectangular_coordinates(epoch, X_5, Y_5, Z_5,
@@ -777,7 +771,7 @@ class JupiterMoons(object):
             z = r * sin(b.rad()) + R * sin(beta.rad())
 
             DELTA_old = DELTA
-            DELTA = sqrt(x ** 2 + y ** 2 + z ** 2)
+            DELTA = sqrt(x * x + y * y + z * z)
             iterations += 1
 
         return DELTA, tau, l, b, r
@@ -841,7 +835,8 @@ class JupiterMoons(object):
         K = [17295, 21819, 27558, 36548]
 
         # Correct X-coordinate
-        X += (abs(Z) / K[i_sat - 1]) * sqrt(1 - (X / R) ** 2)
+        xr = X / R
+        X += (abs(Z) / K[i_sat - 1]) * sqrt(1 - xr * xr)
 
         # Perspective effect correction:
         # Compute correction factor
@@ -879,7 +874,7 @@ class JupiterMoons(object):
         >>> print(result_matrix[1])
         [-7.44770945299594, -8.33419997337025, 0.0]
         >>> print(result_matrix[2])
-        [-1.3572840767173413, -3.817302564886177, 0.0]
+        [-1.3572840767173415, -3.817302564886177, 0.0]
         >>> print(result_matrix[3])
         [-7.157430454898491, -11.373611474420906, 0.0]
 
@@ -1040,7 +1035,7 @@ class JupiterMoons(object):
         # Accounting for elliptical Jupiter disk
         Y *= 1.071374
 
-        return sqrt(X ** 2 + Y ** 2)
+        return sqrt(X * X + Y * Y)
 
     @staticmethod
     def check_occultation(X=0, Y=0, Z=0, epoch=None, i_sat=None):
@@ -169,6 +169,20 @@ PERIODIC_TERMS_B_TABLE = [
 Units are 0.000001 degree. In Meeus' book this is Table 47.B and can be found
 in page 341."""
 
+_LR_TERMS = [
+    tuple(row[:4]) + (abs(row[1]),) + tuple(row[4:])
+    for row in PERIODIC_TERMS_LR_TABLE
+]
+"""Internal version of PERIODIC_TERMS_LR_TABLE, where each term also carries
+the power of the eccentricity factor E that multiplies its coefficients"""
+
+_B_TERMS = [
+    tuple(row[:4]) + (abs(row[1]),) + tuple(row[4:])
+    for row in PERIODIC_TERMS_B_TABLE
+]
+"""Internal version of PERIODIC_TERMS_B_TABLE, where each term also carries
+the power of the eccentricity factor E that multiplies its coefficient"""
+
 
 class Moon(object):
     """
@@ -260,42 +274,24 @@ class Moon(object):
         A2r = A2.rad()
         A3 = Angle(Angle.reduce_deg(A3)).to_positive()
         A3r = A3.rad()
-        # Let's store this results in a list, in preparation for using tables
-        arguments = [Dr, Mr, Mprimer, Fr]
+        # The coefficients of terms depending on M are multiplied by E or E^2
+        efactor = (1.0, E, E2)
         # Now we use the tables of periodic terms. First for sigmal and sigmar
         sigmal = 0.0
         sigmar = 0.0
-        for i, value in enumerate(PERIODIC_TERMS_LR_TABLE):
-            argument = 0.0
-            for j in range(4):
-                if PERIODIC_TERMS_LR_TABLE[i][j]:  # Avoid multiply by zero
-                    argument += PERIODIC_TERMS_LR_TABLE[i][j] * arguments[j]
-            coeffl = value[4]
-            coeffr = value[5]
-            if abs(value[1]) == 1:
-                coeffl = coeffl * E
-                coeffr = coeffr * E
-            elif abs(value[1]) == 2:
-                coeffl = coeffl * E2
-                coeffr = coeffr * E2
-            sigmal += coeffl * sin(argument)
-            sigmar += coeffr * cos(argument)
+        for kd, km, kmp, kf, ke, coeffl, coeffr in _LR_TERMS:
+            argument = kd * Dr + km * Mr + kmp * Mprimer + kf * Fr
+            e = efactor[ke]
+            sigmal += coeffl * e * sin(argument)
+            sigmar += coeffr * e * cos(argument)
         # Add the additive terms to sigmal
         sigmal += (3958.0 * sin(A1r) + 1962.0 * sin(Lprimer - Fr)
                    + 318.0 * sin(A2r))
-        # Now use the tabla for sigmab
+        # Now use the table for sigmab
         sigmab = 0.0
-        for i, value in enumerate(PERIODIC_TERMS_B_TABLE):
-            argument = 0.0
-            for j in range(4):
-                if PERIODIC_TERMS_B_TABLE[i][j]:  # Avoid multiply by zero
-                    argument += PERIODIC_TERMS_B_TABLE[i][j] * arguments[j]
-            coeffb = value[4]
-            if abs(value[1]) == 1:
-                coeffb = coeffb * E
-            elif abs(value[1]) == 2:
-                coeffb = coeffb * E2
-            sigmab += coeffb * sin(argument)
+        for kd, km, kmp, kf, ke, coeffb in _B_TERMS:
+            argument = kd * Dr + km * Mr + kmp * Mprimer + kf * Fr
+            sigmab += coeffb * efactor[ke] * sin(argument)
         # Add the additive terms to sigmab
         sigmab += (-2235.0 * sin(Lprimer) + 382.0 * sin(A3r)
                    + 175.0 * sin(A1r - Fr) + 175.0 * sin(A1r + Fr)
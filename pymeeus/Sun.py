@@ -27,6 +27,7 @@ from pymeeus.Coordinates import (
     true_obliquity,
     nutation_longitude,
     ecliptical2equatorial,
+    get_vsop_truncation,
 )
 from pymeeus.Earth import Earth
 
@@ -40,6 +41,74 @@ from pymeeus.Earth import Earth
 """
 
 
+_EQUINOX_SOLSTICE_CACHE = {}
+"""Internal cache with the JDEs of the equinoxes and solstices already
+computed, keyed by year, target and VSOP87 truncation threshold"""
+
+_EQUINOX_SOLSTICE_CACHE_SIZE = 256
+"""Maximum number of entries kept in the internal equinox/solstice cache"""
+
+
+def _spherical_to_rectangular(r, lat, lon):
+    """Auxiliary function that converts spherical coordinates into
+    rectangular coordinates (X, Y, Z), computing the cosine of the latitude
+    only once.
+
+    :param r: Radius vector
+    :type r: float
+    :param lat: Latitude, in radians
+    :type lat: float
+    :param lon: Longitude, in radians
+    :type lon: float
+
+    :returns: A tuple with the X, Y, Z values, in the units of 'r'
+    :rtype: tuple
+    """
+
+    rcb = r * cos(lat)
+    return rcb * cos(lon), rcb * sin(lon), r * sin(lat)
+
+
+_RECTANGULAR_J2000_CACHE = {}
+"""Internal cache with the rectangular geocentric ecliptical coordinates of
+the Sun referred to J2000.0, keyed by JDE and VSOP87 truncation threshold"""
+
+_RECTANGULAR_J2000_CACHE_SIZE = 256
+"""Maximum number of entries kept in the internal rectangular coordinates
+cache"""
+
+
+def _rectangular_ecliptical_j2000(epoch):
+    """Auxiliary function that computes the rectangular geocentric ecliptical
+    coordinates (X, Y, Z) of the Sun, referred to the equinox J2000.0.
+
+    These coordinates are shared by the methods that rotate them to the
+    equatorial frames of J2000.0, B1950.0 and other equinoxes, so they are
+    kept in an internal cache.
+
+    :param epoch: Epoch to compute Sun position, as an Epoch object
+    :type epoch: :py:class:`Epoch`
+
+    :returns: A tuple with the X, Y, Z values in astronomical units
+    :rtype: tuple
+    """
+
+    key = (epoch.jde(), get_vsop_truncation())
+    if key in _RECTANGULAR_J2000_CACHE:
+        return _RECTANGULAR_J2000_CACHE[key]
+    # Compute Earth heliocentric position referred to J2000.0
+    lon, lat, r = Earth.geometric_heliocentric_position_j2000(epoch)
+    # Convert from Earth's heliocentric to Sun's geocentric
+    lon = lon.to_positive() + 180.0
+    lat = -lat
+    result = _spherical_to_rectangular(r, lat.rad(), lon.rad())
+    # Keep the cache from growing without limit
+    if len(_RECTANGULAR_J2000_CACHE) >= _RECTANGULAR_J2000_CACHE_SIZE:
+        _RECTANGULAR_J2000_CACHE.clear()
+    _RECTANGULAR_J2000_CACHE[key] = result
+    return result
+
+
 class Sun(object):
     """
     Class Sun handles the parameters related to the Sun.
@@ -126,8 +195,7 @@ class Sun(object):
         if not isinstance(epoch, Epoch):
             raise TypeError("Invalid input type")
         # First find the true longitude
-        sun = Sun()
-        true_lon, r = sun.true_longitude_coarse(epoch)
+        true_lon, r = Sun.true_longitude_coarse(epoch)
         # Compute the time in Julian centuries
         t = (epoch - JDE2000) / 36525.0
         # Then correct for nutation and aberration
@@ -163,8 +231,7 @@ class Sun(object):
         if not isinstance(epoch, Epoch):
             raise TypeError("Invalid input type")
         # Second, find the apparent longitude
-        sun = Sun()
-        app_lon, r = sun.apparent_longitude_coarse(epoch)
+        app_lon, r = Sun.apparent_longitude_coarse(epoch)
         # Compute the obliquity of the ecliptic
         e0 = mean_obliquity(epoch)
         # Compute the time in Julian centuries
@@ -174,10 +241,14 @@ class Sun(object):
         omega = Angle(omega)
         # Correct the obliquity
         e = e0 + 0.00256 * cos(omega.rad())
-        alpha = atan2(cos(e.rad()) * sin(app_lon.rad()), cos(app_lon.rad()))
+        # Compute the radians and the trigonometric values used twice only once
+        er = e.rad()
+        lonr = app_lon.rad()
+        sin_lon = sin(lonr)
+        alpha = atan2(cos(er) * sin_lon, cos(lonr))
         alpha = Angle(alpha, radians=True)
         alpha.to_positive()
-        delta = asin(sin(e.rad()) * sin(app_lon.rad()))
+        delta = asin(sin(er) * sin_lon)
         delta = Angle(delta, radians=True)
         return (alpha, delta, r)
 
@@ -345,14 +416,8 @@ class Sun(object):
         # First check that input values are of correct types
         if not isinstance(epoch, Epoch):
             raise TypeError("Invalid input type")
-        # Second, compute Earth heliocentric position referred to J2000.0
-        lon, lat, r = Earth.geometric_heliocentric_position_j2000(epoch)
-        # Third, convert from Earth's heliocentric to Sun's geocentric
-        lon = lon.to_positive() + 180.0
-        lat = -lat
-        x = r * cos(lat.rad()) * cos(lon.rad())
-        y = r * cos(lat.rad()) * sin(lon.rad())
-        z = r * sin(lat.rad())
+        # Second, get Sun's geocentric ecliptical coordinates w.r.t. J2000.0
+        x, y, z = _rectangular_ecliptical_j2000(epoch)
         x0 = x + 0.00000044036 * y - 0.000000190919 * z
         y0 = -0.000000479966 * x + 0.917482137087 * y - 0.397776982902 * z
         z0 = 0.397776982902 * y + 0.917482137087 * z
@@ -387,14 +452,8 @@ class Sun(object):
         # First check that input values are of correct types
         if not isinstance(epoch, Epoch):
             raise TypeError("Invalid input type")
-        # Second, compute Earth heliocentric position referred to J2000.0
-        lon, lat, r = Earth.geometric_heliocentric_position_j2000(epoch)
-        # Third, convert from Earth's heliocentric to Sun's geocentric
-        lon = lon.to_positive() + 180.0
-        lat = -lat
-        x = r * cos(lat.rad()) * cos(lon.rad())
-        y = r * cos(lat.rad()) * sin(lon.rad())
-        z = r * sin(lat.rad())
+        # Second, get Sun's geocentric ecliptical coordinates w.r.t. J2000.0
+        x, y, z = _rectangular_ecliptical_j2000(epoch)
         x = 0.999925702634 * x + 0.012189716217 * y + 0.000011134016 * z
         y = -0.011179418036 * x + 0.917413998946 * y - 0.397777041885 * z
         z = -0.004859003787 * x + 0.397747363646 * y + 0.917482111428 * z
@@ -509,6 +568,11 @@ class Sun(object):
             and (target != "winter")
         ):
             raise ValueError("'target' value is invalid")
+        # The iteration below is expensive, so results are kept in a cache.
+        # Only the JDE is stored, and a new Epoch is returned each time
+        key = (year, target, get_vsop_truncation())
+        if key in _EQUINOX_SOLSTICE_CACHE:
+            return Epoch(_EQUINOX_SOLSTICE_CACHE[key])
         # Now we can start computing an approximate value (Tables 27.A, 27.B)
         if (year >= -1000) and (year < 1000):
             y = year / 1000.0
@@ -561,6 +625,10 @@ class Sun(object):
             corr = 58.0 * sin(arg.rad())
             epoch += corr
         epoch -= corr
+        # Keep the cache from growing without limit
+        if len(_EQUINOX_SOLSTICE_CACHE) >= _EQUINOX_SOLSTICE_CACHE_SIZE:
+            _EQUINOX_SOLSTICE_CACHE.clear()
+        _EQUINOX_SOLSTICE_CACHE[key] = epoch.jde()
         return epoch
 
     @staticmethod
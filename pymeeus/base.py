@@ -18,7 +18,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from math import floor
+from math import floor, pi
 
 
 """
@@ -33,6 +33,12 @@ from math import floor
 TOL = 1e-10
 """Internal tolerance being used by default"""
 
+DEG2RAD = pi / 180.0
+"""Factor to convert from degrees to radians, as used by math.radians()"""
+
+RAD2DEG = 180.0 / pi
+"""Factor to convert from radians to degrees, as used by math.degrees()"""
+
 
 def machine_accuracy():
     """This function computes the accuracy of the computer being used.
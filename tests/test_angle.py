@@ -161,6 +161,14 @@ def test_angle_reduce_deg():
     assert abs(d - (-0.86)) < TOL, \
         "ERROR: In 2nd reduce_deg() test, degrees value doesn't match"
 
+    d = Angle.reduce_deg(-12000 * 360.0 - 12.5)
+    assert abs(d - (-12.5)) < TOL, \
+        "ERROR: In 3rd reduce_deg() test, degrees value doesn't match"
+
+    d = Angle.reduce_deg(720)
+    assert abs(d) < TOL and isinstance(d, float), \
+        "ERROR: In 4th reduce_deg() test, degrees value doesn't match"
+
 
 def test_angle_reduce_dms():
     """Tests reduce_dms() static method of Angle class"""
@@ -217,6 +225,17 @@ def test_angle_dms_str():
     assert result == "0:-46:15.0", \
         "ERROR: In 2nd dms_str() test, the output value doesn't match"
 
+    # Rounding the seconds must carry into the minutes and the degrees
+    a = Angle(10, 59, 59.999)
+    result = a.dms_str(n_dec=2)
+    assert result == "11d 0' 0.0''", \
+        "ERROR: In 3rd dms_str() test, the output value doesn't match"
+
+    a = Angle(359, 59, 59.9999)
+    result = a.dms_str(False, 2)
+    assert result == "0:0:0.0", \
+        "ERROR: In 4th dms_str() test, the output value doesn't match"
+
 
 def test_angle_ra_str():
     """Tests ra_str() method of Angle class"""
@@ -520,6 +539,13 @@ def test_angle_iadd():
     assert abs(a() - 220.5) < TOL, \
         "ERROR: In 3rd __iadd__() test, degrees value doesn't match"
 
+    # Other references to the original Angle must not be modified
+    c = a
+    a += 1.5
+
+    assert abs(c() - 220.5) < TOL, \
+        "ERROR: In 4th __iadd__() test, original Angle was modified"
+
 
 def test_angle_isub():
     """Tests the accumulative subtraction between Angles"""
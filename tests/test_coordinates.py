@@ -18,13 +18,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from math import cos
+from math import sin, cos
+
+import pytest
 
 from pymeeus.base import TOL
 from pymeeus.Coordinates import mean_obliquity, true_obliquity, \
     nutation_longitude, nutation_obliquity, precession_equatorial, \
-    precession_ecliptical, motion_in_space, equatorial2ecliptical, \
-    ecliptical2equatorial, equatorial2horizontal, horizontal2equatorial, \
+    precession_newcomb, precession_ecliptical, motion_in_space, \
+    equatorial2ecliptical, ecliptical2equatorial, equatorial2horizontal, \
+    horizontal2equatorial, \
     equatorial2galactic, galactic2equatorial, ecliptic_horizon, \
     parallactic_angle, ecliptic_equator, diurnal_path_horizon, \
     times_rise_transit_set, refraction_apparent2true, \
@@ -35,9 +38,59 @@ from pymeeus.Coordinates import mean_obliquity, true_obliquity, \
     orbital_equinox2equinox, kepler_equation, velocity, \
     velocity_perihelion, velocity_aphelion, length_orbit, \
     passage_nodes_elliptic, passage_nodes_parabolic, phase_angle, \
-    illuminated_fraction
+    illuminated_fraction, set_vsop_truncation, get_vsop_truncation
 from pymeeus.Angle import Angle
 from pymeeus.Epoch import Epoch, JDE2000
+from pymeeus.Earth import Earth
+
+
+# Declare some objects to be used later
+epoch_1987 = Epoch()
+sirius_ra = Angle()
+sirius_dec = Angle()
+sirius_pm_ra = Angle()
+sirius_pm_dec = Angle()
+epsilon_j2000 = Angle()
+washington_lat = Angle()
+epoch_2028 = Epoch()
+theta_persei_ra = Angle()
+theta_persei_dec = Angle()
+
+
+def setup_module():
+    """This function is used to set up the environment for the tests"""
+    # Several tests use the same epoch. Sharing it also lets the nutation
+    # cache be reused among them
+    epoch_1987.set(1987, 4, 10)
+    # Position and proper motion of Sirius, used by motion_in_space() tests
+    sirius_ra.set(6, 45, 8.871, ra=True)
+    sirius_dec.set(-16.716108)
+    sirius_pm_ra.set(0, 0, -0.03847, ra=True)
+    sirius_pm_dec.set(0, 0, -1.2053)
+    # Obliquity of the ecliptic at J2000.0 and latitude of the US Naval
+    # Observatory, shared by the coordinate transformation tests
+    epsilon_j2000.set(23.4392911)
+    washington_lat.set(38, 55, 17)
+    # Position of Theta Persei precessed from J2000.0 to 2028 Nov 13.19. It
+    # is checked by the precession_equatorial() test, and then used as input
+    # by the apparent_position() test, so the precession is only done once
+    epoch_2028.set(2028, 11, 13.19)
+    alpha, delta = precession_equatorial(JDE2000, epoch_2028,
+                                         Angle(2, 44, 11.986, ra=True),
+                                         Angle(49, 13, 42.48),
+                                         Angle(0, 0, 0.03425, ra=True),
+                                         Angle(0, 0, -0.0895))
+    theta_persei_ra.set(alpha())
+    theta_persei_dec.set(delta())
+
+
+def teardown_module():
+    pass
+
+
+# pre pytest 7.2 ompatibility
+setup = setup_module
+teardown = teardown_module
 
 
 # Coordinates module
@@ -45,77 +98,72 @@ from pymeeus.Epoch import Epoch, JDE2000
 def test_coordinates_mean_obliquity():
     """Tests the mean_obliquity() method of Coordinates module"""
 
-    e0 = mean_obliquity(1987, 4, 10)
-    a = e0.dms_tuple()
-    assert abs(a[0] - 23.0) < TOL, \
-        "ERROR: 1st mean_obliquity() test, 'degrees' value doesn't match"
-
-    assert abs(a[1] - 26.0) < TOL, \
-        "ERROR: 2nd mean_obliquity() test, 'minutes' value doesn't match"
-
-    assert abs(round(a[2], 3) - 27.407) < TOL, \
-        "ERROR: 3rd mean_obliquity() test, 'seconds value doesn't match"
-
-    assert abs(a[3] - 1.0) < TOL, \
-        "ERROR: 4th mean_obliquity() test, 'sign' value doesn't match"
+    e0 = mean_obliquity(epoch_1987)
+    # Expected value is 23d 26' 27.407'', compared in arcseconds
+    expected = (23.0 * 60.0 + 26.0) * 60.0 + 27.407
+    assert abs(e0() * 3600.0 - expected) < 5e-4, \
+        "ERROR: mean_obliquity() test, value in arcseconds doesn't match"
 
 
 def test_coordinates_true_obliquity():
     """Tests the true_obliquity() method of Coordinates module"""
 
-    epsilon = true_obliquity(1987, 4, 10)
-    a = epsilon.dms_tuple()
-    assert abs(a[0] - 23.0) < TOL, \
-        "ERROR: 1st true_obliquity() test, 'degrees' value doesn't match"
+    epsilon = true_obliquity(epoch_1987)
+    # Expected value is 23d 26' 36.849'', compared in arcseconds
+    expected = (23.0 * 60.0 + 26.0) * 60.0 + 36.849
+    assert abs(epsilon() * 3600.0 - expected) < 5e-4, \
+        "ERROR: true_obliquity() test, value in arcseconds doesn't match"
 
-    assert abs(a[1] - 26.0) < TOL, \
-        "ERROR: 2nd true_obliquity() test, 'minutes' value doesn't match"
 
-    assert abs(round(a[2], 3) - 36.849) < TOL, \
-        "ERROR: 3rd true_obliquity() test, 'seconds value doesn't match"
+def test_coordinates_nutation_longitude():
+    """Tests the nutation_longitude() method of Coordinates module"""
 
-    assert abs(a[3] - 1.0) < TOL, \
-        "ERROR: 4th true_obliquity() test, 'sign' value doesn't match"
+    dpsi = nutation_longitude(epoch_1987)
+    assert abs(dpsi() * 3600.0 + 3.788) < 5e-4, \
+        "ERROR: nutation_longitude() test, value in arcseconds doesn't match"
 
 
-def test_coordinates_nutation_longitude():
-    """Tests the nutation_longitude() method of Coordinates module"""
+def test_coordinates_nutation_obliquity():
+    """Tests the nutation_obliquity() method of Coordinates module"""
 
-    dpsi = nutation_longitude(1987, 4, 10)
-    a = dpsi.dms_tuple()
-    assert abs(a[0] - 0.0) < TOL, \
-        "ERROR: 1st nutation_longitude() test, 'degrees' value doesn't match"
+    depsilon = nutation_obliquity(epoch_1987)
+    assert abs(depsilon() * 3600.0 - 9.443) < 5e-4, \
+        "ERROR: nutation_obliquity() test, value in arcseconds doesn't match"
 
-    assert abs(a[1] - 0.0) < TOL, \
-        "ERROR: 2nd nutation_longitude() test, 'minutes' value doesn't match"
 
-    assert abs(round(a[2], 3) - 3.788) < TOL, \
-        "ERROR: 3rd nutation_longitude() test, 'seconds value doesn't match"
+def test_coordinates_precession_equatorial():
+    """Tests the precession_equatorial() method of Coordinates module"""
 
-    assert abs(a[3] - (-1.0)) < TOL, \
-        "ERROR: 4th nutation_longitude() test, 'sign' value doesn't match"
+    alpha0 = Angle(2, 44, 11.986, ra=True)
+    delta0 = Angle(49, 13, 42.48)
 
+    # Expected values are 2h 46' 11.331'' and 49d 20' 54.54'', compared in
+    # degrees within half a unit of their last digit
+    ra_tol = 0.0005 * 15.0 / 3600.0
+    dec_tol = 0.005 / 3600.0
+    ra_expected = (2.0 + 46.0 / 60.0 + 11.331 / 3600.0) * 15.0
+    dec_expected = 49.0 + 20.0 / 60.0 + 54.54 / 3600.0
 
-def test_coordinates_nutation_obliquity():
-    """Tests the nutation_obliquity() method of Coordinates module"""
+    # The precession with proper motion was done in setup_module()
+    assert abs(theta_persei_ra() - ra_expected) < ra_tol, \
+        "ERROR: 1st precession_equatorial test, right ascension doesn't match"
 
-    depsilon = nutation_obliquity(1987, 4, 10)
-    a = depsilon.dms_tuple()
-    assert abs(a[0] - 0.0) < TOL, \
-        "ERROR: 1st nutation_obliquity() test, 'degrees' value doesn't match"
+    assert abs(theta_persei_dec() - dec_expected) < dec_tol, \
+        "ERROR: 2nd precession_equatorial() test, 'declination' doesn't match"
 
-    assert abs(a[1] - 0.0) < TOL, \
-        "ERROR: 2nd nutation_obliquity() test, 'minutes' value doesn't match"
+    # Precess back from a starting epoch different from J2000.0
+    alpha, delta = precession_equatorial(JDE2000, epoch_2028, alpha0, delta0)
+    alpha, delta = precession_equatorial(epoch_2028, JDE2000, alpha, delta)
 
-    assert abs(round(a[2], 3) - 9.443) < TOL, \
-        "ERROR: 3rd nutation_obliquity() test, 'seconds value doesn't match"
+    assert abs(alpha() - alpha0()) < ra_tol, \
+        "ERROR: 3rd precession_equatorial test, right ascension doesn't match"
 
-    assert abs(a[3] - 1.0) < TOL, \
-        "ERROR: 4th nutation_obliquity() test, 'sign' value doesn't match"
+    assert abs(delta() - delta0()) < dec_tol, \
+        "ERROR: 4th precession_equatorial() test, 'declination' doesn't match"
 
 
-def test_coordinates_precession_equatorial():
-    """Tests the precession_equatorial() method of Coordinates module"""
+def test_coordinates_precession_newcomb():
+    """Tests the precession_newcomb() method of Coordinates module"""
 
     start_epoch = JDE2000
     final_epoch = Epoch(2028, 11, 13.19)
@@ -124,14 +172,19 @@ def test_coordinates_precession_equatorial():
     pm_ra = Angle(0, 0, 0.03425, ra=True)
     pm_dec = Angle(0, 0, -0.0895)
 
-    alpha, delta = precession_equatorial(start_epoch, final_epoch, alpha0,
-                                         delta0, pm_ra, pm_dec)
+    alpha, delta = precession_newcomb(start_epoch, final_epoch, alpha0,
+                                      delta0, pm_ra, pm_dec)
 
-    assert alpha.ra_str(False, 3) == "2:46:11.331", \
-        "ERROR: 1st precession_equatorial test, right ascension doesn't match"
+    # Over a few decades, Newcomb's equations agree with the modern ones to
+    # within one arcsecond
+    alpha1, delta1 = precession_equatorial(start_epoch, final_epoch, alpha0,
+                                           delta0, pm_ra, pm_dec)
 
-    assert delta.dms_str(False, 2) == "49:20:54.54", \
-        "ERROR: 2nd precession_equatorial() test, 'declination' doesn't match"
+    assert abs(alpha() - alpha1()) < 1.0 / 3600.0, \
+        "ERROR: 1st precession_newcomb() test, 'right ascension' doesn't match"
+
+    assert abs(delta() - delta1()) < 1.0 / 3600.0, \
+        "ERROR: 2nd precession_newcomb() test, 'declination' doesn't match"
 
 
 def test_coordinates_precession_ecliptical():
@@ -144,46 +197,48 @@ def test_coordinates_precession_ecliptical():
 
     lon, lat = precession_ecliptical(start_epoch, final_epoch, lon0, lat0)
 
-    assert abs(round(lon(), 3) - 118.704) < TOL, \
+    assert abs(lon() - 118.704) < 5e-4, \
         "ERROR: 1st precession_ecliptical() test, 'longitude' doesn't match"
 
-    assert abs(round(lat(), 3) - 1.615) < TOL, \
+    assert abs(lat() - 1.615) < 5e-4, \
         "ERROR: 2nd precession_ecliptical() test, 'latitude' doesn't match"
 
 
-def test_coordinates_motion_in_space():
+@pytest.mark.parametrize("years, ra_expected, dec_expected", [
+    (-2000.0, (6, 46, 25.09), (-16, 3, 0.8)),
+    (-3000.0, (6, 47, 2.67), (-15, 43, 12.3)),
+    (-12000.0, (6, 52, 25.72), (-12, 50, 6.7)),
+], ids=["-2000", "-3000", "-12000"])
+def test_coordinates_motion_in_space(years, ra_expected, dec_expected):
     """Tests the motion_in_space() method of Coordinates module"""
 
-    ra = Angle(6, 45, 8.871, ra=True)
-    dec = Angle(-16.716108)
-    pm_ra = Angle(0, 0, -0.03847, ra=True)
-    pm_dec = Angle(0, 0, -1.2053)
-    dist = 2.64
-    vel = -7.6
-
-    alpha, delta = motion_in_space(ra, dec, dist, vel, pm_ra, pm_dec, -2000.0)
+    alpha, delta = motion_in_space(sirius_ra, sirius_dec, 2.64, -7.6,
+                                   sirius_pm_ra, sirius_pm_dec, years)
 
-    assert alpha.ra_str(False, 2) == "6:46:25.09", \
-        "ERROR: 1st motion_in_space() test, 'right ascension' doesn't match"
+    assert abs(alpha - Angle(ra_expected, ra=True)) < 0.005 / 240.0, \
+        "ERROR: motion_in_space() test, 'right ascension' doesn't match"
 
-    assert delta.dms_str(False, 1) == "-16:3:0.8", \
-        "ERROR: 2nd motion_in_space() test, 'declination' doesn't match"
+    assert abs(delta - Angle(dec_expected)) < 0.05 / 3600.0, \
+        "ERROR: motion_in_space() test, 'declination' doesn't match"
 
-    alpha, delta = motion_in_space(ra, dec, dist, vel, pm_ra, pm_dec, -3000.0)
 
-    assert alpha.ra_str(False, 2) == "6:47:2.67", \
-        "ERROR: 3rd motion_in_space() test, 'right ascension' doesn't match"
+def test_coordinates_motion_in_space_list():
+    """Tests the motion_in_space() method of Coordinates module, with a list
+    of years"""
 
-    assert delta.dms_str(False, 1) == "-15:43:12.3", \
-        "ERROR: 4th motion_in_space() test, 'declination' doesn't match"
+    positions = motion_in_space(sirius_ra, sirius_dec, 2.64, -7.6,
+                                sirius_pm_ra, sirius_pm_dec,
+                                [-2000.0, -3000.0, -12000.0])
+    alpha, delta = positions[2]
 
-    alpha, delta = motion_in_space(ra, dec, dist, vel, pm_ra, pm_dec, -12000.0)
+    assert len(positions) == 3, \
+        "ERROR: 1st motion_in_space() test, number of positions doesn't match"
 
-    assert alpha.ra_str(False, 2) == "6:52:25.72", \
-        "ERROR: 5th motion_in_space() test, 'right ascension' doesn't match"
+    assert abs(alpha - Angle(6, 52, 25.72, ra=True)) < 0.005 / 240.0, \
+        "ERROR: 2nd motion_in_space() test, 'right ascension' doesn't match"
 
-    assert delta.dms_str(False, 1) == "-12:50:6.7", \
-        "ERROR: 6th motion_in_space() test, 'declination' doesn't match"
+    assert abs(delta - Angle(-12, 50, 6.7)) < 0.05 / 3600.0, \
+        "ERROR: 3rd motion_in_space() test, 'declination' doesn't match"
 
 
 def test_coordinates_equatorial2ecliptical():
@@ -191,13 +246,12 @@ def test_coordinates_equatorial2ecliptical():
 
     ra = Angle(7, 45, 18.946, ra=True)
     dec = Angle(28, 1, 34.26)
-    epsilon = Angle(23.4392911)
-    lon, lat = equatorial2ecliptical(ra, dec, epsilon)
+    lon, lat = equatorial2ecliptical(ra, dec, epsilon_j2000)
 
-    assert abs(round(lon(), 5) - 113.21563) < TOL, \
+    assert abs(lon() - 113.21563) < 5e-6, \
         "ERROR: 1st equatorial2ecliptical() test, 'longitude' doesn't match"
 
-    assert abs(round(lat(), 5) - 6.68417) < TOL, \
+    assert abs(lat() - 6.68417) < 5e-6, \
         "ERROR: 2nd equatorial2ecliptical() test, 'latitude' doesn't match"
 
 
@@ -206,13 +260,12 @@ def test_coordinates_ecliptical2equatorial():
 
     lon = Angle(113.21563)
     lat = Angle(6.68417)
-    epsilon = Angle(23.4392911)
-    ra, dec = ecliptical2equatorial(lon, lat, epsilon)
+    ra, dec = ecliptical2equatorial(lon, lat, epsilon_j2000)
 
-    assert ra.ra_str(n_dec=3) == "7h 45' 18.946''", \
+    assert abs(ra - Angle(7, 45, 18.946, ra=True)) < 0.0005 / 240.0, \
         "ERROR: 1st ecliptical2equatorial() test, 'ra' doesn't match"
 
-    assert dec.dms_str(n_dec=2) == "28d 1' 34.26''", \
+    assert abs(dec - Angle(28, 1, 34.26)) < 0.005 / 3600.0, \
         "ERROR: 2nd ecliptical2equatorial() test, 'declination' doesn't match"
 
 
@@ -220,20 +273,21 @@ def test_coordinates_equatorial2horizontal():
     """Tests the equatorial2horizontal() method of Coordinates module"""
 
     lon = Angle(77, 3, 56)
-    lat = Angle(38, 55, 17)
     ra = Angle(23, 9, 16.641, ra=True)
     dec = Angle(-6, 43, 11.61)
-    theta0 = Angle(8, 34, 57.0896, ra=True)
+    # Apparent sidereal time: correct the mean one by the nutation in right
+    # ascension, using the true obliquity of the date. That correction is
+    # -3.868*cos(eps)/15.0 seconds of time, i.e., -3.868*cos(eps) arcseconds
     eps = Angle(23, 26, 36.87)
-    delta = Angle(0, 0, ((-3.868*cos(eps.rad()))/15.0), ra=True)
-    theta0 += delta
-    h = theta0 - lon - ra
-    azi, ele = equatorial2horizontal(h, dec, lat)
+    theta0 = Angle(8, 34, 57.0896, ra=True)() - 3.868*cos(eps.rad())/3600.0
+    # Chain the hour angle in degrees, and build a single Angle at the end
+    h = Angle(theta0 - lon() - ra())
+    azi, ele = equatorial2horizontal(h, dec, washington_lat)
 
-    assert abs(round(azi, 3) - 68.034) < TOL, \
+    assert abs(azi - 68.034) < 5e-4, \
         "ERROR: 1st equatorial2horizontal() test, 'azimuth' doesn't match"
 
-    assert abs(round(ele, 3) - 15.125) < TOL, \
+    assert abs(ele - 15.125) < 5e-4, \
         "ERROR: 2nd equatorial2horizontal() test, 'elevation' doesn't match"
 
 
@@ -242,13 +296,12 @@ def test_coordinates_horizontal2equatorial():
 
     azi = Angle(68.0337)
     ele = Angle(15.1249)
-    lat = Angle(38, 55, 17)
-    h, dec = horizontal2equatorial(azi, ele, lat)
+    h, dec = horizontal2equatorial(azi, ele, washington_lat)
 
-    assert abs(round(h, 4) - 64.3521) < TOL, \
+    assert abs(h - 64.3521) < 5e-5, \
         "ERROR: 1st horizontal2equatorial() test, 'hour angle' doesn't match"
 
-    assert dec.dms_str(n_dec=0) == "-6d 43' 12.0''", \
+    assert abs(dec - Angle(-6, 43, 12.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd horizontal2equatorial() test, 'declination' match"
 
 
@@ -259,10 +312,10 @@ def test_coordinates_equatorial2galactic():
     dec = Angle(-14, 43, 8.2)
     lon, lat = equatorial2galactic(ra, dec)
 
-    assert abs(round(lon, 4) - 12.9593) < TOL, \
+    assert abs(lon - 12.9593) < 5e-5, \
         "ERROR: 1st equatorial2galactic() test, 'longitude' doesn't match"
 
-    assert abs(round(lat, 4) - 6.0463) < TOL, \
+    assert abs(lat - 6.0463) < 5e-5, \
         "ERROR: 2nd equatorial2galactic() test, 'latitude' doesn't match"
 
 
@@ -273,13 +326,39 @@ def test_coordinates_galactic2equatorial():
     lat = Angle(6.0463)
     ra, dec = galactic2equatorial(lon, lat)
 
-    assert ra.ra_str(n_dec=1) == "17h 48' 59.7''", \
+    assert abs(ra - Angle(17, 48, 59.7, ra=True)) < 0.05 / 240.0, \
         "ERROR: 1st galactic2equatorial() test, 'ra' doesn't match"
 
-    assert dec.dms_str(n_dec=0) == "-14d 43' 8.0''", \
+    assert abs(dec - Angle(-14, 43, 8.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd galactic2equatorial() test, 'declination' doesn't match"
 
 
+@pytest.mark.parametrize("forward, backward", [
+    (lambda a, b: equatorial2ecliptical(a, b, epsilon_j2000),
+     lambda a, b: ecliptical2equatorial(a, b, epsilon_j2000)),
+    (equatorial2galactic, galactic2equatorial),
+    (lambda a, b: equatorial2horizontal(a, b, washington_lat),
+     lambda a, b: horizontal2equatorial(a, b, washington_lat)),
+], ids=["ecliptical", "galactic", "horizontal"])
+def test_coordinates_transformations_round_trip(forward, backward):
+    """Tests that the coordinate transformations of Coordinates module give
+    back the original coordinates when applied forwards and backwards over a
+    grid of points covering the whole sky"""
+
+    for i in range(24):
+        for j in range(-4, 5):
+            x = Angle(i * 15.0 + 7.5)
+            y = Angle(j * 20.0 + 3.0)
+            u, v = forward(x, y)
+            xx, yy = backward(u, v)
+
+            assert abs((xx() - x() + 180.0) % 360.0 - 180.0) < TOL, \
+                "ERROR: round trip test, 1st coordinate doesn't match"
+
+            assert abs(yy() - y()) < TOL, \
+                "ERROR: round trip test, 2nd coordinate doesn't match"
+
+
 def test_coordinates_parallactic_angle():
     """Tests the parallactic_angle() method of Coordinates module"""
 
@@ -288,7 +367,7 @@ def test_coordinates_parallactic_angle():
     latitude = Angle(50.0)
     q = parallactic_angle(hour_angle, declination, latitude)
 
-    assert q.dms_str(n_dec=1) == "0d 0' 0.0''", \
+    assert abs(q - Angle(0, 0, 0.0)) < 0.05 / 3600.0, \
         "ERROR: 1st parallactic_angle() test, 'lon1' doesn't match"
 
 
@@ -300,13 +379,13 @@ def test_coordinates_ecliptic_horizon():
     epsilon = Angle(23.44)
     lon1, lon2, i = ecliptic_horizon(sidereal_time, lat, epsilon)
 
-    assert lon1.dms_str(n_dec=1) == "169d 21' 29.9''", \
+    assert abs(lon1 - Angle(169, 21, 29.9)) < 0.05 / 3600.0, \
         "ERROR: 1st ecliptic_horizon() test, 'lon1' doesn't match"
 
-    assert lon2.dms_str(n_dec=1) == "349d 21' 29.9''", \
+    assert abs(lon2 - Angle(349, 21, 29.9)) < 0.05 / 3600.0, \
         "ERROR: 2nd ecliptic_horizon() test, 'lon2' doesn't match"
 
-    assert abs(round(i, 0) - 62.0) < TOL, \
+    assert abs(i - 62.0) < 0.5, \
         "ERROR: 3rd ecliptic_horizon() test, 'i' angle doesn't match"
 
 
@@ -318,7 +397,7 @@ def test_coordinates_ecliptic_equator():
     eps = Angle(23.5)
     ang_ecl_equ = ecliptic_equator(lon, lat, eps)
 
-    assert ang_ecl_equ.dms_str(n_dec=1) == "156d 30' 0.0''", \
+    assert abs(ang_ecl_equ - Angle(156, 30, 0.0)) < 0.05 / 3600.0, \
         "ERROR: 1st ecliptic_equator() test, 'ang_ecl_equ' doesn't match"
 
 
@@ -329,7 +408,7 @@ def test_coordinates_diurnal_path_horizon():
     lat = Angle(40.0)
     j = diurnal_path_horizon(dec, lat)
 
-    assert j.dms_str(n_dec=1) == "45d 31' 28.4''", \
+    assert abs(j - Angle(45, 31, 28.4)) < 0.05 / 3600.0, \
         "ERROR: 1st diurnal_path_horizon() test, 'j' angle doesn't match"
 
 
@@ -353,13 +432,13 @@ def test_coordinates_times_rise_transit_set():
                                                       alpha3, delta3, h0,
                                                       delta_t, theta0)
 
-    assert abs(round(rising, 4) - 12.4238) < TOL, \
+    assert abs(rising - 12.4238) < 5e-5, \
         "ERROR: 1st times_rise_transit_set() test, 'rising' time doesn't match"
 
-    assert abs(round(transit, 3) - 19.675) < TOL, \
+    assert abs(transit - 19.675) < 5e-4, \
         "ERROR: 2nd times_rise_transit_set() test, 'transit' doesn't match"
 
-    assert abs(round(setting, 3) - 2.911) < TOL, \
+    assert abs(setting - 2.911) < 5e-4, \
         "ERROR: 3rd times_rise_transit_set() test, 'setting' doesn't match"
 
 
@@ -369,7 +448,7 @@ def test_coordinates_refraction_apparent2true():
     apparent_elevation = Angle(0, 30, 0.0)
     true = refraction_apparent2true(apparent_elevation)
 
-    assert true.dms_str(n_dec=1) == "1' 14.7''", \
+    assert abs(true - Angle(0, 1, 14.7)) < 0.05 / 3600.0, \
         "ERROR: 1st refraction_apparent2true() test, 'true' doesn't match"
 
 
@@ -379,7 +458,7 @@ def test_coordinates_refraction_true2apparent():
     true_elevation = Angle(0, 33, 14.76)
     apparent = refraction_true2apparent(true_elevation)
 
-    assert apparent.dms_str(n_dec=2) == "57' 51.96''", \
+    assert abs(apparent - Angle(0, 57, 51.96)) < 0.005 / 3600.0, \
         "ERROR: 1st refraction_true2apparent() test, 'apparent' doesn't match"
 
 
@@ -392,7 +471,7 @@ def test_coordinates_angular_separation():
     delta2 = Angle(-11, 9, 41.0)
     sep_ang = angular_separation(alpha1, delta1, alpha2, delta2)
 
-    assert abs(round(sep_ang, 3) - 32.793) < TOL, \
+    assert abs(sep_ang - 32.793) < 5e-4, \
         "ERROR: 1st angular_separation() test, 'sep_ang' value doesn't match"
 
 
@@ -415,10 +494,10 @@ def test_coordinates_minimum_angular_separation():
                                       alpha1_3, delta1_3, alpha2_1, delta2_1,
                                       alpha2_2, delta2_2, alpha2_3, delta2_3)
 
-    assert abs(round(n, 6) + 0.370726) < TOL, \
+    assert abs(n + 0.370726) < 5e-7, \
         "ERROR: 1st minimum_angular_separation() test, 'n' value doesn't match"
 
-    assert d.dms_str(n_dec=0) == "3' 44.0''", \
+    assert abs(d - Angle(0, 3, 44.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd minimum_angular_separation() test, 'd' value doesn't match"
 
 
@@ -431,7 +510,7 @@ def test_coordinates_relative_position_angle():
     delta2 = Angle(-11, 9, 41.0)
     pos_ang = relative_position_angle(alpha1, delta1, alpha2, delta2)
 
-    assert abs(round(pos_ang, 1) - 0.0) < TOL, \
+    assert abs(pos_ang - 0.0) < 0.05, \
         "ERROR: 1st relative_position_angle() test, 'pos_ang' doesn't match"
 
     alpha1 = Angle(14, 15, 39.7, ra=True)
@@ -440,7 +519,7 @@ def test_coordinates_relative_position_angle():
     delta2 = Angle(11, 9, 41.0)
     pos_ang = relative_position_angle(alpha1, delta1, alpha2, delta2)
 
-    assert abs(round(pos_ang, 1) - 180.0) < TOL, \
+    assert abs(pos_ang - 180.0) < 0.05, \
         "ERROR: 2nd relative_position_angle() test, 'pos_ang' doesn't match"
 
 
@@ -474,10 +553,10 @@ def test_coordinates_planetary_conjunction():
     pc = planetary_conjunction(alpha1_list, delta1_list,
                                alpha2_list, delta2_list)
 
-    assert abs(round(pc[0], 5) - 0.23797) < TOL, \
+    assert abs(pc[0] - 0.23797) < 5e-6, \
         "ERROR: 1st planetary_conjunction() test, 'pc[0]' doesn't match"
 
-    assert pc[1].dms_str(n_dec=1) == "2d 8' 21.8''", \
+    assert abs(pc[1] - Angle(2, 8, 21.8)) < 0.05 / 3600.0, \
         "ERROR: 2nd planetary_conjunction() test, 'pc[1]' doesn't match"
 
 
@@ -501,10 +580,10 @@ def test_coordinates_planet_star_conjunction():
     pc = planet_star_conjunction(alpha_list, delta_list,
                                  alpha_star, delta_star)
 
-    assert abs(round(pc[0], 4) - 0.2551) < TOL, \
+    assert abs(pc[0] - 0.2551) < 5e-5, \
         "ERROR: 1st planet_star_conjunction() test, 'pc[0]' doesn't match"
 
-    assert pc[1].dms_str(n_dec=0) == "3' 38.0''", \
+    assert abs(pc[1] - Angle(0, 3, 38.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd planet_star_conjunction() test, 'pc[1]' doesn't match"
 
 
@@ -530,7 +609,7 @@ def test_coordinates_planet_stars_in_line():
     n = planet_stars_in_line(alpha_list, delta_list, alpha_star1, delta_star1,
                              alpha_star2, delta_star2)
 
-    assert abs(round(n, 4) - 0.2233) < TOL, \
+    assert abs(n - 0.2233) < 5e-5, \
         "ERROR: 1st planet_stars_in_line() test, 'n' value doesn't match"
 
 
@@ -545,10 +624,10 @@ def test_coordinates_straight_line():
     delta3 = Angle(-1, 56, 33.3)
     psi, omega = straight_line(alpha1, delta1, alpha2, delta2, alpha3, delta3)
 
-    assert psi.dms_str(n_dec=0) == "7d 31' 1.0''", \
+    assert abs(psi - Angle(7, 31, 1.0)) < 0.5 / 3600.0, \
         "ERROR: 1st straight_line() test, 'psi' value doesn't match"
 
-    assert omega.dms_str(n_dec=0) == "-5' 24.0''", \
+    assert abs(omega - Angle(0, -5, 24.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd straight_line() test, 'omega' value doesn't match"
 
 
@@ -563,7 +642,7 @@ def test_coordinates_circle_diameter():
     delta3 = Angle(-1, 50,  3.7)
     d = circle_diameter(alpha1, delta1, alpha2, delta2, alpha3, delta3)
 
-    assert d.dms_str(n_dec=0) == "4d 15' 49.0''", \
+    assert abs(d - Angle(4, 15, 49.0)) < 0.5 / 3600.0, \
         "ERROR: 1st circle_diameter() test, 'd' value doesn't match"
 
     alpha1 = Angle(9,  5, 41.44, ra=True)
@@ -574,23 +653,22 @@ def test_coordinates_circle_diameter():
     delta3 = Angle(17, 49, 36.8)
     d = circle_diameter(alpha1, delta1, alpha2, delta2, alpha3, delta3)
 
-    assert d.dms_str(n_dec=0) == "2d 18' 38.0''", \
+    assert abs(d - Angle(2, 18, 38.0)) < 0.5 / 3600.0, \
         "ERROR: 2nd circle_diameter() test, 'd' value doesn't match"
 
 
 def test_coordinates_apparent_position():
     """Tests the apparent_position() method of Coordinates module"""
 
-    epoch = Epoch(2028, 11, 13.19)
-    alpha = Angle(2, 46, 11.331, ra=True)
-    delta = Angle(49, 20, 54.54)
+    # Start from the mean position precessed in setup_module()
     sun_lon = Angle(231.328)
-    app_alpha, app_delta = apparent_position(epoch, alpha, delta, sun_lon)
+    app_alpha, app_delta = apparent_position(epoch_2028, theta_persei_ra,
+                                             theta_persei_dec, sun_lon)
 
-    assert app_alpha.ra_str(n_dec=2) == "2h 46' 14.39''", \
+    assert abs(app_alpha - Angle(2, 46, 14.39, ra=True)) < 0.005 / 240.0, \
         "ERROR: 1st apparent_position() test, 'app_alpha' value doesn't match"
 
-    assert app_delta.dms_str(n_dec=2) == "49d 21' 7.45''", \
+    assert abs(app_delta - Angle(49, 21, 7.45)) < 0.005 / 3600.0, \
         "ERROR: 2nd apparent_position() test, 'app_delta' value doesn't match"
 
 
@@ -604,13 +682,13 @@ def test_coordinates_orbital_equinox2equinox():
     lon0 = Angle(45.7481)
     i1, arg1, lon1 = orbital_equinox2equinox(epoch0, epoch, i0, arg0, lon0)
 
-    assert abs(round(i1(), 3) - 47.138) < TOL, \
+    assert abs(i1() - 47.138) < 5e-4, \
         "ERROR: 1st orbital_equinox2equinox() test, 'i1' value doesn't match"
 
-    assert abs(round(arg1(), 4) - 151.4782) < TOL, \
+    assert abs(arg1() - 151.4782) < 5e-5, \
         "ERROR: 2nd orbital_equinox2equinox() test, 'arg1' value doesn't match"
 
-    assert abs(round(lon1(), 4) - 48.6037) < TOL, \
+    assert abs(lon1() - 48.6037) < 5e-5, \
         "ERROR: 3rd orbital_equinox2equinox() test, 'lon1' value doesn't match"
 
 
@@ -621,24 +699,31 @@ def test_coordinates_kepler_equation():
     e2, v2 = kepler_equation(0.99, Angle(1.0))
     e3, v3 = kepler_equation(0.99, Angle(0.2, radians=True))
 
-    assert abs(round(e1(), 6) - 5.554589) < TOL, \
+    assert abs(e1() - 5.554589) < 5e-7, \
         "ERROR: 1st kepler_equation() test, 'e1' value doesn't match"
 
-    assert abs(round(v1(), 6) - 6.139762) < TOL, \
+    assert abs(v1() - 6.139762) < 5e-7, \
         "ERROR: 2nd kepler_equation() test, 'v1' value doesn't match"
 
-    assert abs(round(e2(), 6) - 24.725822) < TOL, \
+    assert abs(e2() - 24.725822) < 5e-7, \
         "ERROR: 3rd kepler_equation() test, 'e2' value doesn't match"
 
-    assert abs(round(v2(), 6) - 144.155952) < TOL, \
+    assert abs(v2() - 144.155952) < 5e-7, \
         "ERROR: 4th kepler_equation() test, 'v2' value doesn't match"
 
-    assert abs(round(e3(), 8) - 61.13444578) < TOL, \
+    assert abs(e3() - 61.13444578) < 5e-9, \
         "ERROR: 5th kepler_equation() test, 'e3' value doesn't match"
 
-    assert abs(round(v3(), 6) - 166.311977) < TOL, \
+    assert abs(v3() - 166.311977) < 5e-7, \
         "ERROR: 6th kepler_equation() test, 'v3' value doesn't match"
 
+    # Small eccentricities use Newton's method, which must also solve the
+    # equation for mean anomalies beyond 180 degrees
+    e4, v4 = kepler_equation(0.25, Angle(200.0))
+    m4 = e4.rad() - 0.25 * sin(e4.rad())
+    assert abs(Angle(m4, radians=True).to_positive() - 200.0) < TOL, \
+        "ERROR: 7th kepler_equation() test, 'e4' value doesn't match"
+
 
 def test_coordinates_velocity():
     """Tests the velocity() function of Coordinates module"""
@@ -647,7 +732,7 @@ def test_coordinates_velocity():
     a = 17.9400782
     v = velocity(r, a)
 
-    assert abs(round(v, 2) - 41.53) < TOL, \
+    assert abs(v - 41.53) < 0.005, \
         "ERROR: 1st velocity() test, value doesn't match"
 
 
@@ -658,7 +743,7 @@ def test_coordinates_velocity_perihelion():
     e = 0.96727426
     vp = velocity_perihelion(e, a)
 
-    assert abs(round(vp, 2) - 54.52) < TOL, \
+    assert abs(vp - 54.52) < 0.005, \
         "ERROR: 1st velocity_perihelion() test, value doesn't match"
 
 
@@ -669,7 +754,7 @@ def test_coordinates_velocity_aphelion():
     e = 0.96727426
     va = velocity_aphelion(e, a)
 
-    assert abs(round(va, 2) - 0.91) < TOL, \
+    assert abs(va - 0.91) < 0.005, \
         "ERROR: 1st velocity_aphelion() test, value doesn't match"
 
 
@@ -680,7 +765,7 @@ def test_coordinates_length_orbit():
     e = 0.96727426
     length = length_orbit(e, a)
 
-    assert abs(round(length, 2) - 77.06) < TOL, \
+    assert abs(length - 77.06) < 0.005, \
         "ERROR: 1st length_orbit() test, value doesn't match"
 
 
@@ -700,10 +785,10 @@ def test_coordinates_passage_nodes_elliptic():
     assert abs(month - 11) < TOL, \
         "ERROR: 2nd passage_nodes_elliptic() test, value doesn't match"
 
-    assert abs(round(day, 2) - 9.16) < TOL, \
+    assert abs(day - 9.16) < 0.005, \
         "ERROR: 3rd passage_nodes_elliptic() test, value doesn't match"
 
-    assert abs(round(r, 4) - 1.8045) < TOL, \
+    assert abs(r - 1.8045) < 5e-5, \
         "ERROR: 4th passage_nodes_elliptic() test, value doesn't match"
 
     time, r = passage_nodes_elliptic(omega, e, a, t, ascending=False)
@@ -715,10 +800,10 @@ def test_coordinates_passage_nodes_elliptic():
     assert abs(month - 3) < TOL, \
         "ERROR: 6th passage_nodes_elliptic() test, value doesn't match"
 
-    assert abs(round(day, 2) - 10.37) < TOL, \
+    assert abs(day - 10.37) < 0.005, \
         "ERROR: 7th passage_nodes_elliptic() test, value doesn't match"
 
-    assert abs(round(r, 4) - 0.8493) < TOL, \
+    assert abs(r - 0.8493) < 5e-5, \
         "ERROR: 8th passage_nodes_elliptic() test, value doesn't match"
 
 
@@ -737,10 +822,10 @@ def test_coordinates_passage_nodes_parabolic():
     assert abs(month - 9) < TOL, \
         "ERROR: 2nd passage_nodes_parabolic() test, value doesn't match"
 
-    assert abs(round(day, 2) - 17.64) < TOL, \
+    assert abs(day - 17.64) < 0.005, \
         "ERROR: 3rd passage_nodes_parabolic() test, value doesn't match"
 
-    assert abs(round(r, 4) - 28.0749) < TOL, \
+    assert abs(r - 28.0749) < 5e-5, \
         "ERROR: 4th passage_nodes_parabolic() test, value doesn't match"
 
     time, r = passage_nodes_parabolic(omega, q, t, ascending=False)
@@ -752,10 +837,10 @@ def test_coordinates_passage_nodes_parabolic():
     assert abs(month - 9) < TOL, \
         "ERROR: 6th passage_nodes_parabolic() test, value doesn't match"
 
-    assert abs(round(day, 3) - 17.636) < TOL, \
+    assert abs(day - 17.636) < 5e-4, \
         "ERROR: 7th passage_nodes_parabolic() test, value doesn't match"
 
-    assert abs(round(r, 4) - 1.3901) < TOL, \
+    assert abs(r - 1.3901) < 5e-5, \
         "ERROR: 8th passage_nodes_parabolic() test, value doesn't match"
 
 
@@ -767,7 +852,7 @@ def test_coordinates_phase_angle():
     sun_earth_dist = 0.983824
     angle = phase_angle(sun_dist, earth_dist, sun_earth_dist)
 
-    assert abs(round(angle, 2) - 72.96) < TOL, \
+    assert abs(angle - 72.96) < 0.005, \
         "ERROR: 1st phase_angle() test, value doesn't match"
 
 
@@ -779,5 +864,48 @@ def test_coordinates_illuminated_fraction():
     sun_earth_dist = 0.983824
     k = illuminated_fraction(sun_dist, earth_dist, sun_earth_dist)
 
-    assert abs(round(k, 3) - 0.647) < TOL, \
+    assert abs(k - 0.647) < 5e-4, \
         "ERROR: 1st illuminated_fraction() test, value doesn't match"
+
+
+def test_coordinates_vsop_truncation():
+    """Tests set_vsop_truncation() and get_vsop_truncation() functions of
+    Coordinates module"""
+
+    epoch = Epoch(1992, 10, 13.0)
+    lon0, lat0, r0 = Earth.geometric_heliocentric_position(epoch)
+
+    assert get_vsop_truncation() == 0.0, \
+        "ERROR: 1st get_vsop_truncation() test, output doesn't match"
+
+    try:
+        set_vsop_truncation(1e-8)
+        assert get_vsop_truncation() == 1e-8, \
+            "ERROR: 2nd get_vsop_truncation() test, output doesn't match"
+
+        lon, lat, r = Earth.geometric_heliocentric_position(epoch)
+        # The error must stay below 0.1 arcseconds
+        assert abs(lon - lon0) < 0.1 / 3600.0, \
+            "ERROR: 1st set_vsop_truncation() test, 'lon' doesn't match"
+
+        assert abs(lat - lat0) < 0.1 / 3600.0, \
+            "ERROR: 2nd set_vsop_truncation() test, 'lat' doesn't match"
+
+        assert abs(r - r0) < 1e-6, \
+            "ERROR: 3rd set_vsop_truncation() test, 'r' doesn't match"
+
+        assert r != r0, \
+            "ERROR: 4th set_vsop_truncation() test, terms were not skipped"
+    finally:
+        set_vsop_truncation()
+
+    # Going back to the full series must give the same results as before
+    lon, lat, r = Earth.geometric_heliocentric_position(epoch)
+    assert lon == lon0 and lat == lat0 and r == r0, \
+        "ERROR: 5th set_vsop_truncation() test, output doesn't match"
+
+    with pytest.raises(TypeError):
+        set_vsop_truncation("1e-8")
+
+    with pytest.raises(ValueError):
+        set_vsop_truncation(-1e-8)
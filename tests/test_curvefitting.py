@@ -92,12 +92,25 @@ def test_curvefitting_constructor():
     assert k._y == [-8, 12, 5], \
         "ERROR: 6th constructor test, 'y' values don't match"
 
+    k.linear_fitting()
+    m = CurveFitting(k)
+    assert m._x == [3, 1, 2] and m._y == [-8, 12, 5], \
+        "ERROR: 7th constructor test, copied values don't match"
+
+    assert m.linear_fitting() == k.linear_fitting(), \
+        "ERROR: 8th constructor test, copied fitting doesn't match"
+
+    # The copy must not share its data tables with the original
+    m._x.append(7)
+    assert k._x == [3, 1, 2], \
+        "ERROR: 9th constructor test, original values were modified"
+
 
 def test_curvefitting_correlation_coeff():
     """Tests the correlation_coeff() method of CurveFitting class"""
 
     r = cf1.correlation_coeff()
-    assert abs(round(r, 3) - (-0.767)) < TOL, \
+    assert abs(r - (-0.767)) < 5e-4, \
         "ERROR: 1st correlation_coeff() test, 'r' value doesn't match"
 
 
@@ -105,31 +118,39 @@ def test_curvefitting_linear_fitting():
     """Tests the linear_fitting() method of CurveFitting class"""
 
     a, b = cf1.linear_fitting()
-    assert abs(round(a, 2) - (-2.49)) < TOL, \
+    assert abs(a - (-2.49)) < 0.005, \
         "ERROR: In 1st linear_fitting() test, 'a' value doesn't match"
 
-    assert abs(round(b, 2) - 244.18) < TOL, \
+    assert abs(b - 244.18) < 0.005, \
         "ERROR: In 2nd linear_fitting() test, 'b' value doesn't match"
 
     a, b = cf2.linear_fitting()
-    assert abs(round(a, 2) - 13.67) < TOL, \
+    assert abs(a - 13.67) < 0.005, \
         "ERROR: In 3rd linear_fitting() test, 'a' value doesn't match"
 
-    assert abs(round(b, 2) - 7.03) < TOL, \
+    assert abs(b - 7.03) < 0.005, \
         "ERROR: In 4th linear_fitting() test, 'b' value doesn't match"
 
+    # The parameters must be recomputed when the data changes
+    cf = CurveFitting([0.0, 1.0, 2.0], [1.0, 3.0, 5.0])
+    a, b = cf.linear_fitting()
+    cf.set([0.0, 1.0, 2.0], [2.0, 3.0, 4.0])
+    a, b = cf.linear_fitting()
+    assert abs(a - 1.0) < TOL and abs(b - 2.0) < TOL, \
+        "ERROR: In 5th linear_fitting() test, output doesn't match"
+
 
 def test_curvefitting_quadratic_fitting():
     """Tests the quadratic_fitting() method of CurveFitting class"""
 
     a, b, c = cf3.quadratic_fitting()
-    assert abs(round(a, 2) - (-2.22)) < TOL, \
+    assert abs(a - (-2.22)) < 0.005, \
         "ERROR: In 1st quadratic_fitting() test, 'a' value doesn't match"
 
-    assert abs(round(b, 2) - 3.76) < TOL, \
+    assert abs(b - 3.76) < 0.005, \
         "ERROR: In 2nd quadratic_fitting() test, 'b' value doesn't match"
 
-    assert abs(round(c, 2) - 6.64) < TOL, \
+    assert abs(c - 6.64) < 0.005, \
         "ERROR: In 3rd quadratic_fitting() test, 'c' value doesn't match"
 
 
@@ -147,23 +168,40 @@ def test_curvefitting_general_fitting():
         return sin(radians(3.0*x))
 
     a, b, c = cf4.general_fitting(sin1, sin2, sin3)
-    assert abs(round(a, 2) - 1.2) < TOL, \
+    assert abs(a - 1.2) < 0.005, \
         "ERROR: In 1st general_fitting() test, 'a' value doesn't match"
 
-    assert abs(round(b, 2) - (-0.77)) < TOL, \
+    assert abs(b - (-0.77)) < 0.005, \
         "ERROR: In 2nd general_fitting() test, 'b' value doesn't match"
 
-    assert abs(round(c, 2) - 0.39) < TOL, \
+    assert abs(c - 0.39) < 0.005, \
         "ERROR: In 3rd general_fitting() test, 'c' value doesn't match"
 
     cf5 = CurveFitting([0, 1.2, 1.4, 1.7, 2.1, 2.2])
 
     a, b, c = cf5.general_fitting(sqrt)
-    assert abs(round(a, 3) - 1.016) < TOL, \
+    assert abs(a - 1.016) < 5e-4, \
         "ERROR: In 4th general_fitting() test, 'a' value doesn't match"
 
-    assert abs(round(b, 3) - 0.0) < TOL, \
+    assert abs(b - 0.0) < 5e-4, \
         "ERROR: In 5th general_fitting() test, 'b' value doesn't match"
 
-    assert abs(round(c, 3) - 0.0) < TOL, \
+    assert abs(c - 0.0) < 5e-4, \
         "ERROR: In 6th general_fitting() test, 'c' value doesn't match"
+
+    # Fitting again with the same functions must give the same result
+    a2, b2, c2 = cf5.general_fitting(sqrt)
+    assert abs(a2 - a) < TOL and abs(b2 - b) < TOL and abs(c2 - c) < TOL, \
+        "ERROR: In 7th general_fitting() test, repeated fit doesn't match"
+
+    # Changing the data must not reuse the previous results
+    cf5.set([0, 2.4, 2.8, 3.4, 4.2, 4.4])
+    a, b, c = cf5.general_fitting(sqrt)
+    assert abs(a - 2.032) < 5e-4, \
+        "ERROR: In 8th general_fitting() test, 'a' value doesn't match"
+
+    # Fitting with other functions in between must not affect the result
+    cf5.general_fitting(lambda x: x)
+    a2, b2, c2 = cf5.general_fitting(sqrt)
+    assert abs(a2 - a) < TOL and abs(b2 - b) < TOL and abs(c2 - c) < TOL, \
+        "ERROR: In 9th general_fitting() test, fit after other basis differs"
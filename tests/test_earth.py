@@ -24,6 +24,29 @@ from pymeeus.Angle import Angle
 from pymeeus.Epoch import Epoch
 
 
+# Declare some objects to be used later
+earth_iau76 = Earth()
+lat_33 = Angle()
+epoch_1992 = Epoch()
+
+
+def setup_module():
+    """This function is used to set up the environment for the tests"""
+    # Several tests share these objects, so build them only once
+    earth_iau76.set(IAU76)
+    lat_33.set(33, 21, 22.0)
+    epoch_1992.set(1992, 10, 13.0)
+
+
+def teardown_module():
+    pass
+
+
+# pre pytest 7.2 ompatibility
+setup = setup_module
+teardown = teardown_module
+
+
 # Earth class
 
 def test_earth_constructor():
@@ -61,59 +84,65 @@ def test_earth_rho():
 def test_earth_rho_sinphi():
     """Tests the rho_sinphi() method of Earth class"""
 
-    lat = Angle(33, 21, 22.0)
-    e = Earth(ellipsoid=IAU76)
-    assert abs(round(e.rho_sinphi(lat, 1706), 6) - 0.546861) < TOL, \
+    lat = lat_33
+    e = earth_iau76
+    assert abs(e.rho_sinphi(lat, 1706) - 0.546861) < 5e-7, \
         "ERROR: 1st rho_sinphi() test, output doesn't match"
 
 
 def test_earth_rho_cosphi():
     """Tests the rho_cosphi() method of Earth class"""
 
-    lat = Angle(33, 21, 22.0)
-    e = Earth(ellipsoid=IAU76)
-    assert abs(round(e.rho_cosphi(lat, 1706), 6) - 0.836339) < TOL, \
+    lat = lat_33
+    e = earth_iau76
+    assert abs(e.rho_cosphi(lat, 1706) - 0.836339) < 5e-7, \
         "ERROR: 1st rho_cosphi() test, output doesn't match"
 
 
 def test_earth_rp():
     """Tests the rp() method of Earth class"""
 
-    e = Earth(ellipsoid=IAU76)
-    assert abs(round(e.rp(42.0), 1) - 4747001.2) < TOL, \
+    e = earth_iau76
+    assert abs(e.rp(42.0) - 4747001.2) < 0.05, \
         "ERROR: 1st rp() test, output doesn't match"
 
+    # Changing the ellipsoid must also update the cached derived parameters
+    e = Earth()
+    e.set(IAU76)
+    assert abs(e.rp(42.0) - 4747001.2) < 0.05, \
+        "ERROR: 2nd rp() test, output doesn't match"
+
 
 def test_earth_rm():
     """Tests the rm() method of Earth class"""
 
-    e = Earth(ellipsoid=IAU76)
-    assert abs(round(e.rm(42.0), 1) - 6364033.3) < TOL, \
+    e = earth_iau76
+    assert abs(e.rm(42.0) - 6364033.3) < 0.05, \
         "ERROR: 1st rm() test, output doesn't match"
 
 
 def test_earth_linear_velocity():
     """Tests the linear_velocity() method of Earth class"""
 
-    e = Earth(ellipsoid=IAU76)
-    assert abs(round(e.linear_velocity(42.0), 2) - 346.16) < TOL, \
+    e = earth_iau76
+    assert abs(e.linear_velocity(42.0) - 346.16) < 0.005, \
         "ERROR: 1st linear_velocity() test, output doesn't match"
 
 
 def test_earth_distance():
     """Tests the distance() method of Earth class"""
 
-    e = Earth(ellipsoid=IAU76)
+    e = earth_iau76
     lon1 = Angle(-2, 20, 14.0)
     lat1 = Angle(48, 50, 11.0)
     lon2 = Angle(77, 3, 56.0)
     lat2 = Angle(38, 55, 17.0)
     dist, error = e.distance(lon1, lat1, lon2, lat2)
 
-    assert abs(round(dist, 0) - 6181628.0) < TOL, \
+    assert abs(dist - 6181628.0) < 0.5, \
         "ERROR: 1st distance() test, output doesn't match"
 
-    assert abs(round(error, 0) - 69.0) < TOL, \
+    assert abs(error - 69.0) < 0.5, \
         "ERROR: 2nd distance() test, output doesn't match"
 
     lon1 = Angle(-2.09)
@@ -122,42 +151,77 @@ def test_earth_distance():
     lat2 = Angle(40.75)
     dist, error = e.distance(lon1, lat1, lon2, lat2)
 
-    assert abs(round(dist, 0) - 6176760.0) < TOL, \
+    assert abs(dist - 6176760.0) < 0.5, \
         "ERROR: 3rd distance() test, output doesn't match"
 
-    assert abs(round(error, 0) - 69.0) < TOL, \
+    assert abs(error - 69.0) < 0.5, \
         "ERROR: 4th distance() test, output doesn't match"
 
+    # Coincident and antipodal points are handled without numerical problems
+    dist, error = e.distance(10.0, 20.0, 10.0, 20.0)
+    assert dist == 0.0 and error == 0.0, \
+        "ERROR: 5th distance() test, output doesn't match"
+
+    dist, error = e.distance(0.0, 0.0, 180.0, 0.0)
+    assert abs(dist - 20037518.0) < 0.5, \
+        "ERROR: 6th distance() test, output doesn't match"
+
+
+def test_earth_distance_batch():
+    """Tests the distance_batch() method of Earth class"""
+
+    e = earth_iau76
+    lon1 = [Angle(-2, 20, 14.0), -2.09]
+    lat1 = [Angle(48, 50, 11.0), 41.3]
+    lon2 = [Angle(77, 3, 56.0), 73.99]
+    lat2 = [Angle(38, 55, 17.0), 40.75]
+    dist, error = e.distance_batch(lon1, lat1, lon2, lat2)
+
+    assert abs(dist[0] - 6181628.0) < 0.5, \
+        "ERROR: 1st distance_batch() test, output doesn't match"
+
+    assert abs(dist[1] - 6176760.0) < 0.5, \
+        "ERROR: 2nd distance_batch() test, output doesn't match"
+
+    assert error == [69.0, 69.0], \
+        "ERROR: 3rd distance_batch() test, output doesn't match"
+
+    # The results must match those of the scalar method
+    for i in range(2):
+        assert (dist[i], error[i]) == e.distance(lon1[i], lat1[i],
+                                                 lon2[i], lat2[i]), \
+            "ERROR: 4th distance_batch() test, output doesn't match"
+
 
 def test_earth_geometric_heliocentric_position():
     """Tests the geometric_heliocentric_position() method of Earth class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     lon, lat, r = Earth.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 6) - 19.907272) < TOL, \
+    assert abs(lon.to_positive() - 19.907272) < 5e-7, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
     assert lat.dms_str(n_dec=3) == "-0.721''", \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 8) - 0.99760852) < TOL, \
+    assert abs(r - 0.99760852) < 5e-9, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
 def test_earth_apparent_heliocentric_position():
     """Tests the apparent_heliocentric_position() method of Earth class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     lon, lat, r = Earth.apparent_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 6) - 19.905986) < TOL, \
+    assert abs(lon.to_positive() - 19.905986) < 5e-7, \
         "ERROR: 1st apparent_heliocentric_position() test doesn't match"
 
     assert lat.dms_str(n_dec=3) == "-0.721''", \
         "ERROR: 2nd apparent_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 8) - 0.99760852) < TOL, \
+    assert abs(r - 0.99760852) < 5e-9, \
         "ERROR: 3rd apparent_heliocentric_position() test doesn't match"
 
 
@@ -167,22 +231,22 @@ def test_earth_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Earth.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 272.716028) < TOL, \
+    assert abs(l - 272.716028) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 1.00000102) < TOL, \
+    assert abs(a - 1.00000102) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0166811) < TOL, \
+    assert abs(e - 0.0166811) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 0.0) < TOL, \
+    assert abs(i) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 174.71534) < TOL, \
+    assert abs(ome - 174.71534) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - (-70.651889)) < TOL, \
+    assert abs(arg - (-70.651889)) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -192,22 +256,22 @@ def test_earth_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Earth.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 271.801199) < TOL, \
+    assert abs(l - 271.801199) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 1.00000102) < TOL, \
+    assert abs(a - 1.00000102) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0166811) < TOL, \
+    assert abs(e - 0.0166811) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 0.008544) < TOL, \
+    assert abs(i - 0.008544) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 174.71534) < TOL, \
+    assert abs(ome - 174.71534) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - (-71.566717)) < TOL, \
+    assert abs(arg - (-71.566717)) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -259,8 +323,6 @@ def test_earth_passage_nodes():
     epoch = Epoch(2019, 1, 1)
     time, r = Earth.passage_nodes(epoch)
     y, m, d = time.get_date()
-    d = round(d, 1)
-    r = round(r, 4)
 
     assert abs(y - 2019) < TOL, \
         "ERROR: 1st passage_nodes() test doesn't match"
@@ -268,10 +330,10 @@ def test_earth_passage_nodes():
     assert abs(m - 3) < TOL, \
         "ERROR: 2nd passage_nodes() test doesn't match"
 
-    assert abs(d - 15.0) < TOL, \
+    assert abs(d - 15.0) < 0.05, \
         "ERROR: 3rd passage_nodes() test doesn't match"
 
-    assert abs(r - 0.9945) < TOL, \
+    assert abs(r - 0.9945) < 5e-5, \
         "ERROR: 4th passage_nodes() test doesn't match"
 
 
@@ -18,6 +18,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import pytest
+
 from pymeeus.base import TOL
 from pymeeus.Epoch import Epoch, JDE2000, DAY2SEC
 from pymeeus.Angle import Angle
@@ -68,6 +70,15 @@ def test_epoch_constructor():
     assert abs(a - 77.184) < TOL, \
         "ERROR: 9th constructor test, difference value doesn't match"
 
+    # A JDE must be kept exactly, without going through a calendar date
+    a = Epoch(2096372.294792)
+    assert a.jde() == 2096372.294792, \
+        "ERROR: 10th constructor test, JDE value doesn't match"
+
+    a = Epoch(Epoch(2096372.294792))
+    assert a.jde() == 2096372.294792, \
+        "ERROR: 11th constructor test, JDE value doesn't match"
+
 
 def test_epoch_hashable():
     a = Epoch(1987, 6, 19.5)
@@ -75,67 +86,54 @@ def test_epoch_hashable():
     _ = {a: 1}
 
 
-def test_epoch_is_julian():
+@pytest.mark.parametrize("year, month, day, expected", [
+    (1582, 10, 4.99, True),
+    (1582, 10, 5.0, False),
+    (2018, 11, 6.0, False),
+    (-2000, 3, 16.0, True),
+])
+def test_epoch_is_julian(year, month, day, expected):
     """Tests the is_julian() static method of Epoch class"""
 
-    assert Epoch.is_julian(1582, 10, 4.99), \
-        "ERROR: 1st is_julian() test, output doesn't match"
-
-    assert not Epoch.is_julian(1582, 10, 5.0), \
-        "ERROR: 2nd is_julian() test, output doesn't match"
-
-    assert not Epoch.is_julian(2018, 11, 6.0), \
-        "ERROR: 3rd is_julian() test, output doesn't match"
-
-    assert Epoch.is_julian(-2000, 3, 16.0), \
-        "ERROR: 4th is_julian() test, output doesn't match"
+    assert Epoch.is_julian(year, month, day) == expected, \
+        "ERROR: is_julian() test, output doesn't match"
 
 
-def test_epoch_get_month():
+@pytest.mark.parametrize("month, expected", [
+    (10, 10),
+    ('Feb', 2),
+    ('MAR', 3),
+    ('January', 1),
+    ('DECEMBER', 12),
+    ('september', 9),
+    ('may', 5),
+])
+def test_epoch_get_month(month, expected):
     """Test the get_month() static method of Epoch class"""
 
-    assert Epoch.get_month(10) == 10, \
-        "ERROR: 1st get_month() test, output doesn't match"
+    assert Epoch.get_month(month) == expected, \
+        "ERROR: get_month() test, output doesn't match"
 
-    assert Epoch.get_month('Feb') == 2, \
-        "ERROR: 2nd get_month() test, output doesn't match"
 
-    assert Epoch.get_month('MAR') == 3, \
-        "ERROR: 3rd get_month() test, output doesn't match"
-
-    assert Epoch.get_month('January') == 1, \
-        "ERROR: 4th get_month() test, output doesn't match"
-
-    assert Epoch.get_month('DECEMBER') == 12, \
-        "ERROR: 5th get_month() test, output doesn't match"
-
-    assert Epoch.get_month('september') == 9, \
-        "ERROR: 6th get_month() test, output doesn't match"
-
-    assert Epoch.get_month('may') == 5, \
-        "ERROR: 7th get_month() test, output doesn't match"
+def test_epoch_get_month_as_string():
+    """Test the get_month() static method of Epoch class, returning strings"""
 
     assert Epoch.get_month(6, as_string=True) == 'June', \
-        "ERROR: 8th get_month() test, output doesn't match"
+        "ERROR: 1st get_month() as string test, output doesn't match"
 
 
-def test_epoch_is_leap():
+@pytest.mark.parametrize("year, expected", [
+    (1582, False),
+    (1580, True),
+    (2018, False),
+    (2000, True),
+    (-2000, True),
+])
+def test_epoch_is_leap(year, expected):
     """Tests the is_leap() static method of Epoch class"""
 
-    assert not Epoch.is_leap(1582), \
-        "ERROR: 1st is_leap() test, output doesn't match"
-
-    assert Epoch.is_leap(1580), \
-        "ERROR: 2nd is_leap() test, output doesn't match"
-
-    assert not Epoch.is_leap(2018), \
-        "ERROR: 3rd is_leap() test, output doesn't match"
-
-    assert Epoch.is_leap(2000), \
-        "ERROR: 4th is_leap() test, output doesn't match"
-
-    assert Epoch.is_leap(-2000), \
-        "ERROR: 5th is_leap() test, output doesn't match"
+    assert Epoch.is_leap(year) == expected, \
+        "ERROR: is_leap() test, output doesn't match"
 
 
 def test_epoch_get_doy():
@@ -150,92 +148,89 @@ def test_epoch_get_doy():
     assert Epoch.get_doy(-400, 2, 29.9) == 60.9, \
         "ERROR: 3rd get_doy() test, output doesn't match"
 
+    assert Epoch.get_doy(-4, 3, 1) == 61.0, \
+        "ERROR: 4th get_doy() test, output doesn't match"
+
+    assert Epoch.get_doy(-3, 3, 1) == 60.0, \
+        "ERROR: 5th get_doy() test, output doesn't match"
+
+    with pytest.raises(ValueError):
+        Epoch.get_doy(2017, 2, 29)
+
 
 def test_epoch_doy():
     """Tests the doy() method of Epoch class"""
 
     e = Epoch(2017, 12, 31.7)
 
-    assert round(e.doy(), 1) == 365.7, \
+    assert abs(e.doy() - 365.7) < 0.05, \
         "ERROR: 1st doy() test, output doesn't match"
 
 
-def test_epoch_doy2date():
+@pytest.mark.parametrize("year, doy, expected", [
+    (2017, 32, (2017, 2, 1)),
+    (-3, 60, (-3, 3, 1.0)),
+    (-4, 60, (-4, 2, 29.0)),
+])
+def test_epoch_doy2date(year, doy, expected):
     """Tests the doy2date() static method of Epoch class"""
 
-    assert Epoch.doy2date(2017, 32) == (2017, 2, 1), \
-        "ERROR: 1st doy2date() test, output doesn't match"
-
-    assert Epoch.doy2date(-3, 60) == (-3, 3, 1.0), \
-        "ERROR: 2nd doy2date() test, output doesn't match"
+    assert Epoch.doy2date(year, doy) == expected, \
+        "ERROR: doy2date() test, output doesn't match"
 
-    assert Epoch.doy2date(-4, 60) == (-4, 2, 29.0), \
-        "ERROR: 3rd doy2date() test, output doesn't match"
 
-    t = Epoch.doy2date(2017, 365.7)
-    assert t[0] == 2017 and t[1] == 12 and abs(t[2] - 31.7) < TOL, \
-        "ERROR: 4th doy2date() test, output doesn't match"
+@pytest.mark.parametrize("year, doy, month, day", [
+    (2017, 365.7, 12, 31.7),
+    (2012, 63.1, 3, 3.1),
+    (-4, 60, 2, 29),
+])
+def test_epoch_doy2date_fractional(year, doy, month, day):
+    """Tests the doy2date() static method of Epoch class with fractional
+    days"""
 
-    t = Epoch.doy2date(2012, 63.1)
-    assert t[0] == 2012 and t[1] == 3 and abs(t[2] - 3.1) < TOL, \
-        "ERROR: 5th doy2date() test, output doesn't match"
+    t = Epoch.doy2date(year, doy)
+    assert t[0] == year and t[1] == month and abs(t[2] - day) < TOL, \
+        "ERROR: doy2date() test, output doesn't match"
 
-    t = Epoch.doy2date(-4, 60)
-    assert t[0] == -4 and t[1] == 2 and abs(t[2] - 29) < TOL, \
-        "ERROR: 6th doy2date() test, output doesn't match"
 
+def test_epoch_doy2date_invalid():
+    """Tests the doy2date() static method of Epoch class with a Day Of Year
+    beyond the end of the year"""
 
-def test_epoch_leap_seconds():
-    """Tests the leap_seconds() static method of Epoch class"""
-
-    assert Epoch.leap_seconds(1983, 6) == 11, \
-        "ERROR: 1st leap_seconds() test, output doesn't match"
-
-    assert Epoch.leap_seconds(1983, 7) == 12, \
-        "ERROR: 2nd leap_seconds() test, output doesn't match"
+    with pytest.raises(ValueError):
+        Epoch.doy2date(2017, 366)
 
-    assert Epoch.leap_seconds(2016, 11) == 26, \
-        "ERROR: 3rd leap_seconds() test, output doesn't match"
 
-    assert Epoch.leap_seconds(2017, 1) == 27, \
-        "ERROR: 4th leap_seconds() test, output doesn't match"
-
-    assert Epoch.leap_seconds(1972, 6) == 0, \
-        "ERROR: 5th leap_seconds() test, output doesn't match"
-
-    assert Epoch.leap_seconds(1972, 7) == 1, \
-        "ERROR: 6th leap_seconds() test, output doesn't match"
+@pytest.mark.parametrize("year, month, expected", [
+    (1983, 6, 11),
+    (1983, 7, 12),
+    (2016, 11, 26),
+    (2017, 1, 27),
+    (1972, 6, 0),
+    (1972, 7, 1),
+    (2018, 7, 27),
+])
+def test_epoch_leap_seconds(year, month, expected):
+    """Tests the leap_seconds() static method of Epoch class"""
 
-    assert Epoch.leap_seconds(2018, 7) == 27, \
-        "ERROR: 7th leap_seconds() test, output doesn't match"
+    assert Epoch.leap_seconds(year, month) == expected, \
+        "ERROR: leap_seconds() test, output doesn't match"
 
 
-def test_epoch_easter():
+@pytest.mark.parametrize("year, month, day", [
+    (2000, 4, 23),
+    (1954, 4, 18),
+    (179, 4, 12),
+    (1243, 4, 12),
+    (1991, 3, 31),
+    (1993, 4, 11),
+])
+def test_epoch_easter(year, month, day):
     """Tests the easter() method of Epoch class"""
 
-    t = Epoch.easter(2000)
-    assert t[0] == 4 and t[1] == 23, \
-        "ERROR: 1st easter() test, output doesn't match"
-
-    t = Epoch.easter(1954)
-    assert t[0] == 4 and t[1] == 18, \
-        "ERROR: 2nd easter() test, output doesn't match"
-
-    t = Epoch.easter(179)
-    assert t[0] == 4 and t[1] == 12, \
-        "ERROR: 3rd easter() test, output doesn't match"
-
-    t = Epoch.easter(1243)
-    assert t[0] == 4 and t[1] == 12, \
-        "ERROR: 4th easter() test, output doesn't match"
-
-    t = Epoch.easter(1991)
-    assert t[0] == 3 and t[1] == 31, \
-        "ERROR: 5th easter() test, output doesn't match"
-
-    t = Epoch.easter(1993)
-    assert t[0] == 4 and t[1] == 11, \
-        "ERROR: 6th easter() test, output doesn't match"
+    t = Epoch.easter(year)
+    assert t[0] == month and t[1] == day, \
+        "ERROR: easter() test, output doesn't match"
 
 
 def test_epoch_jewish_pesach():
@@ -277,51 +272,30 @@ def test_epoch_get_date():
 
     e = Epoch(1507900.13)
     t = e.get_date()
-    assert t[0] == -584 and t[1] == 5 and abs(round(t[2], 2) - 28.63) < TOL, \
+    assert t[0] == -584 and t[1] == 5 and abs(t[2] - 28.63) < 0.005, \
         "ERROR: 3rd get_date() test, output doesn't match"
 
 
-def test_epoch_tt2ut():
+@pytest.mark.parametrize("year, month, expected", [
+    (1642, 1, 62.1),
+    (1680, 1, 15.3),
+    (1774, 1, 16.7),
+    (1890, 1, -6.1),
+    (1928, 2, 24.2),
+    (2015, 7, 69.3),
+    (1000, 1, 1574.2),
+    (-501, 1, 17218.5),
+    (1801, 1, 13.4),
+    (1930, 1, 24.1),
+    (1945, 1, 26.9),
+    (1970, 1, 40.2),
+    (2000, 1, 63.9),
+])
+def test_epoch_tt2ut(year, month, expected):
     """Tests the tt2ut() method of Epoch class"""
 
-    assert abs(round(Epoch.tt2ut(1642, 1), 1) - 62.1) < TOL, \
-        "ERROR: 1st tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1680, 1), 1) - 15.3) < TOL, \
-        "ERROR: 2nd tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1774, 1), 1) - 16.7) < TOL, \
-        "ERROR: 3rd tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1890, 1), 1) - (-6.1)) < TOL, \
-        "ERROR: 4th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1928, 2), 1) - 24.2) < TOL, \
-        "ERROR: 5th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(2015, 7), 1) - 69.3) < TOL, \
-        "ERROR: 6th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1000, 1), 1) - 1574.2) < TOL, \
-        "ERROR: 7th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(-501, 1), 1) - 17218.5) < TOL, \
-        "ERROR: 8th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1801, 1), 1) - 13.4) < TOL, \
-        "ERROR: 9th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1930, 1), 1) - 24.1) < TOL, \
-        "ERROR: 10th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1945, 1), 1) - 26.9) < TOL, \
-        "ERROR: 11th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(1970, 1), 1) - 40.2) < TOL, \
-        "ERROR: 12th tt2ut() test, output doesn't match"
-
-    assert abs(round(Epoch.tt2ut(2000, 1), 1) - 63.9) < TOL, \
-        "ERROR: 13th tt2ut() test, output doesn't match"
+    assert abs(Epoch.tt2ut(year, month) - expected) < 0.05, \
+        "ERROR: tt2ut() test, output doesn't match"
 
 
 def test_epoch_dow():
@@ -347,11 +321,11 @@ def test_epoch_mean_sidereal_time():
     """Tests the mean_sidereal_time() method of Epoch class"""
 
     e = Epoch(1987, 4, 10)
-    assert abs(round(e.mean_sidereal_time(), 9) - 0.549147764) < TOL, \
+    assert abs(e.mean_sidereal_time() - 0.549147764) < 5e-10, \
         "ERROR: 1st mean_sidereal_time() test, output doesn't match"
 
     e = Epoch(1987, 4, 10, 19, 21, 0.0)
-    assert abs(round(e.mean_sidereal_time(), 9) - 0.357605204) < TOL, \
+    assert abs(e.mean_sidereal_time() - 0.357605204) < 5e-10, \
         "ERROR: 2nd mean_sidereal_time() test, output doesn't match"
 
 
@@ -359,8 +333,8 @@ def test_epoch_apparent_sidereal_time():
     """Tests the apparent_sidereal_time() method of Epoch class"""
 
     e = Epoch(1987, 4, 10)
-    assert abs(round(e.apparent_sidereal_time(23.44357, (-3.788)/3600.0), 8)
-               - 0.54914508) < TOL, \
+    assert abs(e.apparent_sidereal_time(23.44357, (-3.788)/3600.0)
+               - 0.54914508) < 5e-9, \
         "ERROR: 1st apparent_sidereal_time() test, output doesn't match"
 
 
@@ -378,6 +352,28 @@ def test_epoch_jde():
     assert e.jde() == 1355866.5, "ERROR: 1st jde() test, output doesn't match"
 
 
+def test_epoch_jde_batch():
+    """Tests the jde_batch() static method of Epoch class"""
+
+    years = [-1000, 1582, 1582, 1957, 2000]
+    months = [2, 10, 10, 10, 1]
+    days = [29.0, 4.0, 15.0, 4.81, 1.5]
+    jdes = Epoch.jde_batch(years, months, days)
+
+    assert len(jdes) == 5, \
+        "ERROR: 1st jde_batch() test, number of values doesn't match"
+
+    for i, (y, m, d) in enumerate(zip(years, months, days)):
+        assert jdes[i] == Epoch(y, m, d).jde(), \
+            "ERROR: {} jde_batch() test, output doesn't match".format(i + 2)
+
+    with pytest.raises(ValueError):
+        Epoch.jde_batch([2000, 2001], [1], [1.0])
+
+    with pytest.raises(TypeError):
+        Epoch.jde_batch(2000, 1, 1.0)
+
+
 def test_epoch_call():
     """Tests the __call__() method of Epoch class"""
 
@@ -391,7 +387,7 @@ def test_epoch_add():
     a = Epoch(1991, 7, 11)
     b = a + 10000
     y, m, d = b.get_date()
-    assert y == 2018 and m == 11 and abs(round(d, 2) - 26.0) < TOL, \
+    assert y == 2018 and m == 11 and abs(d - 26.0) < 0.005, \
         "ERROR: 1st __add__() test, output doesn't match"
 
 
@@ -401,13 +397,13 @@ def test_epoch_sub():
     a = Epoch(1986, 2, 9.0)
     b = Epoch(1910, 4, 20.0)
     c = a - b
-    assert abs(round(c, 1) - 27689.0) < TOL, \
+    assert abs(c - 27689.0) < 0.05, \
         "ERROR: 1st __sub__() test, output doesn't match"
 
     a = Epoch(2003, 12, 31.0)
     b = a - 365.5
     y, m, d = b.get_date()
-    assert y == 2002 and m == 12 and abs(round(d, 1) - 30.5) < TOL, \
+    assert y == 2002 and m == 12 and abs(d - 30.5) < 0.05, \
         "ERROR: 2nd __sub__() test, output doesn't match"
 
 
@@ -417,7 +413,7 @@ def test_epoch_iadd():
     a = Epoch(2003, 12, 31.0)
     a += 32.5
     y, m, d = a.get_date()
-    assert y == 2004 and m == 2 and abs(round(d, 1) - 1.5) < TOL, \
+    assert y == 2004 and m == 2 and abs(d - 1.5) < 0.05, \
         "ERROR: 1st __iadd__() test, output doesn't match"
 
 
@@ -427,7 +423,7 @@ def test_epoch_isub():
     a = Epoch(2001, 12, 31.0)
     a -= 2*365
     y, m, d = a.get_date()
-    assert y == 2000 and m == 1 and abs(round(d, 1) - 1.0) < TOL, \
+    assert y == 2000 and m == 1 and abs(d - 1.0) < 0.05, \
         "ERROR: 1st __isub__() test, output doesn't match"
 
 
@@ -437,7 +433,7 @@ def test_epoch_radd():
     a = Epoch(2004, 2, 27.8)
     b = 2.2 + a
     y, m, d = b.get_date()
-    assert y == 2004 and m == 3 and abs(round(d, 1) - 1.0) < TOL, \
+    assert y == 2004 and m == 3 and abs(d - 1.0) < 0.05, \
         "ERROR: 1st __radd__() test, output doesn't match"
 
 
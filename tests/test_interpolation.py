@@ -196,6 +196,31 @@ def test_interpolation_root():
     assert abs(i_angles2.root() - 26.6385869469) < TOL, \
         "ERROR: In 6th root() test, output value doesn't match"
 
+    # Quadratic sampled at Julian Days, a typical input with large abscissas
+    jd = 2451545.0
+    x = [jd, jd + 1.0, jd + 2.0]
+    y = [-(xi - jd - 1.5) * (xi - jd - 7.0) * 1e-3 for xi in x]
+    m = Interpolation(x, y)
+    root = m.root()
+
+    assert abs(root - (jd + 1.5)) < TOL, \
+        "ERROR: In 7th root() test, output value doesn't match"
+
+    assert abs(m(root)) <= TOL, \
+        "ERROR: In 8th root() test, polynomial value at root is not zero"
+
+    # The root has the same type regardless of the number of points
+    m = Interpolation([-1, 0, 1], [Angle(-1.0), Angle(0.5), Angle(1.5)])
+
+    assert isinstance(m.root(), Angle), \
+        "ERROR: In 9th root() test, output type doesn't match"
+
+    m = Interpolation([-1, 0, 1, 2],
+                      [Angle(-1.0), Angle(0.5), Angle(1.5), Angle(1.8)])
+
+    assert isinstance(m.root(), Angle), \
+        "ERROR: In 10th root() test, output type doesn't match"
+
 
 def test_interpolation_minmax():
     """Tests the minmax() method of Interpolation class"""
@@ -31,13 +31,13 @@ def test_jupiter_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Jupiter.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 241.5873) < TOL, \
+    assert abs(lon.to_positive() - 241.5873) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - 0.8216) < TOL, \
+    assert abs(lat - 0.8216) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 5.36848) < TOL, \
+    assert abs(r - 5.36848) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -47,22 +47,22 @@ def test_jupiter_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Jupiter.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 222.433723) < TOL, \
+    assert abs(l - 222.433723) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 5.20260333) < TOL, \
+    assert abs(a - 5.20260333) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0486046) < TOL, \
+    assert abs(e - 0.0486046) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 1.29967) < TOL, \
+    assert abs(i - 1.29967) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 101.13309) < TOL, \
+    assert abs(ome - 101.13309) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - (-85.745532)) < TOL, \
+    assert abs(arg - (-85.745532)) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -72,22 +72,22 @@ def test_jupiter_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Jupiter.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 221.518802) < TOL, \
+    assert abs(l - 221.518802) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 5.20260333) < TOL, \
+    assert abs(a - 5.20260333) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0486046) < TOL, \
+    assert abs(e - 0.0486046) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 1.30198) < TOL, \
+    assert abs(i - 1.30198) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 100.58051) < TOL, \
+    assert abs(ome - 100.58051) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - (-86.107875)) < TOL, \
+    assert abs(arg - (-86.107875)) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -114,13 +114,13 @@ def test_jupiter_conjunction():
     conjunction = Jupiter.conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 10) < TOL, \
+    assert abs(m - 10) < 0.5, \
         "ERROR: 2nd conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 18.3341) < TOL, \
+    assert abs(d - 18.3341) < 5e-5, \
         "ERROR: 3rd conjunction() test doesn't match"
 
 
@@ -131,13 +131,13 @@ def test_jupiter_opposition():
     oppo = Jupiter.opposition(epoch)
     y, m, d = oppo.get_date()
 
-    assert abs(round(y, 0) - (-6)) < TOL, \
+    assert abs(y - (-6)) < 0.5, \
         "ERROR: 1st opposition() test doesn't match"
 
-    assert abs(round(m, 0) - 9) < TOL, \
+    assert abs(m - 9) < 0.5, \
         "ERROR: 2nd opposition() test doesn't match"
 
-    assert abs(round(d, 4) - 15.2865) < TOL, \
+    assert abs(d - 15.2865) < 5e-5, \
         "ERROR: 3rd opposition() test doesn't match"
 
 
@@ -148,13 +148,13 @@ def test_jupiter_station_longitude_1():
     sta1 = Jupiter.station_longitude_1(epoch)
     y, m, d = sta1.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_1() test doesn't match"
 
-    assert abs(round(m, 0) - 3) < TOL, \
+    assert abs(m - 3) < 0.5, \
         "ERROR: 2nd station_longitude_1() test doesn't match"
 
-    assert abs(round(d, 4) - 9.1288) < TOL, \
+    assert abs(d - 9.1288) < 5e-5, \
         "ERROR: 3rd station_longitude_1() test doesn't match"
 
 
@@ -165,13 +165,13 @@ def test_jupiter_station_longitude_2():
     sta2 = Jupiter.station_longitude_2(epoch)
     y, m, d = sta2.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_2() test doesn't match"
 
-    assert abs(round(m, 0) - 7) < TOL, \
+    assert abs(m - 7) < 0.5, \
         "ERROR: 2nd station_longitude_2() test doesn't match"
 
-    assert abs(round(d, 4) - 10.6679) < TOL, \
+    assert abs(d - 10.6679) < 5e-5, \
         "ERROR: 3rd station_longitude_2() test doesn't match"
 
 
@@ -217,8 +217,6 @@ def test_jupiter_passage_nodes():
     epoch = Epoch(2019, 1, 1)
     time, r = Jupiter.passage_nodes(epoch)
     y, m, d = time.get_date()
-    d = round(d, 1)
-    r = round(r, 4)
 
     assert abs(y - 2025) < TOL, \
         "ERROR: 1st passage_nodes() test doesn't match"
@@ -226,8 +224,8 @@ def test_jupiter_passage_nodes():
     assert abs(m - 9) < TOL, \
         "ERROR: 2nd passage_nodes() test doesn't match"
 
-    assert abs(d - 15.6) < TOL, \
+    assert abs(d - 15.6) < 0.05, \
         "ERROR: 3rd passage_nodes() test doesn't match"
 
-    assert abs(r - 5.1729) < TOL, \
+    assert abs(r - 5.1729) < 5e-5, \
         "ERROR: 4th passage_nodes() test doesn't match"
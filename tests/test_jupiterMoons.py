@@ -38,14 +38,15 @@ class TestJupiterMoons(TestCase):
         psi_corrected, OMEGA_ascending_node_jupiter = \
             JupiterMoons.jupiter_system_angles(
                 utc_1992_12_16_00_00_00)
-        assert abs(round(psi_corrected, exp_prec) - round(317.1058009213959,
-                                                          exp_prec)) < TOL, \
-            """ERROR: psi_corrected of JupiterMoons.jupiter_system angles()
-            test doesn't match"""
-        assert abs(round(OMEGA_ascending_node_jupiter, exp_prec) - round(
-            100.39249942976576, exp_prec)) < TOL, \
-            """ERROR: OMEGA_ascending_node_jupiter of
-            JupiterMoons.jupiter_system angles() test doesn't match"""
+        self.assertAlmostEqual(
+            psi_corrected, 317.1058009213959, places=exp_prec,
+            msg="""ERROR: psi_corrected of JupiterMoons.jupiter_system
+            angles() test doesn't match""")
+        self.assertAlmostEqual(
+            OMEGA_ascending_node_jupiter, 100.39249942976576,
+            places=exp_prec,
+            msg="""ERROR: OMEGA_ascending_node_jupiter of
+            JupiterMoons.jupiter_system angles() test doesn't match""")
 
     def test_rectangular_positions(self):
         """This method tests the method
@@ -59,83 +60,65 @@ class TestJupiterMoons(TestCase):
             JupiterMoons.rectangular_positions_jovian_equatorial(
                 EPOCH_1992_12_16_UTC, do_correction=True)
 
-        assert abs(round(io_corr_true[0], exp_prec) - round(-3.45016881,
-                                                            exp_prec)) < TOL, \
-            """ERROR: 1st rectangular position (X) for Io of
-            JupiterMoons.rectangular_position() test doesn't match"""
-
-        assert abs(round(io_corr_true[1], exp_prec) - round(0.21370247,
-                                                            exp_prec)) < TOL, \
-            """ERROR: 2nd rectangular position (Y) for Io of
-            JupiterMoons.rectangular_position() test doesn't match"""
-
-        assert abs(round(io_corr_true[2], exp_prec) + round(4.81896662,
-                                                            exp_prec)) < TOL, \
-            """ERROR: 3rd rectangular position (Z) for Io of
-            JupiterMoons.rectangular_position() test doesn't match"""
-
-        assert abs(round(europe_corr_true[0], exp_prec) - round(7.44186912,
-                                                                exp_prec)) <\
-            TOL, \
-            """ERROR: 1st rectangular position (X) for Europe of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(europe_corr_true[1], exp_prec) - round(0.27524463,
-                                                                exp_prec)) <\
-            TOL, \
-            """ERROR: 2nd rectangular position for (Y) Europe of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(europe_corr_true[2], exp_prec) - round(-5.74710440,
-                                                                exp_prec)) <\
-            TOL, \
-            """ERROR: 3rd rectangular position for (Z) Europe of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(ganymede_corr_true[0], exp_prec) - round(1.20111168,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 1st rectangular position (X) for Ganymede of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(ganymede_corr_true[1], exp_prec) - round(0.58999033,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 2nd rectangular position (Y) for Ganymede of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(ganymede_corr_true[2], exp_prec) - round(-14.94058137,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 3rd rectangular position (Z) for Ganymede of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(callisto_corr_true[0], exp_prec) - round(7.07202264,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 1st rectangular position (X) for Callisto of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(callisto_corr_true[1], exp_prec) - round(1.02895629,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 2nd rectangular position (Y) for  Callisto of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
-
-        assert abs(round(callisto_corr_true[2], exp_prec) - round(-25.22442033,
-                                                                  exp_prec))\
-            < TOL, \
-            """ERROR: 3rd rectangular position (Z) for  Callisto of
-            JupiterMoons.rectangular_position()
-            test doesn't match"""
+        self.assertAlmostEqual(
+            io_corr_true[0], -3.45016881, places=exp_prec,
+            msg="""ERROR: 1st rectangular position (X) for Io of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            io_corr_true[1], 0.21370247, places=exp_prec,
+            msg="""ERROR: 2nd rectangular position (Y) for Io of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            io_corr_true[2], -4.81896662, places=exp_prec,
+            msg="""ERROR: 3rd rectangular position (Z) for Io of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            europe_corr_true[0], 7.44186912, places=exp_prec,
+            msg="""ERROR: 1st rectangular position (X) for Europe of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            europe_corr_true[1], 0.27524463, places=exp_prec,
+            msg="""ERROR: 2nd rectangular position for (Y) Europe of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            europe_corr_true[2], -5.74710440, places=exp_prec,
+            msg="""ERROR: 3rd rectangular position for (Z) Europe of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            ganymede_corr_true[0], 1.20111168, places=exp_prec,
+            msg="""ERROR: 1st rectangular position (X) for Ganymede of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            ganymede_corr_true[1], 0.58999033, places=exp_prec,
+            msg="""ERROR: 2nd rectangular position (Y) for Ganymede of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            ganymede_corr_true[2], -14.94058137, places=exp_prec,
+            msg="""ERROR: 3rd rectangular position (Z) for Ganymede of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            callisto_corr_true[0], 7.07202264, places=exp_prec,
+            msg="""ERROR: 1st rectangular position (X) for Callisto of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            callisto_corr_true[1], 1.02895629, places=exp_prec,
+            msg="""ERROR: 2nd rectangular position (Y) for Callisto of
+            JupiterMoons.rectangular_position() test doesn't match""")
+
+        self.assertAlmostEqual(
+            callisto_corr_true[2], -25.22442033, places=exp_prec,
+            msg="""ERROR: 3rd rectangular position (Z) for Callisto of
+            JupiterMoons.rectangular_position() test doesn't match""")
 
     def test_calculate_delta(self):
         """This method tests calculate_delta() that calculates the distance
@@ -150,13 +133,15 @@ class TestJupiterMoons(TestCase):
         delta_reference = 5.6611211815432645
         tau_reference = 0.032695909
 
-        assert abs(round(delta, 4) - round(delta_reference, 4)) < TOL, \
-            """ERROR: Distance between earth and Jupiter of
-            JupiterMoons.calculate_delta() doesn't match"""
+        self.assertAlmostEqual(
+            delta, delta_reference, places=4,
+            msg="""ERROR: Distance between earth and Jupiter of
+            JupiterMoons.calculate_delta() doesn't match""")
 
-        assert abs(round(tau, 4) - round(tau_reference, 4)) < TOL, \
-            """ERROR: Light time delay tau between earth and Jupiter of
-            JupiterMoons.calculate_delta()doesn't match"""
+        self.assertAlmostEqual(
+            tau, tau_reference, places=4,
+            msg="""ERROR: Light time delay tau between earth and Jupiter of
+            JupiterMoons.calculate_delta()doesn't match""")
 
     def test_correct_rectangular_positions(self):
         """This method tests the method correct_rectangular_positions() that
@@ -183,18 +168,18 @@ class TestJupiterMoons(TestCase):
                                                         Y_coordinate,
                                                         Z_coordinate)
 
-        assert abs(round(io[0], exp_prec) - round(-3.450168811390241,
-                                                  exp_prec)) < TOL, \
-            """ERROR: correction of 1st rectangular position (X) for Io test
-            doesn't match"""
-        assert abs(round(io[1], exp_prec) - round(0.21370246960509387,
-                                                  exp_prec)) < TOL, \
-            """ERROR: correction of 2nd rectangular position (Y) for Io test
-            doesn't match"""
-        assert abs(round(io[2], exp_prec) - round(-4.818966623735296,
-                                                  exp_prec)) < TOL, \
-            """ERROR: correction of 3rd rectangular position (Z) for Io test
-            doesn't match"""
+        self.assertAlmostEqual(
+            io[0], -3.450168811390241, places=exp_prec,
+            msg="""ERROR: correction of 1st rectangular position (X) for Io
+            test doesn't match""")
+        self.assertAlmostEqual(
+            io[1], 0.21370246960509387, places=exp_prec,
+            msg="""ERROR: correction of 2nd rectangular position (Y) for Io
+            test doesn't match""")
+        self.assertAlmostEqual(
+            io[2], -4.818966623735296, places=exp_prec,
+            msg="""ERROR: correction of 3rd rectangular position (Z) for Io
+            test doesn't match""")
 
     def test_check_coordinates(self):
         """This method tests if the method check_coordinates() returns the
@@ -208,10 +193,10 @@ class TestJupiterMoons(TestCase):
             EPOCH_1992_12_16_UTC, solar=False)
         io_radius_to_center_of_jupiter_earth = JupiterMoons.check_coordinates(
             result_matrix[0][0], result_matrix[0][1])
-        assert abs(
-            round(io_radius_to_center_of_jupiter_earth, exp_prec) - round(
-                3.457757270630766, exp_prec)) < TOL, \
-            """ERROR: test_check_coordinates() test doesn't match"""
+        self.assertAlmostEqual(
+            io_radius_to_center_of_jupiter_earth, 3.457757270630766,
+            places=exp_prec,
+            msg="""ERROR: test_check_coordinates() test doesn't match""")
 
     def test_check_occulation(self):
         """This method test if the method check_occultation() returns the
@@ -223,10 +208,10 @@ class TestJupiterMoons(TestCase):
             JupiterMoons.check_occultation(
                 result_matrix[0][0],
                 result_matrix[0][1])
-        assert abs(
-            round(io_distance_to_center_of_jupiter_earthview,
-                  exp_prec) + round(3.457757270630766, exp_prec)) < TOL, \
-            """ERROR: test_check_occultation() test doesn't match"""
+        self.assertAlmostEqual(
+            io_distance_to_center_of_jupiter_earthview, -3.457757270630766,
+            places=exp_prec,
+            msg="""ERROR: test_check_occultation() test doesn't match""")
 
     def test_check_eclipse(self):
         result_matrix = JupiterMoons.rectangular_positions_jovian_equatorial(
@@ -234,10 +219,10 @@ class TestJupiterMoons(TestCase):
         io_distance_to_center_of_jupiter_sunview = JupiterMoons.check_eclipse(
             result_matrix[0][0],
             result_matrix[0][1])
-        assert abs(
-            round(io_distance_to_center_of_jupiter_sunview, exp_prec) + round(
-                2.553301264153796, exp_prec)) < TOL, \
-            """ERROR: test_check_eclipse() test doesn't match"""
+        self.assertAlmostEqual(
+            io_distance_to_center_of_jupiter_sunview, -2.553301264153796,
+            places=exp_prec,
+            msg="""ERROR: test_check_eclipse() test doesn't match""")
 
     def test_check_phenomena(self):
         """This method tests if the method check_phenomena() returns the
@@ -31,13 +31,13 @@ def test_mars_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Mars.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 2.0015) < TOL, \
+    assert abs(lon.to_positive() - 2.0015) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - (-1.3683)) < TOL, \
+    assert abs(lat - (-1.3683)) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 1.39306) < TOL, \
+    assert abs(r - 1.39306) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -47,22 +47,22 @@ def test_mars_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Mars.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 288.855211) < TOL, \
+    assert abs(l - 288.855211) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 1.52367934) < TOL, \
+    assert abs(a - 1.52367934) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0934599) < TOL, \
+    assert abs(e - 0.0934599) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 1.849338) < TOL, \
+    assert abs(i - 1.849338) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 50.06365) < TOL, \
+    assert abs(ome - 50.06365) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - 287.202108) < TOL, \
+    assert abs(arg - 287.202108) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -72,22 +72,22 @@ def test_mars_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Mars.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 287.94027) < TOL, \
+    assert abs(l - 287.94027) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 1.52367934) < TOL, \
+    assert abs(a - 1.52367934) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0934599) < TOL, \
+    assert abs(e - 0.0934599) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 1.844381) < TOL, \
+    assert abs(i - 1.844381) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 49.36464) < TOL, \
+    assert abs(ome - 49.36464) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - 286.98617) < TOL, \
+    assert abs(arg - 286.98617) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -114,13 +114,13 @@ def test_mars_conjunction():
     conjunction = Mars.conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 12) < TOL, \
+    assert abs(m - 12) < 0.5, \
         "ERROR: 2nd conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 27.0898) < TOL, \
+    assert abs(d - 27.0898) < 5e-5, \
         "ERROR: 3rd conjunction() test doesn't match"
 
 
@@ -131,13 +131,13 @@ def test_mars_superior_conjunction():
     oppo = Mars.opposition(epoch)
     y, m, d = oppo.get_date()
 
-    assert abs(round(y, 0) - 2729) < TOL, \
+    assert abs(y - 2729) < 0.5, \
         "ERROR: 1st opposition() test doesn't match"
 
-    assert abs(round(m, 0) - 9) < TOL, \
+    assert abs(m - 9) < 0.5, \
         "ERROR: 2nd opposition() test doesn't match"
 
-    assert abs(round(d, 4) - 9.1412) < TOL, \
+    assert abs(d - 9.1412) < 5e-5, \
         "ERROR: 3rd opposition() test doesn't match"
 
 
@@ -148,13 +148,13 @@ def test_mars_station_longitude_1():
     sta1 = Mars.station_longitude_1(epoch)
     y, m, d = sta1.get_date()
 
-    assert abs(round(y, 0) - 1997) < TOL, \
+    assert abs(y - 1997) < 0.5, \
         "ERROR: 1st station_longitude_1() test doesn't match"
 
-    assert abs(round(m, 0) - 2) < TOL, \
+    assert abs(m - 2) < 0.5, \
         "ERROR: 2nd station_longitude_1() test doesn't match"
 
-    assert abs(round(d, 4) - 6.033) < TOL, \
+    assert abs(d - 6.033) < 5e-5, \
         "ERROR: 3rd station_longitude_1() test doesn't match"
 
 
@@ -165,13 +165,13 @@ def test_mars_station_longitude_2():
     sta2 = Mars.station_longitude_2(epoch)
     y, m, d = sta2.get_date()
 
-    assert abs(round(y, 0) - 1997) < TOL, \
+    assert abs(y - 1997) < 0.5, \
         "ERROR: 1st station_longitude_2() test doesn't match"
 
-    assert abs(round(m, 0) - 4) < TOL, \
+    assert abs(m - 4) < 0.5, \
         "ERROR: 2nd station_longitude_2() test doesn't match"
 
-    assert abs(round(d, 4) - 27.7553) < TOL, \
+    assert abs(d - 27.7553) < 5e-5, \
         "ERROR: 3rd station_longitude_2() test doesn't match"
 
 
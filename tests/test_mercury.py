@@ -31,13 +31,13 @@ def test_mercury_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Mercury.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 287.4887) < TOL, \
+    assert abs(lon.to_positive() - 287.4887) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - (-6.0086)) < TOL, \
+    assert abs(lat - (-6.0086)) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 0.45113) < TOL, \
+    assert abs(r - 0.45113) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -47,22 +47,22 @@ def test_mercury_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Mercury.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 203.494701) < TOL, \
+    assert abs(l - 203.494701) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 0.38709831) < TOL, \
+    assert abs(a - 0.38709831) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.2056451) < TOL, \
+    assert abs(e - 0.2056451) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 7.006171) < TOL, \
+    assert abs(i - 7.006171) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 49.10765) < TOL, \
+    assert abs(ome - 49.10765) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - 29.367732) < TOL, \
+    assert abs(arg - 29.367732) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -72,22 +72,22 @@ def test_mercury_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Mercury.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 202.579453) < TOL, \
+    assert abs(l - 202.579453) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 0.38709831) < TOL, \
+    assert abs(a - 0.38709831) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.2056451) < TOL, \
+    assert abs(e - 0.2056451) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 7.001089) < TOL, \
+    assert abs(i - 7.001089) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 48.24873) < TOL, \
+    assert abs(ome - 48.24873) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - 29.311401) < TOL, \
+    assert abs(arg - 29.311401) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -114,26 +114,26 @@ def test_mercury_inferior_conjunction():
     conjunction = Mercury.inferior_conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st inferior_conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 11) < TOL, \
+    assert abs(m - 11) < 0.5, \
         "ERROR: 2nd inferior_conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 6.1449) < TOL, \
+    assert abs(d - 6.1449) < 5e-5, \
         "ERROR: 3rd inferior_conjunction() test doesn't match"
 
     epoch = Epoch(1631, 10, 1.0)
     conjunction = Mercury.inferior_conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1631) < TOL, \
+    assert abs(y - 1631) < 0.5, \
         "ERROR: 4th inferior_conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 11) < TOL, \
+    assert abs(m - 11) < 0.5, \
         "ERROR: 5th inferior_conjunction() test doesn't match"
 
-    assert abs(round(d, 3) - 7.306) < TOL, \
+    assert abs(d - 7.306) < 5e-4, \
         "ERROR: 6th inferior_conjunction() test doesn't match"
 
 
@@ -144,13 +144,13 @@ def test_mercury_superior_conjunction():
     conjunction = Mercury.superior_conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st superior_conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 8) < TOL, \
+    assert abs(m - 8) < 0.5, \
         "ERROR: 2nd superior_conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 29.3301) < TOL, \
+    assert abs(d - 29.3301) < 5e-5, \
         "ERROR: 3rd superior_conjunction() test doesn't match"
 
 
@@ -161,16 +161,16 @@ def test_mercury_western_elongation():
     time, elongation = Mercury.western_elongation(epoch)
     y, m, d = time.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st western_elongation() test doesn't match"
 
-    assert abs(round(m, 0) - 11) < TOL, \
+    assert abs(m - 11) < 0.5, \
         "ERROR: 2nd western_elongation() test doesn't match"
 
-    assert abs(round(d, 4) - 22.6386) < TOL, \
+    assert abs(d - 22.6386) < 5e-5, \
         "ERROR: 3rd western_elongation() test doesn't match"
 
-    assert abs(round(elongation, 4) - 19.7506) < TOL, \
+    assert abs(elongation - 19.7506) < 5e-5, \
         "ERROR: 4th western_elongation() test doesn't match"
 
 
@@ -181,16 +181,16 @@ def test_mercury_eastern_elongation():
     time, elongation = Mercury.eastern_elongation(epoch)
     y, m, d = time.get_date()
 
-    assert abs(round(y, 0) - 1990) < TOL, \
+    assert abs(y - 1990) < 0.5, \
         "ERROR: 1st eastern_elongation() test doesn't match"
 
-    assert abs(round(m, 0) - 8) < TOL, \
+    assert abs(m - 8) < 0.5, \
         "ERROR: 2nd eastern_elongation() test doesn't match"
 
-    assert abs(round(d, 4) - 11.8514) < TOL, \
+    assert abs(d - 11.8514) < 5e-5, \
         "ERROR: 3rd eastern_elongation() test doesn't match"
 
-    assert abs(round(elongation, 4) - 27.4201) < TOL, \
+    assert abs(elongation - 27.4201) < 5e-5, \
         "ERROR: 4th eastern_elongation() test doesn't match"
 
 
@@ -201,13 +201,13 @@ def test_mercury_station_longitude_1():
     sta1 = Mercury.station_longitude_1(epoch)
     y, m, d = sta1.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st station_longitude_1() test doesn't match"
 
-    assert abs(round(m, 0) - 10) < TOL, \
+    assert abs(m - 10) < 0.5, \
         "ERROR: 2nd station_longitude_1() test doesn't match"
 
-    assert abs(round(d, 4) - 25.9358) < TOL, \
+    assert abs(d - 25.9358) < 5e-5, \
         "ERROR: 3rd station_longitude_1() test doesn't match"
 
 
@@ -218,13 +218,13 @@ def test_mercury_station_longitude_2():
     sta2 = Mercury.station_longitude_2(epoch)
     y, m, d = sta2.get_date()
 
-    assert abs(round(y, 0) - 1993) < TOL, \
+    assert abs(y - 1993) < 0.5, \
         "ERROR: 1st station_longitude_2() test doesn't match"
 
-    assert abs(round(m, 0) - 11) < TOL, \
+    assert abs(m - 11) < 0.5, \
         "ERROR: 2nd station_longitude_2() test doesn't match"
 
-    assert abs(round(d, 4) - 15.0724) < TOL, \
+    assert abs(d - 15.0724) < 5e-5, \
         "ERROR: 3rd station_longitude_2() test doesn't match"
 
 
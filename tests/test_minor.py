@@ -18,7 +18,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from pymeeus.base import TOL
 from pymeeus.Angle import Angle
 from pymeeus.Minor import Minor
 from pymeeus.Epoch import Epoch
@@ -47,7 +46,7 @@ def test_minor_geocentric_position():
     assert dec.dms_str(n_dec=0) == "19d 9' 32.0''", \
         "ERROR: 2nd geocentric_position() test doesn't match"
 
-    assert abs(round(elong, 2) - 40.51) < TOL, \
+    assert abs(elong - 40.51) < 0.005, \
         "ERROR: 3rd geocentric_position() test doesn't match"
 
 
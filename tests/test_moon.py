@@ -288,27 +288,27 @@ def test_moon_librations():
     epoch = Epoch(1992, 4, 12.0)
     lopt, bopt, lphys, bphys, ltot, btot = Moon.moon_librations(epoch)
 
-    assert abs(round(lopt, 3) - (-1.206)) < TOL, \
+    assert abs(lopt - (-1.206)) < 5e-4, \
         "ERROR: 1st 'moon_librations()' test, 'lopt' value "\
         + "doesn't match"
 
-    assert abs(round(bopt, 3) - 4.194) < TOL, \
+    assert abs(bopt - 4.194) < 5e-4, \
         "ERROR: 2nd 'moon_librations()' test, 'bopt' value doesn't "\
         + "match"
 
-    assert abs(round(lphys, 3) - (-0.025)) < TOL, \
+    assert abs(lphys - (-0.025)) < 5e-4, \
         "ERROR: 3rd 'moon_librations()' test, 'lphys' value "\
         + "doesn't match"
 
-    assert abs(round(bphys, 3) - 0.006) < TOL, \
+    assert abs(bphys - 0.006) < 5e-4, \
         "ERROR: 4th 'moon_librations()' test, 'bphys' value doesn't "\
         + "match"
 
-    assert abs(round(ltot, 2) - (-1.23)) < TOL, \
+    assert abs(ltot - (-1.23)) < 0.005, \
         "ERROR: 5th 'moon_librations()' test, 'ltot' value "\
         + "doesn't match"
 
-    assert abs(round(btot, 3) - 4.2) < TOL, \
+    assert abs(btot - 4.2) < 5e-4, \
         "ERROR: 6th 'moon_librations()' test, 'btot' value doesn't "\
         + "match"
 
@@ -319,6 +319,6 @@ def test_moon_position_angle_axis():
     epoch = Epoch(1992, 4, 12.0)
     p = Moon.moon_position_angle_axis(epoch)
 
-    assert abs(round(p, 2) - 15.08) < TOL, \
+    assert abs(p - 15.08) < 0.005, \
         "ERROR: 1st 'moon_position_angle_axis()' test, 'p' value "\
         + "doesn't match"
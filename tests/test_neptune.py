@@ -18,7 +18,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from pymeeus.base import TOL
 from pymeeus.Neptune import Neptune
 from pymeeus.Epoch import Epoch
 
@@ -31,13 +30,13 @@ def test_neptune_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Neptune.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 345.3776) < TOL, \
+    assert abs(lon.to_positive() - 345.3776) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - (-0.9735)) < TOL, \
+    assert abs(lat - (-0.9735)) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 29.93966) < TOL, \
+    assert abs(r - 29.93966) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -47,22 +46,22 @@ def test_neptune_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Neptune.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 88.321947) < TOL, \
+    assert abs(l - 88.321947) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 30.11038676) < TOL, \
+    assert abs(a - 30.11038676) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0094597) < TOL, \
+    assert abs(e - 0.0094597) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 1.763855) < TOL, \
+    assert abs(i - 1.763855) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 132.46986) < TOL, \
+    assert abs(ome - 132.46986) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - (-83.415521)) < TOL, \
+    assert abs(arg - (-83.415521)) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -72,22 +71,22 @@ def test_neptune_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Neptune.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 87.407029) < TOL, \
+    assert abs(l - 87.407029) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 30.11038676) < TOL, \
+    assert abs(a - 30.11038676) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0094597) < TOL, \
+    assert abs(e - 0.0094597) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 1.770101) < TOL, \
+    assert abs(i - 1.770101) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 131.74402) < TOL, \
+    assert abs(ome - 131.74402) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - (-83.6046)) < TOL, \
+    assert abs(arg - (-83.6046)) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -114,13 +113,13 @@ def test_neptune_conjunction():
     conjunction = Neptune.conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1994) < TOL, \
+    assert abs(y - 1994) < 0.5, \
         "ERROR: 1st conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 1) < TOL, \
+    assert abs(m - 1) < 0.5, \
         "ERROR: 2nd conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 11.3057) < TOL, \
+    assert abs(d - 11.3057) < 5e-5, \
         "ERROR: 3rd conjunction() test doesn't match"
 
 
@@ -131,11 +130,11 @@ def test_neptune_opposition():
     oppo = Neptune.opposition(epoch)
     y, m, d = oppo.get_date()
 
-    assert abs(round(y, 0) - 1846) < TOL, \
+    assert abs(y - 1846) < 0.5, \
         "ERROR: 1st opposition() test doesn't match"
 
-    assert abs(round(m, 0) - 8) < TOL, \
+    assert abs(m - 8) < 0.5, \
         "ERROR: 2nd opposition() test doesn't match"
 
-    assert abs(round(d, 4) - 20.1623) < TOL, \
+    assert abs(d - 20.1623) < 5e-5, \
         "ERROR: 3rd opposition() test doesn't match"
@@ -18,7 +18,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
-from pymeeus.base import TOL
 from pymeeus.Pluto import Pluto
 from pymeeus.Epoch import Epoch
 
@@ -31,13 +30,13 @@ def test_pluto_geometric_heliocentric_position():
     epoch = Epoch(1992, 10, 13.0)
     lon, lat, r = Pluto.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 5) - 232.74071) < TOL, \
+    assert abs(lon.to_positive() - 232.74071) < 5e-6, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 5) - 14.58782) < TOL, \
+    assert abs(lat - 14.58782) < 5e-6, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 6) - 29.711111) < TOL, \
+    assert abs(r - 29.711111) < 5e-7, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -32,13 +32,13 @@ def test_saturn_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Saturn.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 279.5108) < TOL, \
+    assert abs(lon.to_positive() - 279.5108) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - 0.6141) < TOL, \
+    assert abs(lat - 0.6141) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 10.06266) < TOL, \
+    assert abs(r - 10.06266) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -48,22 +48,22 @@ def test_saturn_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Saturn.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 131.196871) < TOL, \
+    assert abs(l - 131.196871) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 9.55490779) < TOL, \
+    assert abs(a - 9.55490779) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0553209) < TOL, \
+    assert abs(e - 0.0553209) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 2.486426) < TOL, \
+    assert abs(i - 2.486426) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 114.23974) < TOL, \
+    assert abs(ome - 114.23974) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - (-19.896331)) < TOL, \
+    assert abs(arg - (-19.896331)) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -73,22 +73,22 @@ def test_saturn_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Saturn.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 130.28188) < TOL, \
+    assert abs(l - 130.28188) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 9.55490779) < TOL, \
+    assert abs(a - 9.55490779) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0553209) < TOL, \
+    assert abs(e - 0.0553209) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 2.490529) < TOL, \
+    assert abs(i - 2.490529) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 113.49736) < TOL, \
+    assert abs(ome - 113.49736) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - (-20.068943)) < TOL, \
+    assert abs(arg - (-20.068943)) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -115,13 +115,13 @@ def test_saturn_conjunction():
     conjunction = Saturn.conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 2125) < TOL, \
+    assert abs(y - 2125) < 0.5, \
         "ERROR: 1st conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 8) < TOL, \
+    assert abs(m - 8) < 0.5, \
         "ERROR: 2nd conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 26.4035) < TOL, \
+    assert abs(d - 26.4035) < 5e-5, \
         "ERROR: 3rd conjunction() test doesn't match"
 
 
@@ -132,13 +132,13 @@ def test_saturn_opposition():
     oppo = Saturn.opposition(epoch)
     y, m, d = oppo.get_date()
 
-    assert abs(round(y, 0) - (-6)) < TOL, \
+    assert abs(y - (-6)) < 0.5, \
         "ERROR: 1st opposition() test doesn't match"
 
-    assert abs(round(m, 0) - 9) < TOL, \
+    assert abs(m - 9) < 0.5, \
         "ERROR: 2nd opposition() test doesn't match"
 
-    assert abs(round(d, 4) - 14.3709) < TOL, \
+    assert abs(d - 14.3709) < 5e-5, \
         "ERROR: 3rd opposition() test doesn't match"
 
 
@@ -149,13 +149,13 @@ def test_saturn_station_longitude_1():
     sta1 = Saturn.station_longitude_1(epoch)
     y, m, d = sta1.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_1() test doesn't match"
 
-    assert abs(round(m, 0) - 4) < TOL, \
+    assert abs(m - 4) < 0.5, \
         "ERROR: 2nd station_longitude_1() test doesn't match"
 
-    assert abs(round(d, 4) - 17.9433) < TOL, \
+    assert abs(d - 17.9433) < 5e-5, \
         "ERROR: 3rd station_longitude_1() test doesn't match"
 
 
@@ -166,13 +166,13 @@ def test_saturn_station_longitude_2():
     sta2 = Saturn.station_longitude_2(epoch)
     y, m, d = sta2.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_2() test doesn't match"
 
-    assert abs(round(m, 0) - 9) < TOL, \
+    assert abs(m - 9) < 0.5, \
         "ERROR: 2nd station_longitude_2() test doesn't match"
 
-    assert abs(round(d, 4) - 6.4175) < TOL, \
+    assert abs(d - 6.4175) < 5e-5, \
         "ERROR: 3rd station_longitude_2() test doesn't match"
 
 
@@ -23,25 +23,44 @@ from pymeeus.Sun import Sun
 from pymeeus.Epoch import Epoch
 
 
+# Declare some objects to be used later
+epoch_1992 = Epoch()
+
+
+def setup_module():
+    """This function is used to set up the environment for the tests"""
+    # Most of the tests use the same epoch, so build it only once
+    epoch_1992.set(1992, 10, 13.0)
+
+
+def teardown_module():
+    pass
+
+
+# pre pytest 7.2 ompatibility
+setup = setup_module
+teardown = teardown_module
+
+
 # Sun module
 
 def test_sun_true_longitude_coarse():
     """Tests the true_longitude_coarse() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13)
+    epoch = epoch_1992
     true_lon, r = Sun.true_longitude_coarse(epoch)
 
     assert true_lon.dms_str(n_dec=0) == "199d 54' 36.0''", \
         "ERROR: 1st true_longitude_coarse() test, 'true_lon' doesn't match"
 
-    assert abs(round(r, 5) - 0.99766) < TOL, \
+    assert abs(r - 0.99766) < 5e-6, \
         "ERROR: 2nd true_longitude_coarse() test, 'r' value doesn't match"
 
 
 def test_sun_apparent_longitude_coarse():
     """Tests apparent_longitude_coarse() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13)
+    epoch = epoch_1992
     alon, r = Sun.apparent_longitude_coarse(epoch)
 
     assert alon.dms_str(n_dec=0) == "199d 54' 32.0''", \
@@ -52,7 +71,7 @@ def test_sun_apparent_rightascension_declination_coarse():
     """Tests apparent_rightascension_declination_coarse() method of Sun
     class"""
 
-    epoch = Epoch(1992, 10, 13)
+    epoch = epoch_1992
     ra, delta, r = Sun.apparent_rightascension_declination_coarse(epoch)
 
     assert ra.ra_str(n_dec=1) == "13h 13' 31.4''", \
@@ -65,23 +84,23 @@ def test_sun_apparent_rightascension_declination_coarse():
 def test_sun_geometric_geocentric_position():
     """Tests the geometric_geocentric_position() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     lon, lat, r = Sun.geometric_geocentric_position(epoch, tofk5=False)
 
-    assert abs(round(lon.to_positive(), 6) - 199.907297) < TOL, \
+    assert abs(lon.to_positive() - 199.907297) < 5e-7, \
         "ERROR: 1st geometric_geocentric_position() test, 'lon' doesn't match"
 
     assert lat.dms_str(n_dec=3) == "0.744''", \
         "ERROR: 2nd geometric_geocentric_position() test, 'lat' doesn't match"
 
-    assert abs(round(r, 8) - 0.99760852) < TOL, \
+    assert abs(r - 0.99760852) < 5e-9, \
         "ERROR: 3rd geometric_geocentric_position() test, 'r' doesn't match"
 
 
 def test_sun_apparent_geocentric_position():
     """Tests the apparent_geocentric_position() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     lon, lat, r = Sun.apparent_geocentric_position(epoch)
 
     assert lon.to_positive().dms_str(n_dec=3) == "199d 54' 21.548''", \
@@ -90,72 +109,72 @@ def test_sun_apparent_geocentric_position():
     assert lat.dms_str(n_dec=3) == "0.721''", \
         "ERROR: 2nd apparent_geocentric_position() test, 'lat' doesn't match"
 
-    assert abs(round(r, 8) - 0.99760852) < TOL, \
+    assert abs(r - 0.99760852) < 5e-9, \
         "ERROR: 3rd apparent_geocentric_position() test, 'r' doesn't match"
 
 
 def test_rectangular_coordinates_mean_equinox():
     """Tests rectangular_coordinates_mean_equinox() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     x, y, z = Sun.rectangular_coordinates_mean_equinox(epoch)
 
-    assert abs(round(x, 7) - (-0.9379963)) < TOL, \
+    assert abs(x - (-0.9379963)) < 5e-8, \
         "ERROR: 1st rectangular_coordinates_mean_equinox(), 'x' doesn't match"
 
-    assert abs(round(y, 6) - (-0.311654)) < TOL, \
+    assert abs(y - (-0.311654)) < 5e-7, \
         "ERROR: 2nd rectangular_coordinates_mean_equinox(), 'y' doesn't match"
 
-    assert abs(round(z, 7) - (-0.1351207)) < TOL, \
+    assert abs(z - (-0.1351207)) < 5e-8, \
         "ERROR: 3rd rectangular_coordinates_mean_equinox(), 'z' doesn't match"
 
 
 def test_rectangular_coordinates_j2000():
     """Tests rectangular_coordinates_j2000() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     x, y, z = Sun.rectangular_coordinates_j2000(epoch)
 
-    assert abs(round(x, 8) - (-0.93740485)) < TOL, \
+    assert abs(x - (-0.93740485)) < 5e-9, \
         "ERROR: 1st rectangular_coordinates_j2000() test, 'x' doesn't match"
 
-    assert abs(round(y, 8) - (-0.3131474)) < TOL, \
+    assert abs(y - (-0.3131474)) < 5e-9, \
         "ERROR: 2nd rectangular_coordinates_j2000() test, 'y' doesn't match"
 
-    assert abs(round(z, 8) - (-0.13577045)) < TOL, \
+    assert abs(z - (-0.13577045)) < 5e-9, \
         "ERROR: 3rd rectangular_coordinates_j2000() test, 'z' doesn't match"
 
 
 def test_rectangular_coordinates_b1950():
     """Tests rectangular_coordinates_b1950() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     x, y, z = Sun.rectangular_coordinates_b1950(epoch)
 
-    assert abs(round(x, 8) - (-0.94149557)) < TOL, \
+    assert abs(x - (-0.94149557)) < 5e-9, \
         "ERROR: 1st rectangular_coordinates_b1950() test, 'x' doesn't match"
 
-    assert abs(round(y, 8) - (-0.30259922)) < TOL, \
+    assert abs(y - (-0.30259922)) < 5e-9, \
         "ERROR: 2nd rectangular_coordinates_b1950() test, 'y' doesn't match"
 
-    assert abs(round(z, 8) - (-0.11578695)) < TOL, \
+    assert abs(z - (-0.11578695)) < 5e-9, \
         "ERROR: 3rd rectangular_coordinates_b1950() test, 'z' doesn't match"
 
 
 def test_rectangular_coordinates_equinox():
     """Tests rectangular_coordinates_equinox() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     e_equinox = Epoch(2467616.0)
     x, y, z = Sun.rectangular_coordinates_equinox(epoch, e_equinox)
 
-    assert abs(round(x, 8) - (-0.93368986)) < TOL, \
+    assert abs(x - (-0.93368986)) < 5e-9, \
         "ERROR: 1st rectangular_coordinates_equinox() test, 'x' doesn't match"
 
-    assert abs(round(y, 8) - (-0.32235085)) < TOL, \
+    assert abs(y - (-0.32235085)) < 5e-9, \
         "ERROR: 2nd rectangular_coordinates_equinox() test, 'y' doesn't match"
 
-    assert abs(round(z, 8) - (-0.13977098)) < TOL, \
+    assert abs(z - (-0.13977098)) < 5e-9, \
         "ERROR: 3rd rectangular_coordinates_equinox() test, 'z' doesn't match"
 
 
@@ -169,31 +188,37 @@ def test_sun_get_equinox_solstice():
     assert st == "1962/6/21 21:24:42.0", \
         "ERROR: 1st get_equinox_solstice() test, time stamp doesn't match"
 
+    # The second call is served from the internal cache
+    epoch2 = Sun.get_equinox_solstice(1962, target="summer")
+
+    assert epoch2 == epoch and epoch2 is not epoch, \
+        "ERROR: 2nd get_equinox_solstice() test, cached epoch doesn't match"
+
 
 def test_sun_equation_of_time():
     """Tests the equation_of_time() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13.0)
+    epoch = epoch_1992
     m, s = Sun.equation_of_time(epoch)
 
     assert abs(m) - 13 < TOL, \
         "ERROR: 1st equation_of_time() test, 'm' doesn't match"
 
-    assert abs(round(s, 1)) - 42.6 < TOL, \
+    assert abs(s - 42.6) < 0.05, \
         "ERROR: 2nd equation_of_time() test, 's' doesn't match"
 
 
 def test_sun_ephemeris_physical_observations():
     """Tests the ephemeris_physical_observations() method of Sun class"""
 
-    epoch = Epoch(1992, 10, 13)
+    epoch = epoch_1992
     p, b0, l0 = Sun.ephemeris_physical_observations(epoch)
 
-    assert abs(round(p, 2)) - 26.27 < TOL, \
+    assert abs(p - 26.27) < 0.005, \
         "ERROR: 1st ephemeris_physical_observations() test, 'p' doesn't match"
 
-    assert abs(round(b0, 2)) - 5.99 < TOL, \
+    assert abs(b0 - 5.99) < 0.005, \
         "ERROR: 2nd ephemeris_physical_observations() test, 'b0' doesn't match"
 
-    assert abs(round(l0, 2)) - 238.63 < TOL, \
+    assert abs(l0 - 238.63) < 0.005, \
         "ERROR: 3rd ephemeris_physical_observations() test, 'l0' doesn't match"
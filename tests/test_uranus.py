@@ -31,13 +31,13 @@ def test_uranus_geometric_heliocentric_position():
     epoch = Epoch(2018, 10, 27.0)
     lon, lat, r = Uranus.geometric_heliocentric_position(epoch)
 
-    assert abs(round(lon.to_positive(), 4) - 30.5888) < TOL, \
+    assert abs(lon.to_positive() - 30.5888) < 5e-5, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - (-0.5315)) < TOL, \
+    assert abs(lat - (-0.5315)) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 5) - 19.86964) < TOL, \
+    assert abs(r - 19.86964) < 5e-6, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -47,22 +47,22 @@ def test_uranus_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Uranus.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 235.517526) < TOL, \
+    assert abs(l - 235.517526) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 19.21844604) < TOL, \
+    assert abs(a - 19.21844604) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0463634) < TOL, \
+    assert abs(e - 0.0463634) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 0.77372) < TOL, \
+    assert abs(i - 0.77372) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 74.34776) < TOL, \
+    assert abs(ome - 74.34776) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - 99.630865) < TOL, \
+    assert abs(arg - 99.630865) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -72,22 +72,22 @@ def test_uranus_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Uranus.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 234.602641) < TOL, \
+    assert abs(l - 234.602641) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 19.21844604) < TOL, \
+    assert abs(a - 19.21844604) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0463634) < TOL, \
+    assert abs(e - 0.0463634) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 0.772094) < TOL, \
+    assert abs(i - 0.772094) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 74.05468) < TOL, \
+    assert abs(ome - 74.05468) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - 99.009058) < TOL, \
+    assert abs(arg - 99.009058) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -114,13 +114,13 @@ def test_uranus_conjunction():
     conjunction = Uranus.conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1994) < TOL, \
+    assert abs(y - 1994) < 0.5, \
         "ERROR: 1st conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 1) < TOL, \
+    assert abs(m - 1) < 0.5, \
         "ERROR: 2nd conjunction() test doesn't match"
 
-    assert abs(round(d, 4) - 12.7365) < TOL, \
+    assert abs(d - 12.7365) < 5e-5, \
         "ERROR: 3rd conjunction() test doesn't match"
 
 
@@ -131,13 +131,13 @@ def test_uranus_opposition():
     oppo = Uranus.opposition(epoch)
     y, m, d = oppo.get_date()
 
-    assert abs(round(y, 0) - 1780) < TOL, \
+    assert abs(y - 1780) < 0.5, \
         "ERROR: 1st opposition() test doesn't match"
 
-    assert abs(round(m, 0) - 12) < TOL, \
+    assert abs(m - 12) < 0.5, \
         "ERROR: 2nd opposition() test doesn't match"
 
-    assert abs(round(d, 4) - 17.5998) < TOL, \
+    assert abs(d - 17.5998) < 5e-5, \
         "ERROR: 3rd opposition() test doesn't match"
 
 
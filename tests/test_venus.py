@@ -32,13 +32,13 @@ def test_venus_geometric_heliocentric_position():
     epoch = Epoch(1992, 12, 20.0)
     lon, lat, r = Venus.geometric_heliocentric_position(epoch, tofk5=False)
 
-    assert abs(round(lon.to_positive(), 5) - 26.11412) < TOL, \
+    assert abs(lon.to_positive() - 26.11412) < 5e-6, \
         "ERROR: 1st geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(lat, 4) - (-2.6206)) < TOL, \
+    assert abs(lat - (-2.6206)) < 5e-5, \
         "ERROR: 2nd geometric_heliocentric_position() test doesn't match"
 
-    assert abs(round(r, 6) - 0.724602) < TOL, \
+    assert abs(r - 0.724602) < 5e-7, \
         "ERROR: 3rd geometric_heliocentric_position() test doesn't match"
 
 
@@ -48,22 +48,22 @@ def test_venus_orbital_elements_mean_equinox():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Venus.orbital_elements_mean_equinox(epoch)
 
-    assert abs(round(l, 6) - 338.646306) < TOL, \
+    assert abs(l - 338.646306) < 5e-7, \
         "ERROR: 1st orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(a, 8) - 0.72332982) < TOL, \
+    assert abs(a - 0.72332982) < 5e-9, \
         "ERROR: 2nd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0067407) < TOL, \
+    assert abs(e - 0.0067407) < 5e-8, \
         "ERROR: 3rd orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(i, 6) - 3.395319) < TOL, \
+    assert abs(i - 3.395319) < 5e-7, \
         "ERROR: 4th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(ome, 5) - 77.27012) < TOL, \
+    assert abs(ome - 77.27012) < 5e-6, \
         "ERROR: 5th orbital_elements_mean_equinox() test doesn't match"
 
-    assert abs(round(arg, 6) - 55.211257) < TOL, \
+    assert abs(arg - 55.211257) < 5e-7, \
         "ERROR: 6th orbital_elements_mean_equinox() test doesn't match"
 
 
@@ -73,22 +73,22 @@ def test_venus_orbital_elements_j2000():
     epoch = Epoch(2065, 6, 24.0)
     l, a, e, i, ome, arg = Venus.orbital_elements_j2000(epoch)
 
-    assert abs(round(l, 6) - 337.731227) < TOL, \
+    assert abs(l - 337.731227) < 5e-7, \
         "ERROR: 1st orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(a, 8) - 0.72332982) < TOL, \
+    assert abs(a - 0.72332982) < 5e-9, \
         "ERROR: 2nd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(e, 7) - 0.0067407) < TOL, \
+    assert abs(e - 0.0067407) < 5e-8, \
         "ERROR: 3rd orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(i, 6) - 3.394087) < TOL, \
+    assert abs(i - 3.394087) < 5e-7, \
         "ERROR: 4th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(ome, 5) - 76.49782) < TOL, \
+    assert abs(ome - 76.49782) < 5e-6, \
         "ERROR: 5th orbital_elements_j2000() test doesn't match"
 
-    assert abs(round(arg, 6) - 55.068476) < TOL, \
+    assert abs(arg - 55.068476) < 5e-7, \
         "ERROR: 6th orbital_elements_j2000() test doesn't match"
 
 
@@ -115,13 +115,13 @@ def test_venus_inferior_conjunction():
     conjunction = Venus.inferior_conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1882) < TOL, \
+    assert abs(y - 1882) < 0.5, \
         "ERROR: 1st inferior_conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 12) < TOL, \
+    assert abs(m - 12) < 0.5, \
         "ERROR: 2nd inferior_conjunction() test doesn't match"
 
-    assert abs(round(d, 1) - 6.7) < TOL, \
+    assert abs(d - 6.7) < 0.05, \
         "ERROR: 3rd inferior_conjunction() test doesn't match"
 
 
@@ -132,13 +132,13 @@ def test_venus_superior_conjunction():
     conjunction = Venus.superior_conjunction(epoch)
     y, m, d = conjunction.get_date()
 
-    assert abs(round(y, 0) - 1994) < TOL, \
+    assert abs(y - 1994) < 0.5, \
         "ERROR: 1st superior_conjunction() test doesn't match"
 
-    assert abs(round(m, 0) - 1) < TOL, \
+    assert abs(m - 1) < 0.5, \
         "ERROR: 2nd superior_conjunction() test doesn't match"
 
-    assert abs(round(d, 2) - 17.05) < TOL, \
+    assert abs(d - 17.05) < 0.005, \
         "ERROR: 3rd superior_conjunction() test doesn't match"
 
 
@@ -149,16 +149,16 @@ def test_venus_western_elongation():
     time, elongation = Venus.western_elongation(epoch)
     y, m, d = time.get_date()
 
-    assert abs(round(y, 0) - 2019) < TOL, \
+    assert abs(y - 2019) < 0.5, \
         "ERROR: 1st western_elongation() test doesn't match"
 
-    assert abs(round(m, 0) - 1) < TOL, \
+    assert abs(m - 1) < 0.5, \
         "ERROR: 2nd western_elongation() test doesn't match"
 
-    assert abs(round(d, 4) - 6.1895) < TOL, \
+    assert abs(d - 6.1895) < 5e-5, \
         "ERROR: 3rd western_elongation() test doesn't match"
 
-    assert abs(round(elongation, 4) - 46.9571) < TOL, \
+    assert abs(elongation - 46.9571) < 5e-5, \
         "ERROR: 4th western_elongation() test doesn't match"
 
 
@@ -169,16 +169,16 @@ def test_venus_eastern_elongation():
     time, elongation = Venus.eastern_elongation(epoch)
     y, m, d = time.get_date()
 
-    assert abs(round(y, 0) - 2020) < TOL, \
+    assert abs(y - 2020) < 0.5, \
         "ERROR: 1st eastern_elongation() test doesn't match"
 
-    assert abs(round(m, 0) - 3) < TOL, \
+    assert abs(m - 3) < 0.5, \
         "ERROR: 2nd eastern_elongation() test doesn't match"
 
-    assert abs(round(d, 4) - 24.9179) < TOL, \
+    assert abs(d - 24.9179) < 5e-5, \
         "ERROR: 3rd eastern_elongation() test doesn't match"
 
-    assert abs(round(elongation, 4) - 46.078) < TOL, \
+    assert abs(elongation - 46.078) < 5e-5, \
         "ERROR: 3rd eastern_elongation() test doesn't match"
 
 
@@ -189,13 +189,13 @@ def test_venus_station_longitude_1():
     sta1 = Venus.station_longitude_1(epoch)
     y, m, d = sta1.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_1() test doesn't match"
 
-    assert abs(round(m, 0) - 10) < TOL, \
+    assert abs(m - 10) < 0.5, \
         "ERROR: 2nd station_longitude_1() test doesn't match"
 
-    assert abs(round(d, 4) - 5.7908) < TOL, \
+    assert abs(d - 5.7908) < 5e-5, \
         "ERROR: 3rd station_longitude_1() test doesn't match"
 
 
@@ -206,13 +206,13 @@ def test_venus_station_longitude_2():
     sta2 = Venus.station_longitude_2(epoch)
     y, m, d = sta2.get_date()
 
-    assert abs(round(y, 0) - 2018) < TOL, \
+    assert abs(y - 2018) < 0.5, \
         "ERROR: 1st station_longitude_2() test doesn't match"
 
-    assert abs(round(m, 0) - 11) < TOL, \
+    assert abs(m - 11) < 0.5, \
         "ERROR: 2nd station_longitude_2() test doesn't match"
 
-    assert abs(round(d, 4) - 16.439) < TOL, \
+    assert abs(d - 16.439) < 5e-5, \
         "ERROR: 3rd station_longitude_2() test doesn't match"
 
 
@@ -280,7 +280,7 @@ def test_venus_illuminated_fraction():
     epoch = Epoch(1992, 12, 20)
     k = Venus.illuminated_fraction(epoch)
 
-    assert abs(round(k, 2) - 0.64) < TOL, \
+    assert abs(k - 0.64) < 0.005, \
         "ERROR: 1st illuminated_fraction() test doesn't match"
 
 
@@ -292,5 +292,5 @@ def test_venus_magnitude():
     phase_angle = Angle(72.96)
     m = Venus.magnitude(sun_dist, earth_dist, phase_angle)
 
-    assert abs(round(m, 1) - (-3.8)) < TOL, \
+    assert abs(m - (-3.8)) < 0.05, \
         "ERROR: 1st magnitude() test doesn't match"